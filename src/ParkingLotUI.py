@@ -7,7 +7,7 @@ This module provides a graphical user interface for the parking lot management s
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
-from typing import Dict, Optional, List, Any, Tuple, TypedDict, Protocol, Union, TYPE_CHECKING
+from typing import Dict, Hashable, Optional, List, Any, Sequence, Set, Tuple, TypedDict, Protocol, Union, TYPE_CHECKING
 from Vehicle import Vehicle, VehicleType
 from ParkingManager import ParkingLotManagerImpl
 from models import (
@@ -15,21 +15,17 @@ from models import (
     VehicleType, SlotType, ParkingSlotData, SearchResult
 )
 from interfaces import ParkingLotObserver, ValidationError, OperationError
+from ui_tasks import RefreshDebouncer, UITaskExecutor
+from virtual_tree import VirtualTreeView
 
 if TYPE_CHECKING:
     from tkinter import _tkinter  # type: ignore
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('parking_system.log'),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Lines kept in the message area; older ones are dropped
+MAX_MESSAGE_LINES = 1000
+
 class ParkingLotUIError(Exception):
     """Base exception for ParkingLotUI errors"""
     pass
@@ -91,16 +87,31 @@ class UIStateManager:
         self.details_filter_value = tk.StringVar(value="All Slots")
 
 class TreeViewManager:
-    """Manages tree view operations"""
-    def __init__(self, tree: ttk.Treeview):
+    """Manages tree view operations
+
+    Vehicles are shown through a VirtualTreeView, so only the rows that fit
+    in the tree are ever inserted into it.
+    """
+    def __init__(self, tree: ttk.Treeview, scrollbar: Optional[ttk.Scrollbar] = None):
         self.tree = tree
+        self.view = VirtualTreeView(tree, self.vehicle_values, scrollbar)
 
     def clear(self):
         """Clear all items from the tree"""
-        self.tree.delete(*self.tree.get_children())
+        self.view.clear()
+
+    def show_vehicles(self, rows: Sequence[Tuple[Hashable, Tuple[Union[Vehicle, VehicleData], int]]]) -> None:
+        """Show vehicles in the tree
+
+        Args:
+            rows: (key, (vehicle, slot)) pairs in display order, keyed by where the vehicle is parked
+        """
+        self.view.set_rows(rows)
 
-    def add_vehicle(self, vehicle: Union[Vehicle, VehicleData], slot: int):
-        """Add a vehicle to the tree"""
+    @staticmethod
+    def vehicle_values(row: Tuple[Union[Vehicle, VehicleData], int]) -> Tuple[str, ...]:
+        """Get the tree values of a (vehicle, slot) row"""
+        vehicle, slot = row
         registration_number: str = vehicle.registration_number
         manufacturer: str = vehicle.manufacturer
         model: str = vehicle.model
@@ -131,8 +142,7 @@ class TreeViewManager:
             vehicle_type,
             charge_status
         )
-
-        self.tree.insert("", "end", values=values)
+        return values
 
 class MessageManager:
     """Manages message display"""
@@ -140,8 +150,11 @@ class MessageManager:
         self.message_area = message_area
 
     def show_message(self, message: str):
-        """Show a message in the message area"""
+        """Show a message in the message area, dropping the oldest beyond MAX_MESSAGE_LINES"""
         self.message_area.insert("end", f"{message}\n")
+        excess = int(self.message_area.index("end-1c").split(".")[0]) - 1 - MAX_MESSAGE_LINES
+        if excess > 0:
+            self.message_area.delete("1.0", f"{excess + 1}.0")
         self.message_area.see("end")
 
     def show_error(self, message: str):
@@ -207,7 +220,16 @@ class ParkingLotUI(ParkingLotObserver):
         self.message_manager = MessageManager(self.message_area)
         
         # Initialize tree manager after creating results_tree
-        self.tree_manager = TreeViewManager(self.results_tree)
+        self.tree_manager = TreeViewManager(self.results_tree, self.results_scrollbar)
+        
+        # Run slow manager calls on a worker thread so the window stays responsive
+        self.tasks = UITaskExecutor(self.main_window.after, on_busy=self._set_busy)
+        
+        # Merge change notifications and refresh the widgets of changed lots once per frame
+        self.refresher = RefreshDebouncer(self.main_window.after, self._refresh_lots)
+        self._shown_lot_names: List[str] = []
+        # Levels of each lot as last offered in the level combos
+        self._shown_levels: Dict[str, List[int]] = {}
         
         # Register as observer after all managers are initialized
         self.parking_manager.register_observer(self)
@@ -253,6 +275,9 @@ class ParkingLotUI(ParkingLotObserver):
         
         # Create message area
         self.message_area = tk.Text(self.main_window, height=10, width=50)
+        
+        # Create busy indicator, shown while UI tasks run
+        self.busy_bar = ttk.Progressbar(self.main_window, mode="indeterminate")
     
     def _create_vehicle_widgets(self):
         """Create widgets for vehicle operations"""
@@ -402,7 +427,9 @@ class ParkingLotUI(ParkingLotObserver):
         for col in ("Slot", "Registration", "Manufacturer", "Model", "Color", "Slot Type", "Vehicle Type", "Charge Status"):
             self.results_tree.column(col, width=100, anchor="center")
         
-        # Pack the tree
+        # Pack the scrollbar and the tree
+        self.results_scrollbar = ttk.Scrollbar(self.search_tab, orient="vertical")
+        self.results_scrollbar.pack(side="right", fill="y", pady=5)
         self.results_tree.pack(expand=True, fill="both", padx=5, pady=5)
     
     def _create_admin_widgets(self):
@@ -488,8 +515,11 @@ class ParkingLotUI(ParkingLotObserver):
             self.details_tree.heading(col, text=col)
             self.details_tree.column(col, width=width, anchor="center")
         
-        # Layout details tree
+        # Layout details tree; only the visible slots are rendered, keyed by (level, slot)
+        self.details_scrollbar = ttk.Scrollbar(self.details_frame, orient="vertical")
+        self.details_scrollbar.pack(side="right", fill="y", pady=5)
         self.details_tree.pack(expand=True, fill="both", padx=5, pady=5)
+        self.details_view = VirtualTreeView(self.details_tree, self._slot_detail_values, self.details_scrollbar)
         
         # Update lot names in combo box
         self._update_details_lot_names()
@@ -527,7 +557,7 @@ class ParkingLotUI(ParkingLotObserver):
         except OperationError as e:
             self.message_manager.show_error(str(e))
         except Exception as e:
-            logger.error(f"Error in _handle_park: {e}")
+            logger.error("Error in _handle_park: %s", e)
             self.message_manager.show_error("An unexpected error occurred")
 
     def _get_vehicle_data(self) -> VehicleData:
@@ -572,7 +602,7 @@ class ParkingLotUI(ParkingLotObserver):
         except OperationError as e:
             self.message_manager.show_error(str(e))
         except Exception as e:
-            logger.error(f"Error in _handle_remove: {e}")
+            logger.error("Error in _handle_remove: %s", e)
             self.message_manager.show_error("An unexpected error occurred")
 
     def _get_remove_input(self) -> tuple[str, int, int]:
@@ -594,19 +624,16 @@ class ParkingLotUI(ParkingLotObserver):
     def _verify_slot_occupied(self, lot_name: str, level: int, slot: int) -> bool:
         """Verify that the slot exists and is occupied"""
         try:
-            statuses = self.parking_manager.get_lot_status(lot_name)
-            for level_data in statuses:
-                if level_data.level == level:  # Use level directly
-                    for slot_data in level_data.slots:
-                        if slot_data.slot_number == slot:
-                            if not slot_data.is_occupied:
-                                self.message_manager.show_error("Selected slot is empty")
-                                return False
-                            return True
-            self.message_manager.show_error("Selected slot does not exist")
-            return False
+            slot_data = self.parking_manager.get_slot(lot_name, level, slot)
+            if slot_data is None:
+                self.message_manager.show_error("Selected slot does not exist")
+                return False
+            if not slot_data.is_occupied:
+                self.message_manager.show_error("Selected slot is empty")
+                return False
+            return True
         except Exception as e:
-            logger.error(f"Error verifying slot: {e}")
+            logger.error("Error verifying slot: %s", e)
             raise OperationError("Error verifying slot status")
 
     def _handle_search(self):
@@ -620,27 +647,29 @@ class ParkingLotUI(ParkingLotObserver):
                 model=self.state_manager.search_vehicle_model_value.get().strip()
             )
             
-            # Clear previous results
-            self.results_tree.delete(*self.results_tree.get_children())
-            
-            # Search in all lots
-            found_any = False
-            for lot_name in self.parking_manager.get_lot_names():
-                results = self.parking_manager.search_vehicles(lot_name, criteria)
-                for status in results:
-                    if status.vehicle:
-                        self._add_vehicle_to_tree(status.vehicle, status.slot)
-                        found_any = True
-            
-            if not found_any:
-                self.message_manager.show_message("No vehicles found matching the search criteria")
+            # Search in all lots at once on a worker; a newer search replaces this one
+            self.tasks.submit("search", self.parking_manager.search_vehicles, None, criteria,
+                              on_success=self._show_search_results, on_error=self._show_search_error)
             
         except ValidationError as e:
             self.message_manager.show_error(str(e))
-        except OperationError as e:
-            self.message_manager.show_error(str(e))
         except Exception as e:
-            logger.error(f"Error performing search: {e}")
+            logger.error("Error performing search: %s", e)
+            self.message_manager.show_error("Error performing search")
+    
+    def _show_search_results(self, results: List[SearchResult]) -> None:
+        """Show the vehicles found by a search"""
+        results = [result for result in results if result.vehicle]
+        self._update_results_tree(results)
+        if not results:
+            self.message_manager.show_message("No vehicles found matching the search criteria")
+    
+    def _show_search_error(self, error: Exception) -> None:
+        """Report a search that failed on the worker"""
+        if isinstance(error, (ValidationError, OperationError)):
+            self.message_manager.show_error(str(error))
+        else:
+            logger.error("Error performing search: %s", error)
             self.message_manager.show_error("Error performing search")
     
     def _handle_create_lot(self):
@@ -695,51 +724,54 @@ class ParkingLotUI(ParkingLotObserver):
     
     def _handle_show_lots(self) -> None:
         """Handle showing all parking lots"""
-        try:
-            lots = self.parking_manager.get_lot_names()
-            
-            # Clear previous results
-            self.admin_tree.delete(*self.admin_tree.get_children())
-            
-            # Add each lot to the tree
-            for lot_name in lots:
-                levels = self.parking_manager.get_levels_for_lot(lot_name)
-                
-                # Get lot status
-                statuses = self.parking_manager.get_lot_status(lot_name)
-                
-                # Calculate aggregations
-                total_regular_capacity = 0
-                total_ev_capacity = 0
-                total_available_regular = 0
-                total_available_ev = 0
-                
-                for level_data in statuses:
-                    for slot in level_data.slots:
-                        if slot.slot_type == SlotType.REGULAR:
-                            total_regular_capacity += 1
-                            if not slot.is_occupied:
-                                total_available_regular += 1
-                        elif slot.slot_type == SlotType.ELECTRIC:
-                            total_ev_capacity += 1
-                            if not slot.is_occupied:
-                                total_available_ev += 1
-                
-                self.admin_tree.insert("", "end", values=(
-                    lot_name,
-                    len(levels),
-                    total_regular_capacity,
-                    total_ev_capacity,
-                    total_available_regular,
-                    total_available_ev
-                ))
-            
-            # Switch to admin tab to show results
-            self.notebook.select(self.admin_tab)  # type: ignore
-            
-        except Exception as e:
-            logger.error(f"Error showing lots: {e}")
-            self.message_manager.show_error("Error showing lots")
+        # Aggregating occupancy runs on a worker; a newer request replaces this one
+        self.tasks.submit("show_lots", self._collect_lot_rows,
+                          on_success=self._show_lot_rows, on_error=self._show_lots_error)
+    
+    def _collect_lot_rows(self) -> List[Tuple[str, int, int, int, int, int]]:
+        """Get one admin tree row per lot; runs on a worker thread"""
+        lots = self.parking_manager.get_lot_names()
+        
+        # Aggregate the manager's occupancy counters per lot
+        levels: Dict[str, Set[int]] = {lot_name: set() for lot_name in lots}
+        capacity: Dict[str, Dict[SlotType, int]] = {
+            lot_name: {SlotType.REGULAR: 0, SlotType.ELECTRIC: 0} for lot_name in lots
+        }
+        available: Dict[str, Dict[SlotType, int]] = {
+            lot_name: {SlotType.REGULAR: 0, SlotType.ELECTRIC: 0} for lot_name in lots
+        }
+        for occupancy in self.parking_manager.get_occupancy_summary():
+            if occupancy.lot_name not in levels:
+                continue
+            levels[occupancy.lot_name].add(occupancy.level)
+            capacity[occupancy.lot_name][occupancy.slot_type] += occupancy.capacity
+            available[occupancy.lot_name][occupancy.slot_type] += occupancy.available
+        
+        return [(
+            lot_name,
+            len(levels[lot_name]),
+            capacity[lot_name][SlotType.REGULAR],
+            capacity[lot_name][SlotType.ELECTRIC],
+            available[lot_name][SlotType.REGULAR],
+            available[lot_name][SlotType.ELECTRIC]
+        ) for lot_name in lots]
+    
+    def _show_lot_rows(self, rows: List[Tuple[str, int, int, int, int, int]]) -> None:
+        """Show the lots in the admin tree"""
+        # Clear previous results
+        self.admin_tree.delete(*self.admin_tree.get_children())
+        
+        # Add each lot to the tree
+        for values in rows:
+            self.admin_tree.insert("", "end", values=values)
+        
+        # Switch to admin tab to show results
+        self.notebook.select(self.admin_tab)  # type: ignore
+    
+    def _show_lots_error(self, error: Exception) -> None:
+        """Report showing lots that failed on the worker"""
+        logger.error("Error showing lots: %s", error)
+        self.message_manager.show_error("Error showing lots")
     
     def _get_selected_slot(self) -> Optional[int]:
         """Get the selected slot number from the tree view"""
@@ -749,10 +781,6 @@ class ParkingLotUI(ParkingLotObserver):
         item = self.results_tree.item(selection[0])
         return int(item['values'][0])
     
-    def _add_vehicle_to_tree(self, vehicle: Union[Vehicle, VehicleData], slot: int) -> None:
-        """Add a vehicle to the results tree"""
-        self.tree_manager.add_vehicle(vehicle, slot)
-    
     def _clear_park_fields(self):
         """Clear vehicle input fields"""
         self.state_manager.registration_number_value.set("")
@@ -776,20 +804,80 @@ class ParkingLotUI(ParkingLotObserver):
         Args:
             message: The name of the lot that was updated
         """
-        # Update UI state
-        self._update_park_lot_names()
-        self._update_remove_lot_names()
-        self._update_details_lot_names()
+        # Changes made by UI tasks are reported on the worker; Tk may only be used from its own thread
+        if not self.tasks.on_ui_thread():
+            self.tasks.post(self.update, message)
+            return
+        
+        # Refreshed together with any other changes within the frame interval
+        self.refresher.mark(message)
+    
+    def _refresh_lots(self, changed: Set[str]) -> None:
+        """Refresh the widgets showing any of the changed lots
+        
+        Args:
+            changed: The names of the lots that changed since the last refresh
+        """
+        lot_names = self.parking_manager.get_lot_names()
+        # Levels may also have been added by another thread or the async front-end
+        added_levels: Dict[str, List[int]] = {}
+        for lot_name in changed.intersection(lot_names):
+            levels = self.parking_manager.get_levels_for_lot(lot_name)
+            if levels != self._shown_levels.get(lot_name):
+                self._shown_levels[lot_name] = added_levels[lot_name] = levels
+        
+        if lot_names != self._shown_lot_names:
+            # A lot was created or removed, so every lot list needs rebuilding
+            self._shown_lot_names = lot_names
+            self._update_park_lot_names()
+            self._update_remove_lot_names()
+            self._update_details_lot_names()
+        else:
+            for lot_name, levels in added_levels.items():
+                self._update_level_choices(lot_name, levels)
+            remove_lot = self.state_manager.remove_lot_value.get()
+            remove_level = self.state_manager.remove_level_value.get()
+            if remove_lot in changed and remove_level:
+                self._update_remove_slots(remove_lot, int(remove_level))
+        
+        # Only redraw the details if they are showing a changed lot
+        if len(self.details_view) and self.state_manager.details_lot_name_value.get() in changed:
+            self._handle_show_details()
         
         # Show status message
-        status = self.parking_manager.get_lot_status(message)
-        if status:
-            self.message_manager.show_message(f"Updated status for lot: {message}")
+        self.message_manager.show_message(f"Updated status for lot: {', '.join(sorted(changed))}")
+        status_lot = self.state_manager.lot_name_value.get() or self.state_manager.park_lot_value.get()
+        if status_lot in changed:
             self._show_status()
     
+    def _update_level_choices(self, lot_name: str, levels: List[int]) -> None:
+        """Offer a lot's current levels in every level combo showing that lot, keeping the selections"""
+        level_values = [str(level) for level in levels]
+        for lot_value, level_combo in (
+            (self.state_manager.park_lot_value, self.park_level_combo),
+            (self.state_manager.remove_lot_value, self.remove_level_combo),
+            (self.state_manager.details_lot_name_value, self.details_level_combo)
+        ):
+            if lot_value.get() == lot_name:
+                level_combo['values'] = level_values
+    
     def run(self):
         """Run the UI"""
-        self.main_window.mainloop()
+        try:
+            self.main_window.mainloop()
+        finally:
+            self.tasks.shutdown()
+    
+    def _set_busy(self, busy: bool) -> None:
+        """Show or hide the busy indicator while UI tasks run"""
+        if busy:
+            self.busy_bar.pack(side="bottom", fill="x", padx=5, pady=2)
+            self.busy_bar.start(50)
+            self.main_window.configure(cursor="watch")
+        else:
+            self.busy_bar.stop()
+            self.busy_bar.pack_forget()
+            self.main_window.configure(cursor="")
 
     def _layout_widgets(self):
         """Layout UI widgets"""
@@ -829,39 +917,35 @@ class ParkingLotUI(ParkingLotObserver):
         try:
             selected_lot = self.state_manager.lot_name_value.get()
             selected_level = int(self.state_manager.parking_level_value.get())
-            logger.debug(f"_show_full_status called with lot={selected_lot}, level={selected_level}")
+            logger.debug("_show_full_status called with lot=%s, level=%s", selected_lot, selected_level)
             
             if not selected_lot:
                 self.message_manager.show_error("Please select a parking lot")
                 return
             
-            # Clear previous results
-            self.results_tree.delete(*self.results_tree.get_children())
-            
             # Get all vehicles in the lot
             vehicles: Dict[int, Vehicle] = self.parking_manager.get_vehicles_in_lot(selected_lot, selected_level)
-            logger.debug(f"_show_full_status received {len(vehicles)} vehicles")
-            for slot_number, vehicle in vehicles.items():
-                self._add_vehicle_to_tree(vehicle, slot_number)
+            logger.debug("_show_full_status received %s vehicles", len(vehicles))
+            self.tree_manager.show_vehicles([((selected_level, slot_number), (vehicle, slot_number))
+                                             for slot_number, vehicle in sorted(vehicles.items())])
             
-            if not self.results_tree.get_children():
+            if not vehicles:
                 self.message_manager.show_message("No vehicles found in the selected lot and level.")
         
         except Exception as e:
-            logger.error(f"Error showing full status: {str(e)}")
+            logger.error("Error showing full status: %s", e)
             self.message_manager.show_error(f"Error showing full status: {str(e)}")
 
     def _show_status(self) -> None:
-        """Show parking lot status"""
+        """Show how many slots of the selected lot are occupied, from the manager's counters"""
         lot_name = self.state_manager.lot_name_value.get() or self.state_manager.park_lot_value.get()
         if not lot_name:
             self.message_manager.show_error("Please select a lot to show status.")
             return
-        status = self.parking_manager.get_lot_status(lot_name)
-        if isinstance(status, str):
-            self.message_manager.show_message(status)
-        else:
-            self.message_manager.show_message(str(status))
+        occupancy = [data for data in self.parking_manager.get_occupancy_summary() if data.lot_name == lot_name]
+        capacity = sum(data.capacity for data in occupancy)
+        occupied = sum(data.occupied for data in occupancy)
+        self.message_manager.show_message(f"Lot {lot_name}: {occupied} of {capacity} slots occupied")
 
     def create_lot(self):
         """Create a new parking lot"""
@@ -890,15 +974,10 @@ class ParkingLotUI(ParkingLotObserver):
     def _update_slot_numbers(self, lot_name: str, level: int):
         """Update the slot numbers in the remove combo box"""
         try:
-            # Get all slots for the selected lot and level
-            statuses = self.parking_manager.get_lot_status(lot_name)
-            occupied_slots: List[str] = []
-            
-            for level_data in statuses:
-                if level_data.level == level:
-                    for slot in level_data.slots:
-                        if slot.is_occupied:
-                            occupied_slots.append(str(slot.slot_number))
+            # Get the occupied slots of the selected lot and level
+            occupied_slots: List[str] = [
+                str(slot) for slot in self.parking_manager.get_occupied_slots(lot_name, level)
+            ]
             
             # Update the combo box
             self.remove_slot_combo['values'] = occupied_slots
@@ -908,7 +987,7 @@ class ParkingLotUI(ParkingLotObserver):
                 self.remove_slot_combo.set('')
             
         except Exception as e:
-            logger.error(f"Error updating slot numbers: {e}")
+            logger.error("Error updating slot numbers: %s", e)
             self.message_manager.show_error("Error updating slot numbers")
 
     def _update_details_levels(self):
@@ -923,9 +1002,6 @@ class ParkingLotUI(ParkingLotObserver):
     def _handle_show_details(self):
         """Handle show details button click"""
         try:
-            # Clear previous results
-            self.details_tree.delete(*self.details_tree.get_children())
-            
             # Get selected lot and level
             lot_name = self.state_manager.details_lot_name_value.get()
             filter_type = self.state_manager.details_filter_value.get()
@@ -934,71 +1010,69 @@ class ParkingLotUI(ParkingLotObserver):
                 self.message_manager.show_error("Please select a lot")
                 return
             
-            # Get all levels for the lot
-            levels = self.parking_manager.get_levels_for_lot(lot_name)
+            # Get the status of every level once
+            statuses: List[ParkingLevelData] = self.parking_manager.get_lot_status(lot_name)
+            rows: List[Tuple[Tuple[int, int], Tuple[int, ParkingSlotData]]] = []
             
             # Process based on filter type
             if filter_type == "All Levels":
                 # Show all levels
-                for level in levels:
-                    self._add_level_details(lot_name, level)
+                for level_data in statuses:
+                    self._add_level_details(level_data, rows)
             else:
                 # Show specific level
                 level = int(self.state_manager.details_parking_level_value.get())
-                self._add_level_details(lot_name, level, filter_type)
+                for level_data in statuses:
+                    if level_data.level == level:
+                        self._add_level_details(level_data, rows, filter_type)
             
-            if not self.details_tree.get_children():
+            # Rows already in the tree are reused and only redrawn if they changed
+            self.details_view.set_rows(rows)
+            
+            if not rows:
                 self.message_manager.show_message("No slots found matching the criteria.")
                 
         except Exception as e:
-            logger.error(f"Error showing details: {e}")
+            logger.error("Error showing details: %s", e)
             self.message_manager.show_error("Error showing lot details")
 
-    def _add_level_details(self, lot_name: str, level: int, filter_type: str = "All Slots") -> None:
-        """Add details for a specific level to the tree"""
-        try:
-            # Get status for this level
-            statuses: List[ParkingLevelData] = self.parking_manager.get_lot_status(lot_name)
-            
-            for level_data in statuses:
-                if level_data.level != level:
-                    continue
-                    
-                for slot in level_data.slots:
-                    # Apply filter
-                    if filter_type == "Available Slots" and slot.is_occupied:
-                        continue
-                    if filter_type == "Occupied Slots" and not slot.is_occupied:
-                        continue
-                    
-                    # Get slot details
-                    slot_status: str = "Occupied" if slot.is_occupied else "Available"
-                    registration: str = slot.vehicle.registration_number if slot.vehicle else ""
-                    manufacturer: str = slot.vehicle.manufacturer if slot.vehicle else ""
-                    model: str = slot.vehicle.model if slot.vehicle else ""
-                    color: str = slot.vehicle.color if slot.vehicle else ""
-                    slot_type: str = "EV" if slot.slot_type == SlotType.ELECTRIC else "Standard"
-                    vehicle_type: str = self._get_vehicle_type_display(slot.vehicle) if slot.vehicle else "Unknown"
-                    charge_status: str = self._get_battery_charge_display(slot.vehicle) if slot.vehicle else "N/A"
-                    
-                    values: Tuple[str, ...] = (
-                        str(level),
-                        str(slot.slot_number),
-                        slot_status,
-                        registration,
-                        manufacturer,
-                        model,
-                        color,
-                        slot_type,
-                        vehicle_type,
-                        charge_status
-                    )
-                    
-                    self.details_tree.insert("", "end", values=values)
-                
-        except Exception as e:
-            logger.error(f"Error adding level details: {e}")
-            raise
+    def _add_level_details(self, level_data: ParkingLevelData,
+                           rows: List[Tuple[Tuple[int, int], Tuple[int, ParkingSlotData]]],
+                           filter_type: str = "All Slots") -> None:
+        """Add the slots of a level that pass the filter to the details rows"""
+        level = level_data.level
+        for slot in level_data.slots:
+            # Apply filter
+            if filter_type == "Available Slots" and slot.is_occupied:
+                continue
+            if filter_type == "Occupied Slots" and not slot.is_occupied:
+                continue
+            rows.append(((level, slot.slot_number), (level, slot)))
+
+    def _slot_detail_values(self, row: Tuple[int, ParkingSlotData]) -> Tuple[str, ...]:
+        """Get the details tree values of a (level, slot) row"""
+        level, slot = row
+        slot_status: str = "Occupied" if slot.is_occupied else "Available"
+        registration: str = slot.vehicle.registration_number if slot.vehicle else ""
+        manufacturer: str = slot.vehicle.manufacturer if slot.vehicle else ""
+        model: str = slot.vehicle.model if slot.vehicle else ""
+        color: str = slot.vehicle.color if slot.vehicle else ""
+        slot_type: str = "EV" if slot.slot_type == SlotType.ELECTRIC else "Standard"
+        vehicle_type: str = self._get_vehicle_type_display(slot.vehicle) if slot.vehicle else "Unknown"
+        charge_status: str = self._get_battery_charge_display(slot.vehicle) if slot.vehicle else "N/A"
+        
+        return (
+            str(level),
+            str(slot.slot_number),
+            slot_status,
+            registration,
+            manufacturer,
+            model,
+            color,
+            slot_type,
+            vehicle_type,
+            charge_status
+        )
 
     def _update_park_lot_names(self):
         """Update the lot names in the park combo box"""
@@ -1015,6 +1089,12 @@ class ParkingLotUI(ParkingLotObserver):
 
     def _handle_load_sample_data(self):
         """Handle loading sample data button click"""
+        # Creating the lots and parking the vehicles runs on a worker
+        self.tasks.submit("load_sample_data", self._load_sample_data,
+                          on_success=self._on_sample_data_loaded, on_error=self._on_sample_data_error)
+
+    def _load_sample_data(self) -> None:
+        """Create the sample lots and park the sample vehicles; runs on a worker thread"""
         try:
             # Create Downtown Parking Lot with 2 levels
             downtown_lot = ParkingLotData(
@@ -1202,53 +1282,59 @@ class ParkingLotUI(ParkingLotObserver):
             for vehicle in downtown_vehicles[:4]:  # First 4 vehicles in Level 1
                 slot = self.parking_manager.park_vehicle("Downtown", 1, vehicle)
                 if slot is None:
-                    logger.error(f"Failed to park vehicle {vehicle.registration_number}")
+                    logger.error("Failed to park vehicle %s", vehicle.registration_number)
             
             for vehicle in downtown_vehicles[4:]:  # Last 2 vehicles in Level 2
                 slot = self.parking_manager.park_vehicle("Downtown", 2, vehicle)
                 if slot is None:
-                    logger.error(f"Failed to park vehicle {vehicle.registration_number}")
+                    logger.error("Failed to park vehicle %s", vehicle.registration_number)
 
             # Park vehicles in Airport lot
             for vehicle in airport_vehicles[:4]:  # First 4 vehicles in Level 1
                 slot = self.parking_manager.park_vehicle("Airport", 1, vehicle)
                 if slot is None:
-                    logger.error(f"Failed to park vehicle {vehicle.registration_number}")
+                    logger.error("Failed to park vehicle %s", vehicle.registration_number)
             
             for vehicle in airport_vehicles[4:]:  # Last 2 vehicles in Level 2
                 slot = self.parking_manager.park_vehicle("Airport", 2, vehicle)
                 if slot is None:
-                    logger.error(f"Failed to park vehicle {vehicle.registration_number}")
-
-            # Update UI
-            self._update_park_lot_names()
-            self._update_park_levels()
-            self._update_details_lot_names()
-            self._update_details_levels()
-            self._update_remove_lot_names()
-            
-            # Show success message
-            self.message_manager.show_message("Sample data loaded successfully")
-            
-            # Refresh the lots display
-            self._handle_show_lots()
+                    logger.error("Failed to park vehicle %s", vehicle.registration_number)
             
         except Exception as e:
-            logger.error(f"Error loading sample data: {e}")
-            self.message_manager.show_error(f"Error loading sample data: {str(e)}")
+            logger.error("Error loading sample data: %s", e)
+            raise
+
+    def _on_sample_data_loaded(self, _: None) -> None:
+        """Refresh the UI once the sample data is loaded"""
+        # Update UI
+        self._update_park_lot_names()
+        self._update_park_levels()
+        self._update_details_lot_names()
+        self._update_details_levels()
+        self._update_remove_lot_names()
+        
+        # Show success message
+        self.message_manager.show_message("Sample data loaded successfully")
+        
+        # Refresh the lots display
+        self._handle_show_lots()
+
+    def _on_sample_data_error(self, error: Exception) -> None:
+        """Report loading sample data that failed on the worker"""
+        self.message_manager.show_error(f"Error loading sample data: {str(error)}")
 
     def _update_remove_lot_names(self):
         """Update the lot names in the remove combo box"""
         try:
             logger.debug("[DEBUG] Starting _update_remove_lot_names")
             lot_names = self.parking_manager.get_lot_names()
-            logger.debug(f"[DEBUG] Retrieved lot names: {lot_names}")
+            logger.debug("[DEBUG] Retrieved lot names: %s", lot_names)
             
             if lot_names:
-                logger.debug(f"[DEBUG] Setting lot names in combo box: {lot_names}")
+                logger.debug("[DEBUG] Setting lot names in combo box: %s", lot_names)
                 self.remove_lot_combo['values'] = lot_names
                 self.state_manager.remove_lot_value.set(lot_names[0])
-                logger.debug(f"[DEBUG] Selected first lot: {lot_names[0]}")
+                logger.debug("[DEBUG] Selected first lot: %s", lot_names[0])
                 self._update_remove_levels(lot_names[0])
             else:
                 logger.debug("[DEBUG] No lot names available")
@@ -1259,22 +1345,22 @@ class ParkingLotUI(ParkingLotObserver):
                 self.remove_slot_combo['values'] = []
                 self.state_manager.remove_slot_value.set('')
         except Exception as e:
-            logger.error(f"[DEBUG] Error in _update_remove_lot_names: {e}")
+            logger.error("[DEBUG] Error in _update_remove_lot_names: %s", e)
             self.message_manager.show_error("Error updating lot names")
 
     def _update_remove_levels(self, lot_name: str):
         """Update the levels in the remove combo box based on selected lot"""
         try:
-            logger.debug(f"[DEBUG] Starting _update_remove_levels for lot: {lot_name}")
+            logger.debug("[DEBUG] Starting _update_remove_levels for lot: %s", lot_name)
             levels = self.parking_manager.get_levels_for_lot(lot_name)
-            logger.debug(f"[DEBUG] Retrieved levels: {levels}")
+            logger.debug("[DEBUG] Retrieved levels: %s", levels)
             
             if levels:
                 level_values = [str(level) for level in levels]
-                logger.debug(f"[DEBUG] Setting level values in combo box: {level_values}")
+                logger.debug("[DEBUG] Setting level values in combo box: %s", level_values)
                 self.remove_level_combo['values'] = level_values
                 self.state_manager.remove_level_value.set(str(levels[0]))
-                logger.debug(f"[DEBUG] Selected first level: {levels[0]}")
+                logger.debug("[DEBUG] Selected first level: %s", levels[0])
                 self._update_remove_slots(lot_name, levels[0])
             else:
                 logger.debug("[DEBUG] No levels available")
@@ -1283,25 +1369,19 @@ class ParkingLotUI(ParkingLotObserver):
                 self.remove_slot_combo['values'] = []
                 self.state_manager.remove_slot_value.set('')
         except Exception as e:
-            logger.error(f"[DEBUG] Error in _update_remove_levels: {e}")
+            logger.error("[DEBUG] Error in _update_remove_levels: %s", e)
             self.message_manager.show_error("Error updating levels")
 
     def _update_remove_slots(self, lot_name: str, level: int) -> None:
         """Update the slot numbers in the remove combo box"""
         try:
-            logger.debug(f"Updating remove slots for lot: {lot_name}, level: {level}")
-            # Get all slots for the selected lot and level
-            statuses = self.parking_manager.get_lot_status(lot_name)
-            
-            occupied_slots: List[str] = []
-            for level_data in statuses:
-                if level_data.level == level:
-                    for slot in level_data.slots:
-                        if slot.is_occupied:
-                            occupied_slots.append(str(slot.slot_number))
-                            logger.debug(f"Found occupied slot: {slot.slot_number}")
+            logger.debug("Updating remove slots for lot: %s, level: %s", lot_name, level)
+            # Get the occupied slots of the selected lot and level
+            occupied_slots: List[str] = [
+                str(slot) for slot in self.parking_manager.get_occupied_slots(lot_name, level)
+            ]
             
-            logger.debug(f"Found {len(occupied_slots)} occupied slots")
+            logger.debug("Found %s occupied slots", len(occupied_slots))
             
             # Update the combo box
             if occupied_slots:
@@ -1314,34 +1394,31 @@ class ParkingLotUI(ParkingLotObserver):
                 self.vehicle_info_label.config(text="No vehicles in selected level")
             
         except Exception as e:
-            logger.error(f"Error updating slot numbers: {e}")
+            logger.error("Error updating slot numbers: %s", e)
             self.message_manager.show_error("Error updating slot numbers")
 
     def _update_vehicle_info(self, lot_name: str, level: int, slot: int) -> None:
         """Update the vehicle information display"""
         try:
-            statuses: List[ParkingLevelData] = self.parking_manager.get_lot_status(lot_name)
-            for level_data in statuses:
-                if level_data.level == level:
-                    for slot_data in level_data.slots:
-                        if slot_data.slot_number == slot and slot_data.vehicle:
-                            vehicle = slot_data.vehicle
-                            vehicle_type = self._get_vehicle_type_display(vehicle)
-                            info_text: str = (
-                                f"Vehicle Information:\n"
-                                f"Registration: {vehicle.registration_number}\n"
-                                f"Manufacturer: {vehicle.manufacturer}\n"
-                                f"Model: {vehicle.model}\n"
-                                f"Color: {vehicle.color}\n"
-                                f"Type: {vehicle_type}"
-                            )
-                            if vehicle.is_electric:
-                                info_text += f"\nBattery Charge: {self._get_battery_charge_display(vehicle)}"
-                            self.vehicle_info_label.config(text=info_text)
-                            return
+            slot_data = self.parking_manager.get_slot(lot_name, level, slot)
+            if slot_data is not None and slot_data.vehicle:
+                vehicle = slot_data.vehicle
+                vehicle_type = self._get_vehicle_type_display(vehicle)
+                info_text: str = (
+                    f"Vehicle Information:\n"
+                    f"Registration: {vehicle.registration_number}\n"
+                    f"Manufacturer: {vehicle.manufacturer}\n"
+                    f"Model: {vehicle.model}\n"
+                    f"Color: {vehicle.color}\n"
+                    f"Type: {vehicle_type}"
+                )
+                if vehicle.is_electric:
+                    info_text += f"\nBattery Charge: {self._get_battery_charge_display(vehicle)}"
+                self.vehicle_info_label.config(text=info_text)
+                return
             self.vehicle_info_label.config(text="No vehicle found in selected slot")
         except Exception as e:
-            logger.error(f"Error updating vehicle info: {e}")
+            logger.error("Error updating vehicle info: %s", e)
             self.vehicle_info_label.config(text="Error loading vehicle information")
 
     def _on_remove_lot_selected(self, event: Any) -> None:
@@ -1351,7 +1428,7 @@ class ParkingLotUI(ParkingLotObserver):
             if lot_name:
                 self._update_remove_levels(lot_name)
         except Exception as e:
-            logger.error(f"Error in _on_remove_lot_selected: {e}")
+            logger.error("Error in _on_remove_lot_selected: %s", e)
             self.message_manager.show_error("Error updating levels")
 
     def _on_remove_level_selected(self, event: Any) -> None:
@@ -1362,7 +1439,7 @@ class ParkingLotUI(ParkingLotObserver):
             if lot_name and level_str:
                 self._update_remove_slots(lot_name, int(level_str))
         except Exception as e:
-            logger.error(f"Error in _on_remove_level_selected: {e}")
+            logger.error("Error in _on_remove_level_selected: %s", e)
             self.message_manager.show_error("Error updating slots")
 
     def _on_remove_slot_selected(self, event: Any) -> None:
@@ -1374,7 +1451,7 @@ class ParkingLotUI(ParkingLotObserver):
             if lot_name and level_str and slot_str:
                 self._update_vehicle_info(lot_name, int(level_str), int(slot_str))
         except Exception as e:
-            logger.error(f"Error in _on_remove_slot_selected: {e}")
+            logger.error("Error in _on_remove_slot_selected: %s", e)
             self.message_manager.show_error("Error updating vehicle info")
 
     def _is_motorcycle(self, vehicle: VehicleData) -> bool:
@@ -1433,21 +1510,5 @@ class ParkingLotUI(ParkingLotObserver):
 
     def _update_results_tree(self, results: List[SearchResult]) -> None:
         """Update search results tree"""
-        self.results_tree.delete(*self.results_tree.get_children())
-        for result in results:
-            vehicle_type = self._get_vehicle_type_display(result.vehicle)
-            self.results_tree.insert(
-                "",
-                "end",
-                values=(
-                    result.slot,
-                    result.vehicle.registration_number,
-                    result.vehicle.manufacturer,
-                    result.vehicle.model,
-                    result.vehicle.color,
-                    "Electric" if result.vehicle.is_electric else "Regular",
-                    vehicle_type,
-                    f"{result.vehicle.current_battery_charge:.1f}%" if result.vehicle.is_electric else "N/A"
-                )
-            )
-
+        self.tree_manager.show_vehicles([((result.lot_name, result.level, result.slot), (result.vehicle, result.slot))
+                                         for result in results])
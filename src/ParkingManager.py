@@ -4,43 +4,82 @@ Parking Manager Module
 This module implements the parking lot management system.
 """
 
+import heapq
 import logging
-from typing import Dict, List, Optional, Set
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from models import (
     VehicleData,
+    DispatchStats,
+    LevelsAdded,
+    LotCreated,
+    MetricsSnapshot,
+    OccupancyData,
+    ParkingEvent,
     ParkingLotData,
     ParkingLevelData,
     ParkingSlotData,
     SearchCriteria,
     SearchResult,
-    SlotType
+    SlotType,
+    VehicleParked,
+    VehicleRemoved
 )
-from Vehicle import Vehicle, VehicleType, create_vehicle
-from interfaces import ParkingLotInterface, ParkingLotManager, ParkingLotObserver, ValidationError, OperationError
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('parking_system.log'),
-        logging.StreamHandler()
-    ]
+from Vehicle import Vehicle, VehicleType, VehicleView, default_battery_charge
+from battery import BatteryChargeProvider
+from dispatch import ObserverDispatcher, SynchronousDispatcher
+from interfaces import (
+    ParkingEventObserver,
+    ParkingJournal,
+    ParkingLotInterface,
+    ParkingLotManager,
+    ParkingLotObserver,
+    ParkingLevelStore,
+    ValidationError,
+    OperationError
 )
+from level_storage import ColumnarLevelStore, SlotListLevelStore
+from metrics import MetricsRecorder, bucket_bounds, instrument
+
 logger = logging.getLogger(__name__)
 
+# Location of a parked vehicle: (lot name, level, slot number)
+SlotKey = Tuple[str, int, int]
+
+# Vehicle attributes kept in the manager's inverted indexes, in the order
+# SearchCriteria declares them
+INDEXED_ATTRIBUTES = ("color", "manufacturer", "model", "is_electric", "is_motorcycle", "vehicle_type")
+
+# Manager methods whose calls are counted and timed when a metrics recorder is given
+INSTRUMENTED_OPERATIONS = (
+    "create_lot", "park_vehicle", "remove_vehicle", "park_many", "remove_many", "search_vehicles", "get_lot_status"
+)
+
 class ParkingLot(ParkingLotInterface):
     """Class representing a parking lot"""
     
-    def __init__(self, name: str):
+    def __init__(self, name: str, columnar: bool = False):
         """Initialize the parking lot
         
         Args:
             name: The name of the parking lot
+            columnar: Store levels in compact array columns instead of one
+                ParkingSlotData object per slot
         """
         self.name = name
-        self.levels: Dict[int, List[ParkingSlotData]] = {}
-        logger.info(f"Created parking lot: {name}")
+        self.columnar = columnar
+        self.levels: Dict[int, ParkingLevelStore] = {}
+        # Min-heaps of free slot numbers per level and slot type, so the
+        # lowest free slot can be claimed without scanning the level.
+        # The length of each heap doubles as the running free-slot counter.
+        self._free_slots: Dict[int, Dict[SlotType, List[int]]] = {}
+        # Slot count per level and slot type
+        self._capacity: Dict[int, Dict[SlotType, int]] = {}
+        # Guards the levels, free-slot heaps and counters. Reentrant so a
+        # caller holding it can still use the lot's own methods.
+        self.lock = threading.RLock()
+        logger.info("Created parking lot: %s", name)
     
     def add_level(self, level: int, regular_slots: int, electric_slots: int) -> None:
         """Add a level to the parking lot
@@ -50,26 +89,16 @@ class ParkingLot(ParkingLotInterface):
             regular_slots: Number of regular slots
             electric_slots: Number of electric slots
         """
-        slots: List[ParkingSlotData] = []
-        
-        # Add regular slots
-        for i in range(regular_slots):
-            slots.append(ParkingSlotData(
-                slot_number=i + 1,
-                is_occupied=False,
-                slot_type=SlotType.REGULAR
-            ))
-        
-        # Add electric slots
-        for i in range(electric_slots):
-            slots.append(ParkingSlotData(
-                slot_number=regular_slots + i + 1,
-                is_occupied=False,
-                slot_type=SlotType.ELECTRIC
-            ))
-        
-        self.levels[level] = slots
-        logger.info(f"Added level {level} to {self.name} with {regular_slots} regular and {electric_slots} electric slots")
+        with self.lock:
+            store_class = ColumnarLevelStore if self.columnar else SlotListLevelStore
+            self.levels[level] = store_class(regular_slots, electric_slots)
+            # Slot numbers are generated in ascending order, so each list is already a valid heap
+            self._free_slots[level] = {
+                SlotType.REGULAR: list(range(1, regular_slots + 1)),
+                SlotType.ELECTRIC: list(range(regular_slots + 1, regular_slots + electric_slots + 1))
+            }
+            self._capacity[level] = {SlotType.REGULAR: regular_slots, SlotType.ELECTRIC: electric_slots}
+            logger.info("Added level %s to %s with %s regular and %s electric slots", level, self.name, regular_slots, electric_slots)
     
     def park_vehicle(self, level: int, vehicle: Vehicle) -> Optional[int]:
         """Park a vehicle in the lot
@@ -82,42 +111,88 @@ class ParkingLot(ParkingLotInterface):
             The slot number where the vehicle was parked, or None if parking failed
         """
         if level not in self.levels:
-            logger.error(f"Level {level} not found in {self.name}")
+            logger.error("Level %s not found in %s", level, self.name)
             return None
         
-        # Find appropriate slot
-        for slot in self.levels[level]:
-            if not slot.is_occupied:
-                if vehicle.is_electric and slot.slot_type == SlotType.ELECTRIC:
-                    slot.is_occupied = True
-                    slot.vehicle = VehicleData(
-                        registration_number=vehicle.registration_number,
-                        manufacturer=vehicle.manufacturer,
-                        model=vehicle.model,
-                        color=vehicle.color,
-                        is_electric=True,
-                        is_motorcycle=vehicle.vehicle_type == VehicleType.MOTORCYCLE,
-                        vehicle_type=vehicle.vehicle_type,
-                        current_battery_charge=vehicle.current_battery_charge
-                    )
-                    logger.info(f"Parked electric vehicle {vehicle.registration_number} in slot {slot.slot_number} with charge {vehicle.current_battery_charge:.1f}%")
-                    return slot.slot_number
-                elif not vehicle.is_electric and slot.slot_type == SlotType.REGULAR:
-                    slot.is_occupied = True
-                    slot.vehicle = VehicleData(
-                        registration_number=vehicle.registration_number,
-                        manufacturer=vehicle.manufacturer,
-                        model=vehicle.model,
-                        color=vehicle.color,
-                        is_electric=False,
-                        is_motorcycle=vehicle.vehicle_type == VehicleType.MOTORCYCLE,
-                        vehicle_type=vehicle.vehicle_type
-                    )
-                    logger.info(f"Parked vehicle {vehicle.registration_number} in slot {slot.slot_number}")
-                    return slot.slot_number
-        
-        logger.error(f"No suitable slot found for vehicle {vehicle.registration_number}")
-        return None
+        return self.park_vehicle_data(level, VehicleData(
+            registration_number=vehicle.registration_number,
+            manufacturer=vehicle.manufacturer,
+            model=vehicle.model,
+            color=vehicle.color,
+            is_electric=vehicle.is_electric,
+            is_motorcycle=vehicle.vehicle_type == VehicleType.MOTORCYCLE,
+            vehicle_type=vehicle.vehicle_type,
+            current_battery_charge=vehicle.current_battery_charge if vehicle.is_electric else None
+        ))
+    
+    def park_vehicle_data(self, level: int, record: VehicleData) -> Optional[int]:
+        """Park a vehicle given its stored record
+        
+        The record itself is stored in the slot, without copying, and becomes
+        the canonical record for the parked vehicle.
+        
+        Args:
+            level: The level to park in
+            record: The vehicle record to store
+            
+        Returns:
+            The slot number where the vehicle was parked, or None if parking failed
+        """
+        with self.lock:
+            if level not in self.levels:
+                logger.error("Level %s not found in %s", level, self.name)
+                return None
+            
+            # Claim the lowest free slot of the matching type
+            slot_type = SlotType.ELECTRIC if record.is_electric else SlotType.REGULAR
+            free_slots = self._free_slots[level][slot_type]
+            if not free_slots:
+                logger.error("No suitable slot found for vehicle %s", record.registration_number)
+                return None
+            
+            slot = heapq.heappop(free_slots)
+            self.levels[level].occupy(slot, record)
+            if record.is_electric:
+                logger.info("Parked electric vehicle %s in slot %s with charge %s%%", record.registration_number, slot, record.current_battery_charge)
+            else:
+                logger.info("Parked vehicle %s in slot %s", record.registration_number, slot)
+            return slot
+    
+    def park_many_data(self, level: int, records: List[VehicleData]) -> List[Optional[int]]:
+        """Park several vehicles on one level given their stored records
+        
+        The level's free-slot heaps are looked up once and drained in order,
+        so each vehicle gets the lowest slot still free when its turn comes.
+        
+        Args:
+            level: The level to park in
+            records: The vehicle records to store, in parking order
+            
+        Returns:
+            The slot number for each record, or None where no suitable slot was free
+        """
+        with self.lock:
+            if level not in self.levels:
+                logger.error("Level %s not found in %s", level, self.name)
+                return [None] * len(records)
+            
+            store = self.levels[level]
+            regular_free = self._free_slots[level][SlotType.REGULAR]
+            electric_free = self._free_slots[level][SlotType.ELECTRIC]
+            slots: List[Optional[int]] = []
+            for record in records:
+                free_slots = electric_free if record.is_electric else regular_free
+                if not free_slots:
+                    logger.error("No suitable slot found for vehicle %s", record.registration_number)
+                    slots.append(None)
+                    continue
+                slot = heapq.heappop(free_slots)
+                store.occupy(slot, record)
+                slots.append(slot)
+            
+            parked = sum(1 for slot in slots if slot is not None)
+            logger.info("Parked %s of %s vehicles on level %s of %s", parked, len(records), level, self.name)
+            return slots
     
     def remove_vehicle(self, level: int, slot: int) -> Optional[Vehicle]:
         """Remove a vehicle from the lot
@@ -129,40 +204,29 @@ class ParkingLot(ParkingLotInterface):
         Returns:
             The removed vehicle, or None if no vehicle was found
         """
-        if level not in self.levels:
-            logger.error(f"Level {level} not found in {self.name}")
-            return None
-        
-        for parking_slot in self.levels[level]:
-            if parking_slot.slot_number == slot:
-                if not parking_slot.is_occupied:
-                    logger.error(f"Slot {slot} is empty")
-                    return None
-                
-                vehicle_data = parking_slot.vehicle
-                if vehicle_data is None:
-                    logger.error(f"No vehicle data in slot {slot}")
-                    return None
-                
-                # Create vehicle object
-                vehicle = create_vehicle(
-                    registration_number=vehicle_data.registration_number,
-                    manufacturer=vehicle_data.manufacturer,
-                    model=vehicle_data.model,
-                    color=vehicle_data.color,
-                    vehicle_type=vehicle_data.vehicle_type,
-                    is_electric=vehicle_data.is_electric
-                )
-                
-                # Clear slot
-                parking_slot.is_occupied = False
-                parking_slot.vehicle = None
-                
-                logger.info(f"Removed vehicle {vehicle.registration_number} from slot {slot}")
-                return vehicle
-        
-        logger.error(f"Slot {slot} not found in level {level}")
-        return None
+        with self.lock:
+            if level not in self.levels:
+                logger.error("Level %s not found in %s", level, self.name)
+                return None
+            
+            if not self._has_slot(level, slot):
+                logger.error("Slot %s not found in level %s", slot, level)
+                return None
+            
+            store = self.levels[level]
+            vehicle_data = store.get_vehicle(slot)
+            if vehicle_data is None:
+                logger.error("Slot %s is empty", slot)
+                return None
+            
+            vehicle = VehicleView(vehicle_data)
+            
+            # Clear slot and return it to the free pool
+            store.release(slot)
+            heapq.heappush(self._free_slots[level][store.slot_type(slot)], slot)
+            
+            logger.info("Removed vehicle %s from slot %s", vehicle.registration_number, slot)
+            return vehicle
     
     def get_status(self) -> List[ParkingLevelData]:
         """Get the status of all levels in the lot
@@ -170,10 +234,11 @@ class ParkingLot(ParkingLotInterface):
         Returns:
             List of level data
         """
-        return [
-            ParkingLevelData(level=level, slots=slots)
-            for level, slots in sorted(self.levels.items())
-        ]
+        with self.lock:
+            return [
+                ParkingLevelData(level=level, slots=store.get_slots())
+                for level, store in sorted(self.levels.items())
+            ]
     
     def get_vehicle(self, level: int, slot: int) -> Optional[Vehicle]:
         """Get a vehicle from the lot
@@ -185,27 +250,20 @@ class ParkingLot(ParkingLotInterface):
         Returns:
             The vehicle in the slot, or None if no vehicle is present
         """
-        if level not in self.levels:
-            logger.error(f"Level {level} not found in {self.name}")
-            return None
-        
-        for parking_slot in self.levels[level]:
-            if parking_slot.slot_number == slot:
-                if not parking_slot.is_occupied or parking_slot.vehicle is None:
-                    return None
-                
-                vehicle_data = parking_slot.vehicle
-                return create_vehicle(
-                    registration_number=vehicle_data.registration_number,
-                    manufacturer=vehicle_data.manufacturer,
-                    model=vehicle_data.model,
-                    color=vehicle_data.color,
-                    vehicle_type=vehicle_data.vehicle_type,
-                    is_electric=vehicle_data.is_electric
-                )
-        
-        logger.error(f"Slot {slot} not found in level {level}")
-        return None
+        with self.lock:
+            if level not in self.levels:
+                logger.error("Level %s not found in %s", level, self.name)
+                return None
+            
+            if not self._has_slot(level, slot):
+                logger.error("Slot %s not found in level %s", slot, level)
+                return None
+            
+            vehicle_data = self.levels[level].get_vehicle(slot)
+            if vehicle_data is None:
+                return None
+            
+            return VehicleView(vehicle_data)
 
     def get_vehicles_in_lot(self, level: int) -> Dict[int, Vehicle]:
         """Get all vehicles in a specific level
@@ -216,33 +274,221 @@ class ParkingLot(ParkingLotInterface):
         Returns:
             Dictionary mapping slot numbers to vehicles
         """
-        vehicles: Dict[int, Vehicle] = {}
-        
-        if level not in self.levels:
-            logger.error(f"Level {level} not found in {self.name}")
+        with self.lock:
+            vehicles: Dict[int, Vehicle] = {}
+            
+            if level not in self.levels:
+                logger.error("Level %s not found in %s", level, self.name)
+                return vehicles
+            
+            for slot_number, vehicle_data in self.levels[level].iter_occupied():
+                vehicles[slot_number] = VehicleView(vehicle_data)
+            
             return vehicles
+
+    def get_vehicle_data(self, level: int, slot: int) -> Optional[VehicleData]:
+        """Get the stored record of the vehicle in a slot
+        
+        Args:
+            level: The level the slot is on
+            slot: The slot number
+            
+        Returns:
+            The stored vehicle data, or None if the level or slot does not exist or is empty
+        """
+        with self.lock:
+            if level not in self.levels or not self._has_slot(level, slot):
+                return None
+            return self.levels[level].get_vehicle(slot)
+
+    def get_slot(self, level: int, slot: int) -> Optional[ParkingSlotData]:
+        """Get a snapshot of a single slot
+        
+        Args:
+            level: The level the slot is on
+            slot: The slot number
+            
+        Returns:
+            The slot's data, or None if the level or slot does not exist
+        """
+        with self.lock:
+            if level not in self.levels or not self._has_slot(level, slot):
+                return None
+            store = self.levels[level]
+            vehicle = store.get_vehicle(slot)
+            return ParkingSlotData(slot_number=slot, is_occupied=vehicle is not None, vehicle=vehicle,
+                                   slot_type=store.slot_type(slot))
+
+    def get_occupied_slots(self, level: int) -> List[int]:
+        """Get the numbers of the occupied slots on a level
+        
+        Args:
+            level: The level number
+            
+        Returns:
+            The occupied slot numbers in ascending order, or an empty list if the level does not exist
+        """
+        with self.lock:
+            if level not in self.levels:
+                return []
+            return self.levels[level].occupied_slots()
+
+    def get_occupancy(self) -> List[OccupancyData]:
+        """Get capacity and availability counters for every level and slot type
+        
+        The counters are maintained by park and remove, so no slots are visited.
         
-        for slot in self.levels[level]:
-            if slot.is_occupied and slot.vehicle:
-                vehicle = create_vehicle(
-                    registration_number=slot.vehicle.registration_number,
-                    manufacturer=slot.vehicle.manufacturer,
-                    model=slot.vehicle.model,
-                    color=slot.vehicle.color,
-                    vehicle_type=slot.vehicle.vehicle_type,
-                    is_electric=slot.vehicle.is_electric
+        Returns:
+            List of occupancy data ordered by level and slot type
+        """
+        with self.lock:
+            return [
+                OccupancyData(
+                    lot_name=self.name,
+                    level=level,
+                    slot_type=slot_type,
+                    capacity=capacity,
+                    available=len(self._free_slots[level][slot_type])
                 )
-                vehicles[slot.slot_number] = vehicle
+                for level, capacities in sorted(self._capacity.items())
+                for slot_type, capacity in capacities.items()
+            ]
+
+    def count_occupied(self, level: int) -> int:
+        """Count the occupied slots on a level
+        
+        Args:
+            level: The level number
+            
+        Returns:
+            The number of occupied slots, or 0 if the level does not exist
+        """
+        with self.lock:
+            if level not in self.levels:
+                return 0
+            return self.levels[level].count_occupied()
+
+    def get_level_layout(self) -> List[Tuple[int, int, int]]:
+        """Get the shape of every level
+        
+        Returns:
+            (level, regular slots, electric slots) for each level, ordered by level
+        """
+        with self.lock:
+            return [
+                (level, capacities[SlotType.REGULAR], capacities[SlotType.ELECTRIC])
+                for level, capacities in sorted(self._capacity.items())
+            ]
+    
+    def iter_parked(self) -> Iterator[Tuple[int, int, VehicleData]]:
+        """Iterate over the stored records of all parked vehicles
         
-        return vehicles
+        The caller must hold the lot's lock for the whole iteration.
+        
+        Returns:
+            An iterator of (level, slot, VehicleData) ordered by level and slot
+        """
+        for level, store in sorted(self.levels.items()):
+            for slot, record in store.iter_occupied():
+                yield level, slot, record
+    
+    def place_vehicle_data(self, level: int, slot: int, record: VehicleData) -> bool:
+        """Store a record in a specific slot, for restoring saved state
+        
+        The free-slot heaps are not updated; call rebuild_free_slots once
+        all vehicles have been placed, before parking anything else.
+        
+        Args:
+            level: The level the slot is on
+            slot: The slot number
+            record: The vehicle record to store
+            
+        Returns:
+            True if the record was stored, False if the slot does not exist or is occupied
+        """
+        with self.lock:
+            if level not in self.levels or not self._has_slot(level, slot):
+                return False
+            store = self.levels[level]
+            if store.get_vehicle(slot) is not None:
+                return False
+            store.occupy(slot, record)
+            return True
+    
+    def rebuild_free_slots(self) -> None:
+        """Rebuild the free-slot heaps from the slots' occupancy"""
+        with self.lock:
+            for level, store in self.levels.items():
+                free_slots: Dict[SlotType, List[int]] = {SlotType.REGULAR: [], SlotType.ELECTRIC: []}
+                for slot in range(1, len(store) + 1):
+                    if store.get_vehicle(slot) is None:
+                        free_slots[store.slot_type(slot)].append(slot)
+                # Ascending lists are already valid heaps
+                self._free_slots[level] = free_slots
+    
+    def _has_slot(self, level: int, slot: int) -> bool:
+        """Check whether a slot number exists on a level
+        
+        Slots are numbered densely from 1 in add_level, so slot N lives at index N - 1.
+        
+        Args:
+            level: The level the slot is on (must exist)
+            slot: The slot number
+            
+        Returns:
+            True if the slot number is in range for the level
+        """
+        return 1 <= slot <= len(self.levels[level])
 
 class ParkingLotManagerImpl(ParkingLotManager):
     """Implementation of the parking lot manager"""
     
-    def __init__(self):
-        """Initialize the parking lot manager"""
+    def __init__(self, columnar_levels: bool = False, charge_provider: Optional[BatteryChargeProvider] = None,
+                 dispatcher: Optional[ObserverDispatcher] = None, journal: Optional[ParkingJournal] = None,
+                 metrics: Optional[MetricsRecorder] = None):
+        """Initialize the parking lot manager
+        
+        Args:
+            columnar_levels: Create lots with compact array-backed level storage,
+                which uses far less memory for large lots
+            charge_provider: Source of the initial battery charge of electric vehicles
+                parked without one; defaults to the process-wide provider
+            dispatcher: Delivers change notifications to observers; defaults to
+                a SynchronousDispatcher, which notifies inside each call
+            journal: Durable log that every lot creation, park and remove is
+                written to, or None to keep state in memory only
+            metrics: Records call counts, errors and latencies of the main
+                operations, or None to record nothing
+        """
+        self.columnar_levels = columnar_levels
+        self.charge_provider = charge_provider
+        self.dispatcher = dispatcher if dispatcher is not None else SynchronousDispatcher()
+        self.journal = journal
+        self.metrics = metrics
         self.lots: Dict[str, ParkingLot] = {}
         self.observers: Set[ParkingLotObserver] = set()
+        self.event_observers: Set[ParkingEventObserver] = set()
+        # Registration number -> (lot name, level, slot) for every parked vehicle
+        self._registry: Dict[str, SlotKey] = {}
+        # Inverted indexes: attribute name -> attribute value -> locations of matching vehicles.
+        # The lot name is indexed too so single-lot searches are just one more posting set.
+        self._attribute_index: Dict[str, Dict[Any, Set[SlotKey]]] = {
+            attribute: {} for attribute in ("lot_name",) + INDEXED_ATTRIBUTES
+        }
+        # The same posting tables in _index_values order, for zipping
+        self._index_tables = tuple(
+            self._attribute_index[attribute] for attribute in ("lot_name",) + INDEXED_ATTRIBUTES
+        )
+        # Registration numbers of vehicles that are being parked but have no slot yet
+        self._reserved: Set[str] = set()
+        # Locking: each lot's own lock guards its slots, so different lots can be
+        # used in parallel. _lots_lock guards only the lot table. _index_lock guards
+        # the registry, reservations and attribute indexes and is held briefly; it
+        # may be taken while holding a lot lock, never the other way round.
+        self._lots_lock = threading.Lock()
+        self._index_lock = threading.Lock()
+        if metrics is not None:
+            instrument(self, metrics, INSTRUMENTED_OPERATIONS)
         logger.info("Initialized ParkingLotManagerImpl")
     
     def create_lot(self, data: ParkingLotData) -> bool:
@@ -262,37 +508,58 @@ class ParkingLotManagerImpl(ParkingLotManager):
             raise ValidationError("Lot name is required")
         
         try:
-            if data.name in self.lots:
-                # Add new level to existing lot
-                lot = self.lots[data.name]
-                for level_data in data.levels:
-                    # Check if level already exists
-                    if level_data.level in lot.levels:
-                        raise OperationError(f"Level {level_data.level} already exists in lot {data.name}")
-                    
-                    # Add the new level
-                    lot.add_level(
-                        level=level_data.level,
-                        regular_slots=len([s for s in level_data.slots if s.slot_type == SlotType.REGULAR]),
-                        electric_slots=len([s for s in level_data.slots if s.slot_type == SlotType.ELECTRIC])
-                    )
-                logger.info(f"Added new level to existing lot: {data.name}")
-            else:
-                # Create new lot
-                lot = ParkingLot(data.name)
-                for level_data in data.levels:
-                    lot.add_level(
-                        level=level_data.level,
-                        regular_slots=len([s for s in level_data.slots if s.slot_type == SlotType.REGULAR]),
-                        electric_slots=len([s for s in level_data.slots if s.slot_type == SlotType.ELECTRIC])
-                    )
-                self.lots[data.name] = lot
-                logger.info(f"Created new parking lot: {data.name}")
+            # (level, regular slots, electric slots) for each level
+            layout = [
+                (
+                    level_data.level,
+                    len([s for s in level_data.slots if s.slot_type == SlotType.REGULAR]),
+                    len([s for s in level_data.slots if s.slot_type == SlotType.ELECTRIC])
+                )
+                for level_data in data.levels
+            ]
+            levels = [level_data.level for level_data in data.levels]
+            if len(set(levels)) != len(levels):
+                raise ValidationError(f"Levels are repeated in lot {data.name}")
+            lot = self.lots.get(data.name)
+            created = False
+            if lot is None:
+                # Build the new lot unlocked, then take the global lock just to publish it
+                new_lot = ParkingLot(data.name, columnar=self.columnar_levels)
+                for level, regular_slots, electric_slots in layout:
+                    new_lot.add_level(level=level, regular_slots=regular_slots, electric_slots=electric_slots)
+                # Parks find lots without the global lock, so hold the new lot's lock until
+                # its creation is journaled and published. It is not in the lot table yet,
+                # so _all_lots_locked cannot be waiting for it.
+                with new_lot.lock:
+                    with self._lots_lock:
+                        lot = self.lots.get(data.name)
+                        if lot is None:
+                            if self.journal is not None:
+                                self.journal.log_create_lot(data.name, layout)
+                            self.lots[data.name] = lot = new_lot
+                            created = True
+                    if created:
+                        logger.info("Created new parking lot: %s", data.name)
+                        self._publish([LotCreated(data.name, levels)])
+            
+            if not created:
+                # Add new levels to existing lot
+                with lot.lock:
+                    # Check every level before changing anything, so a failed update changes nothing
+                    for level in levels:
+                        if level in lot.levels:
+                            raise OperationError(f"Level {level} already exists in lot {data.name}")
+                    for level, regular_slots, electric_slots in layout:
+                        lot.add_level(level=level, regular_slots=regular_slots, electric_slots=electric_slots)
+                    if self.journal is not None:
+                        self.journal.log_create_lot(data.name, layout)
+                    logger.info("Added new level to existing lot: %s", data.name)
+                    self._publish([LevelsAdded(data.name, levels)])
             
             self._notify_observers(data.name)
             return True
         except Exception as e:
-            logger.error(f"Error creating/updating lot {data.name}: {e}")
+            logger.error("Error creating/updating lot %s: %s", data.name, e)
             raise OperationError(f"Failed to create/update lot: {str(e)}")
     
     def park_vehicle(self, lot_name: str, level: int, data: VehicleData) -> Optional[int]:
@@ -307,29 +574,52 @@ class ParkingLotManagerImpl(ParkingLotManager):
             The slot number where the vehicle was parked, or None if parking failed
             
         Raises:
-            ValidationError: If the input data is invalid
+            ValidationError: If the input data is invalid or the vehicle is already parked
             OperationError: If the lot doesn't exist or parking fails
         """
-        if lot_name not in self.lots:
+        lot = self.lots.get(lot_name)
+        if lot is None:
             raise OperationError(f"Lot {lot_name} not found")
         
+        registration_number = data.registration_number
+        with self._index_lock:
+            location = self._registry.get(registration_number)
+            if location is not None:
+                parked_lot, parked_level, parked_slot = location
+                raise ValidationError(
+                    f"Vehicle {registration_number} is already parked in lot {parked_lot}, "
+                    f"level {parked_level}, slot {parked_slot}"
+                )
+            if registration_number in self._reserved:
+                raise ValidationError(f"Vehicle {registration_number} is already being parked")
+            # Reserve the plate so a concurrent park of the same vehicle is rejected
+            self._reserved.add(registration_number)
+        
+        slot = None
         try:
-            vehicle = create_vehicle(
-                registration_number=data.registration_number,
-                manufacturer=data.manufacturer,
-                model=data.model,
-                color=data.color,
-                vehicle_type=data.vehicle_type,
-                is_electric=data.is_electric
-            )
-            
-            slot = self.lots[lot_name].park_vehicle(level, vehicle)
-            if slot is not None:
-                self._notify_observers(lot_name)
-            return slot
+            record = self._build_record(data)
+            with lot.lock:
+                slot = lot.park_vehicle_data(level, record)
+                with self._index_lock:
+                    self._reserved.discard(registration_number)
+                    if slot is not None:
+                        key = (lot_name, level, slot)
+                        self._registry[registration_number] = key
+                        self._index_vehicle(key, record)
+                if slot is not None:
+                    if self.journal is not None:
+                        self.journal.log_park(lot_name, level, slot, record)
+                    if self.event_observers:
+                        self._publish([VehicleParked(lot_name, level, slot, VehicleView(record))])
         except Exception as e:
-            logger.error(f"Error parking vehicle in lot {lot_name}: {e}")
+            with self._index_lock:
+                self._reserved.discard(registration_number)
+            logger.error("Error parking vehicle in lot %s: %s", lot_name, e)
             raise OperationError(f"Failed to park vehicle: {str(e)}")
+        
+        if slot is not None:
+            self._notify_observers(lot_name)
+        return slot
     
     def remove_vehicle(self, lot_name: str, level: int, slot: int) -> Optional[Vehicle]:
         """Remove a vehicle from a lot
@@ -346,55 +636,231 @@ class ParkingLotManagerImpl(ParkingLotManager):
             ValidationError: If the input data is invalid
             OperationError: If the lot doesn't exist or removal fails
         """
-        if lot_name not in self.lots:
+        lot = self.lots.get(lot_name)
+        if lot is None:
             raise OperationError(f"Lot {lot_name} not found")
         
         try:
-            vehicle = self.lots[lot_name].remove_vehicle(level, slot)
-            if vehicle is not None:
-                self._notify_observers(lot_name)
-            return vehicle
+            vehicle = self._remove_from_lot(lot, level, slot)
         except Exception as e:
-            logger.error(f"Error removing vehicle from lot {lot_name}: {e}")
+            logger.error("Error removing vehicle from lot %s: %s", lot_name, e)
             raise OperationError(f"Failed to remove vehicle: {str(e)}")
+        
+        if vehicle is not None:
+            self._notify_observers(lot_name)
+        return vehicle
+    
+    def park_many(self, lot_name: str, level: int, vehicles: List[VehicleData]) -> List[Optional[int]]:
+        """Park several vehicles on one level of a lot
+        
+        Vehicles are placed in input order, each in the lowest suitable free
+        slot, with a single pass over the level's free slots. Observers are
+        notified once for the batch, and only if something was parked.
+        
+        Args:
+            lot_name: The name of the lot
+            level: The level to park in
+            vehicles: The vehicle data, in parking order
+            
+        Returns:
+            The slot number for each vehicle, or None where it could not be parked
+            because no suitable slot was free or it is already parked
+            
+        Raises:
+            OperationError: If the lot doesn't exist or parking fails
+        """
+        lot = self.lots.get(lot_name)
+        if lot is None:
+            raise OperationError(f"Lot {lot_name} not found")
+        
+        results: List[Optional[int]] = [None] * len(vehicles)
+        events: List[ParkingEvent] = []
+        positions: List[int] = []
+        batch_registrations: List[str] = []
+        with self._index_lock:
+            for position, data in enumerate(vehicles):
+                registration_number = data.registration_number
+                if registration_number in self._registry or registration_number in self._reserved:
+                    logger.error("Vehicle %s is already parked", registration_number)
+                    continue
+                self._reserved.add(registration_number)
+                batch_registrations.append(registration_number)
+                positions.append(position)
+        
+        try:
+            records = [self._build_record(vehicles[position]) for position in positions]
+            with lot.lock:
+                slots = lot.park_many_data(level, records)
+                with self._index_lock:
+                    for position, record, slot in zip(positions, records, slots):
+                        if slot is None:
+                            continue
+                        key = (lot_name, level, slot)
+                        self._registry[record.registration_number] = key
+                        self._index_vehicle(key, record)
+                        results[position] = slot
+                        if self.event_observers:
+                            events.append(VehicleParked(lot_name, level, slot, VehicleView(record)))
+                if self.journal is not None:
+                    for record, slot in zip(records, slots):
+                        if slot is not None:
+                            self.journal.log_park(lot_name, level, slot, record)
+                self._publish(events)
+        except Exception as e:
+            logger.error("Error parking vehicles in lot %s: %s", lot_name, e)
+            raise OperationError(f"Failed to park vehicles: {str(e)}")
+        finally:
+            with self._index_lock:
+                self._reserved.difference_update(batch_registrations)
+        
+        if any(slot is not None for slot in results):
+            self._notify_observers(lot_name)
+        return results
     
-    def search_vehicles(self, lot_name: str, criteria: SearchCriteria) -> List[SearchResult]:
-        """Search for vehicles matching criteria in a specific lot
+    def remove_many(self, locations: List[SlotKey]) -> List[Optional[Vehicle]]:
+        """Remove the vehicles at several locations
+        
+        Observers are notified once per lot that changed, after the whole
+        batch has been processed.
         
         Args:
-            lot_name: The name of the lot to search in
+            locations: (lot name, level, slot) tuples to clear
+            
+        Returns:
+            The removed vehicle for each location, or None where the lot, level
+            or slot does not exist or the slot is empty
+            
+        Raises:
+            OperationError: If removal fails
+        """
+        results: List[Optional[Vehicle]] = []
+        # Changed lots in first-change order
+        changed_lots: Dict[str, None] = {}
+        try:
+            for lot_name, level, slot in locations:
+                lot = self.lots.get(lot_name)
+                if lot is None:
+                    logger.error("Lot %s not found", lot_name)
+                    results.append(None)
+                    continue
+                vehicle = self._remove_from_lot(lot, level, slot)
+                if vehicle is not None:
+                    changed_lots[lot_name] = None
+                results.append(vehicle)
+        except Exception as e:
+            logger.error("Error removing vehicles: %s", e)
+            raise OperationError(f"Failed to remove vehicles: {str(e)}")
+        finally:
+            for lot_name in changed_lots:
+                self._notify_observers(lot_name)
+        return results
+    
+    def _remove_from_lot(self, lot: ParkingLot, level: int, slot: int) -> Optional[Vehicle]:
+        """Empty a slot, drop its vehicle from the registry and indexes, and journal and publish the removal
+        
+        Args:
+            lot: The lot to remove from
+            level: The level to remove from
+            slot: The slot to remove from
+            
+        Returns:
+            The removed vehicle, or None if no vehicle was found
+        """
+        with lot.lock:
+            vehicle = lot.remove_vehicle(level, slot)
+            if vehicle is not None:
+                with self._index_lock:
+                    self._registry.pop(vehicle.registration_number, None)
+                    self._unindex_vehicle((lot.name, level, slot), vehicle)
+                if self.journal is not None:
+                    self.journal.log_remove(lot.name, level, slot)
+                if self.event_observers:
+                    self._publish([VehicleRemoved(lot.name, level, slot, vehicle)])
+        return vehicle
+    
+    def search_vehicles(self, lot_name: Optional[str], criteria: SearchCriteria) -> List[SearchResult]:
+        """Search for vehicles matching criteria in a specific lot or in all lots
+        
+        Each criterion is answered from the inverted indexes; the smallest
+        posting sets are intersected first so only matching vehicles are visited.
+        
+        Args:
+            lot_name: The name of the lot to search in, or None to search every lot
             criteria: The search criteria
             
         Returns:
-            List of search results
+            List of search results, ordered by lot creation order, level and slot
             
         Raises:
             ValidationError: If the input data is invalid
             OperationError: If the lot doesn't exist or search fails
         """
-        if lot_name not in self.lots:
+        if lot_name is not None and lot_name not in self.lots:
             raise OperationError(f"Lot {lot_name} not found")
         
         try:
-            results: List[SearchResult] = []
-            lot = self.lots[lot_name]
+            # A registration number identifies at most one vehicle, so answer from the registry
+            if criteria.registration_number:
+                result = self.find_vehicle(criteria.registration_number)
+                if result is None or not self._matches_criteria(result.vehicle, criteria):
+                    return []
+                if lot_name is not None and result.lot_name != lot_name:
+                    return []
+                return [result]
             
-            # Search through all levels
-            for level, slots in lot.levels.items():
-                for slot in slots:
-                    if slot.is_occupied and slot.vehicle and self._matches_criteria(slot.vehicle, criteria):
-                        results.append(SearchResult(
-                            lot_name=lot_name,
-                            level=level,
-                            slot=slot.slot_number,
-                            vehicle=slot.vehicle
-                        ))
+            with self._index_lock:
+                postings = self._postings_for(lot_name, criteria)
+                if postings is None:
+                    # No criteria at all: every parked vehicle matches
+                    keys: Set[SlotKey] = set(self._registry.values())
+                else:
+                    postings.sort(key=len)
+                    keys = set(postings[0])
+                    for posting in postings[1:]:
+                        if not keys:
+                            break
+                        keys &= posting
+            
+            # Taken after the keys, so every lot a key refers to is included
+            lot_order = {name: position for position, name in enumerate(self.get_lot_names())}
+            results: List[SearchResult] = []
+            for key in sorted(keys, key=lambda k: (lot_order[k[0]], k[1], k[2])):
+                key_lot, level, slot = key
+                vehicle = self.lots[key_lot].get_vehicle_data(level, slot)
+                # The slot may have changed hands since the indexes were read
+                if vehicle is not None and (postings is None or self._matches_criteria(vehicle, criteria)):
+                    results.append(SearchResult(
+                        lot_name=key_lot,
+                        level=level,
+                        slot=slot,
+                        vehicle=vehicle
+                    ))
             
             return results
         except Exception as e:
-            logger.error(f"Error searching vehicles in lot {lot_name}: {e}")
+            logger.error("Error searching vehicles in lot %s: %s", lot_name, e)
             raise OperationError(f"Failed to search vehicles: {str(e)}")
     
+    def find_vehicle(self, registration_number: str) -> Optional[SearchResult]:
+        """Find a parked vehicle by registration number in any lot
+        
+        Args:
+            registration_number: The registration number to look up
+            
+        Returns:
+            The location and details of the vehicle, or None if it is not parked
+        """
+        location = self._registry.get(registration_number)
+        if location is None:
+            return None
+        
+        lot_name, level, slot = location
+        vehicle = self.lots[lot_name].get_vehicle_data(level, slot)
+        if vehicle is None or vehicle.registration_number != registration_number:
+            return None
+        
+        return SearchResult(lot_name=lot_name, level=level, slot=slot, vehicle=vehicle)
+    
     def get_lot_status(self, lot_name: str) -> List[ParkingLevelData]:
         """Get the status of a lot
         
@@ -414,16 +880,30 @@ class ParkingLotManagerImpl(ParkingLotManager):
         try:
             return self.lots[lot_name].get_status()
         except Exception as e:
-            logger.error(f"Error getting status for lot {lot_name}: {e}")
+            logger.error("Error getting status for lot %s: %s", lot_name, e)
             raise OperationError(f"Failed to get lot status: {str(e)}")
     
+    def get_occupancy_summary(self) -> List[OccupancyData]:
+        """Get capacity and availability counters for every lot, level and slot type
+        
+        Returns:
+            List of occupancy data ordered by lot creation order, level and slot type
+        """
+        with self._lots_lock:
+            lots = list(self.lots.values())
+        summary: List[OccupancyData] = []
+        for lot in lots:
+            summary.extend(lot.get_occupancy())
+        return summary
+    
     def get_lot_names(self) -> List[str]:
         """Get the names of all lots
         
         Returns:
             List of lot names
         """
-        return list(self.lots.keys())
+        with self._lots_lock:
+            return list(self.lots.keys())
     
     def register_observer(self, observer: ParkingLotObserver) -> None:
         """Register an observer
@@ -432,7 +912,7 @@ class ParkingLotManagerImpl(ParkingLotManager):
             observer: The observer to register
         """
         self.observers.add(observer)
-        logger.info(f"Registered observer: {observer}")
+        logger.info("Registered observer: %s", observer)
     
     def unregister_observer(self, observer: ParkingLotObserver) -> None:
         """Unregister an observer
@@ -442,20 +922,264 @@ class ParkingLotManagerImpl(ParkingLotManager):
         """
         if observer in self.observers:
             self.observers.remove(observer)
-            logger.info(f"Unregistered observer: {observer}")
+            logger.info("Unregistered observer: %s", observer)
     
     def remove_observer(self, observer: ParkingLotObserver) -> None:
         """Remove an observer (for interface compatibility)"""
         self.unregister_observer(observer)
     
+    def register_event_observer(self, observer: ParkingEventObserver) -> None:
+        """Register an observer of typed change events
+        
+        Args:
+            observer: The event observer to register
+        """
+        self.event_observers.add(observer)
+        logger.info("Registered event observer: %s", observer)
+    
+    def unregister_event_observer(self, observer: ParkingEventObserver) -> None:
+        """Unregister an observer of typed change events
+        
+        Args:
+            observer: The event observer to unregister
+        """
+        if observer in self.event_observers:
+            self.event_observers.remove(observer)
+            logger.info("Unregistered event observer: %s", observer)
+    
+    def get_metrics(self) -> MetricsSnapshot:
+        """Get the operation metrics recorded so far
+        
+        Returns:
+            Call counts, error counts by exception type and latency histograms
+            per operation; empty if the manager was created without a recorder
+        """
+        if self.metrics is None:
+            return MetricsSnapshot(bucket_bounds=bucket_bounds())
+        return self.metrics.snapshot()
+    
+    def get_dispatch_stats(self) -> DispatchStats:
+        """Get the observer dispatcher's counters
+        
+        Returns:
+            Queue depth and submitted, delivered, merged and dropped notification counts
+        """
+        return self.dispatcher.stats()
+    
     def _notify_observers(self, lot_name: str) -> None:
-        """Notify all observers of a change
+        """Notify all observers of a change through the dispatcher
         
         Args:
             lot_name: The name of the lot that was updated
         """
-        for observer in self.observers:
-            observer.update(lot_name)
+        if self.observers:
+            self.dispatcher.submit(lot_name, tuple(self.observers))
+    
+    def _build_record(self, data: VehicleData) -> VehicleData:
+        """Build the one record a lot stores for a vehicle
+        
+        The caller keeps its own object. An EV's charge is fixed here, once,
+        and read back from the record afterwards.
+        
+        Args:
+            data: The vehicle data passed in by the caller
+            
+        Returns:
+            A new VehicleData record
+        """
+        charge = data.current_battery_charge
+        if data.is_electric and charge is None:
+            if self.charge_provider is not None:
+                charge = self.charge_provider.initial_charge(data.registration_number)
+            else:
+                charge = default_battery_charge(data.registration_number)
+        return VehicleData(
+            registration_number=data.registration_number,
+            manufacturer=data.manufacturer,
+            model=data.model,
+            color=data.color,
+            is_electric=data.is_electric,
+            is_motorcycle=data.vehicle_type == VehicleType.MOTORCYCLE,
+            vehicle_type=data.vehicle_type,
+            current_battery_charge=charge if data.is_electric else None
+        )
+    
+    def restore_vehicles(self, rows: Iterable[Tuple[str, int, int, VehicleData]]) -> int:
+        """Put saved vehicle records back into specific slots
+        
+        Used when loading saved state: each record is stored as is, without
+        notifying observers or writing to the journal. Call finish_restore
+        once all vehicles are back, before parking anything else.
+        
+        Args:
+            rows: (lot name, level, slot, record) for each vehicle
+            
+        Returns:
+            The number of vehicles restored; rows whose lot or slot does not exist,
+            whose slot is occupied or whose vehicle is already parked are skipped
+        """
+        restored = 0
+        with self._all_lots_locked() as lots:
+            lots_by_name = {lot.name: lot for lot in lots}
+            with self._index_lock:
+                registry = self._registry
+                tables = self._index_tables
+                index_values = self._index_values
+                for lot_name, level, slot, record in rows:
+                    lot = lots_by_name.get(lot_name)
+                    if lot is None or record.registration_number in registry:
+                        continue
+                    if not lot.place_vehicle_data(level, slot, record):
+                        continue
+                    key = (lot_name, level, slot)
+                    registry[record.registration_number] = key
+                    # _index_vehicle, inlined: this loop runs once per saved vehicle
+                    for postings, value in zip(tables, index_values(lot_name, record)):
+                        posting = postings.get(value)
+                        if posting is None:
+                            posting = postings[value] = set()
+                        posting.add(key)
+                    restored += 1
+        return restored
+    
+    def finish_restore(self) -> None:
+        """Rebuild every lot's free-slot heaps after restore_vehicles calls"""
+        with self._lots_lock:
+            lots = list(self.lots.values())
+        for lot in lots:
+            lot.rebuild_free_slots()
+    
+    def capture_state(self, while_frozen: Optional[Callable[[], None]] = None
+                      ) -> Tuple[List[Tuple[str, List[Tuple[int, int, int]]]], List[Tuple[str, int, int, VehicleData]]]:
+        """Take a consistent copy of all lots and parked vehicles
+        
+        Every lot is locked while the copy is taken, so no lot can be created
+        and nothing can be parked or removed in between.
+        
+        Args:
+            while_frozen: Called while everything is still locked, e.g. to
+                start a new journal exactly at the point the copy represents
+            
+        Returns:
+            (lot name, level layout) for each lot in creation order, and
+            (lot name, level, slot, record) for each parked vehicle
+        """
+        with self._all_lots_locked() as lots:
+            layouts = [(lot.name, lot.get_level_layout()) for lot in lots]
+            vehicles = [
+                (lot.name, level, slot, record)
+                for lot in lots
+                for level, slot, record in lot.iter_parked()
+            ]
+            if while_frozen is not None:
+                while_frozen()
+        return layouts, vehicles
+    
+    @contextmanager
+    def _all_lots_locked(self) -> Iterator[List[ParkingLot]]:
+        """Hold the lot table lock and every lot's lock
+        
+        Lot locks are taken in creation order; no other code path holds more
+        than one lot lock, so this cannot deadlock.
+        
+        Yields:
+            The lots, in creation order
+        """
+        with self._lots_lock:
+            lots = list(self.lots.values())
+            for lot in lots:
+                lot.lock.acquire()
+            try:
+                yield lots
+            finally:
+                for lot in reversed(lots):
+                    lot.lock.release()
+    
+    def _publish(self, events: List[ParkingEvent]) -> None:
+        """Send change events to all event observers through the dispatcher
+        
+        Called with the changed lot's lock held, so events for a lot reach the
+        dispatcher in the order the changes were made. With the synchronous
+        dispatcher, event observers therefore run under that lock.
+        
+        Args:
+            events: The events, in the order they happened
+        """
+        if events and self.event_observers:
+            self.dispatcher.submit_events(events, tuple(self.event_observers))
+    
+    def _index_values(self, lot_name: str, vehicle: Union[Vehicle, VehicleData]) -> Tuple[Any, ...]:
+        """Get the values under which a vehicle is indexed
+        
+        Args:
+            lot_name: The name of the lot the vehicle is parked in
+            vehicle: The vehicle to index
+            
+        Returns:
+            One value per posting table, in "lot_name" + INDEXED_ATTRIBUTES order
+        """
+        return (
+            lot_name,
+            vehicle.color,
+            vehicle.manufacturer,
+            vehicle.model,
+            vehicle.is_electric,
+            vehicle.vehicle_type == VehicleType.MOTORCYCLE,
+            vehicle.vehicle_type
+        )
+    
+    def _index_vehicle(self, key: SlotKey, vehicle: Union[Vehicle, VehicleData]) -> None:
+        """Add a parked vehicle to the inverted indexes
+        
+        Args:
+            key: The location of the vehicle
+            vehicle: The parked vehicle
+        """
+        for postings, value in zip(self._index_tables, self._index_values(key[0], vehicle)):
+            posting = postings.get(value)
+            if posting is None:
+                posting = postings[value] = set()
+            posting.add(key)
+    
+    def _unindex_vehicle(self, key: SlotKey, vehicle: Union[Vehicle, VehicleData]) -> None:
+        """Remove a vehicle that has left from the inverted indexes
+        
+        Args:
+            key: The location the vehicle was parked in
+            vehicle: The removed vehicle
+        """
+        for postings, value in zip(self._index_tables, self._index_values(key[0], vehicle)):
+            posting = postings.get(value)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del postings[value]
+    
+    def _postings_for(self, lot_name: Optional[str], criteria: SearchCriteria) -> Optional[List[Set[SlotKey]]]:
+        """Collect the posting sets that a search has to intersect
+        
+        Args:
+            lot_name: The lot to restrict the search to, or None for all lots
+            criteria: The search criteria
+            
+        Returns:
+            One posting set per criterion that is set, or None if nothing restricts the search
+        """
+        wanted: List[Tuple[str, Any]] = []
+        if lot_name is not None:
+            wanted.append(("lot_name", lot_name))
+        for attribute in INDEXED_ATTRIBUTES:
+            value = getattr(criteria, attribute)
+            # Empty strings mean "any", matching _matches_criteria
+            if value is None or value == "":
+                continue
+            wanted.append((attribute, value))
+        
+        if not wanted:
+            return None
+        
+        empty: Set[SlotKey] = set()
+        return [self._attribute_index[attribute].get(value, empty) for attribute, value in wanted]
     
     def _matches_criteria(self, vehicle: VehicleData, criteria: SearchCriteria) -> bool:
         """Check if a vehicle matches search criteria
@@ -493,10 +1217,12 @@ class ParkingLotManagerImpl(ParkingLotManager):
             List of level numbers
         """
         if lot_name not in self.lots:
-            logger.error(f"Lot {lot_name} not found")
+            logger.error("Lot %s not found", lot_name)
             return []
         
-        return sorted(self.lots[lot_name].levels.keys())
+        lot = self.lots[lot_name]
+        with lot.lock:
+            return sorted(lot.levels.keys())
 
     def get_vehicles_in_lot(self, lot_name: str, level: int) -> Dict[int, Vehicle]:
         """Get all vehicles in a specific lot and level
@@ -520,29 +1246,79 @@ class ParkingLotManagerImpl(ParkingLotManager):
             lot = self.lots[lot_name]
             
             if level not in lot.levels:
-                logger.error(f"Level {level} not found in lot {lot_name}")
+                logger.error("Level %s not found in lot %s", level, lot_name)
                 return vehicles
             
-            for slot in lot.levels[level]:
-                if slot.is_occupied and slot.vehicle:
-                    vehicle = create_vehicle(
-                        registration_number=slot.vehicle.registration_number,
-                        manufacturer=slot.vehicle.manufacturer,
-                        model=slot.vehicle.model,
-                        color=slot.vehicle.color,
-                        vehicle_type=slot.vehicle.vehicle_type,
-                        is_electric=slot.vehicle.is_electric
-                    )
-                    vehicles[slot.slot_number] = vehicle
-            
-            return vehicles
+            return lot.get_vehicles_in_lot(level)
         except Exception as e:
-            logger.error(f"Error getting vehicles in lot {lot_name}, level {level}: {e}")
+            logger.error("Error getting vehicles in lot %s, level %s: %s", lot_name, level, e)
             raise OperationError(f"Failed to get vehicles: {str(e)}")
 
+    def get_occupied_slots(self, lot_name: str, level: int) -> List[int]:
+        """Get the numbers of the occupied slots on a level of a lot
+        
+        Only the level's own store is read; no slot objects are built.
+        
+        Args:
+            lot_name: The name of the lot
+            level: The level number
+            
+        Returns:
+            The occupied slot numbers in ascending order, or an empty list if the level does not exist
+            
+        Raises:
+            OperationError: If the lot doesn't exist
+        """
+        lot = self.lots.get(lot_name)
+        if lot is None:
+            raise OperationError(f"Lot {lot_name} not found")
+        return lot.get_occupied_slots(level)
+
+    def get_slot(self, lot_name: str, level: int, slot: int) -> Optional[ParkingSlotData]:
+        """Get a snapshot of a single slot
+        
+        Args:
+            lot_name: The name of the lot
+            level: The level the slot is on
+            slot: The slot number
+            
+        Returns:
+            The slot's data, or None if the level or slot does not exist
+            
+        Raises:
+            OperationError: If the lot doesn't exist
+        """
+        lot = self.lots.get(lot_name)
+        if lot is None:
+            raise OperationError(f"Lot {lot_name} not found")
+        return lot.get_slot(level, slot)
+
+    def is_slot_occupied(self, lot_name: str, level: int, slot: int) -> bool:
+        """Check whether a single slot holds a vehicle
+        
+        Args:
+            lot_name: The name of the lot
+            level: The level the slot is on
+            slot: The slot number
+            
+        Returns:
+            True if the slot exists and is occupied
+            
+        Raises:
+            OperationError: If the lot doesn't exist
+        """
+        lot = self.lots.get(lot_name)
+        if lot is None:
+            raise OperationError(f"Lot {lot_name} not found")
+        return lot.get_vehicle_data(level, slot) is not None
+
 # Main App
 def main():
     """Initializes and runs the parking lot application UI."""
+    # Imported here so that importing the engine sets up no logging pipeline and loads no tkinter
+    from logging_config import configure_logging
+    # The app's only handlers are the ones configure_logging sets up, so records can be lean
+    configure_logging(lean_records=True)
     # Create UI
     from ParkingLotUI import ParkingLotUI
     ui = ParkingLotUI()  # No need to pass parking lot since it's created in __init__
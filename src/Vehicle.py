@@ -5,9 +5,16 @@ This module defines the vehicle classes for the parking system.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from enum import Enum, auto
-import random
+import sys
+from battery import get_charge_provider
+
+if TYPE_CHECKING:
+    from models import VehicleData
+
+# Use __slots__ instead of a per-instance __dict__ where the Python version allows it
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 class VehicleType(Enum):
     """Enum for vehicle types"""
@@ -24,7 +31,7 @@ class VehicleType(Enum):
         except KeyError:
             raise ValueError(f"Invalid vehicle type: {type_str}")
 
-@dataclass
+@dataclass(**_SLOTS)
 class Vehicle:
     """Base class for all vehicles"""
     registration_number: str
@@ -38,8 +45,7 @@ class Vehicle:
     def __post_init__(self):
         """Initialize vehicle after creation"""
         if self.is_electric and self.current_battery_charge is None:
-            # Initialize with a random charge between 20-100%
-            self.current_battery_charge = random.uniform(20.0, 100.0)
+            self.current_battery_charge = default_battery_charge(self.registration_number)
 
     def get_type(self) -> str:
         """Get vehicle type as string"""
@@ -80,6 +86,42 @@ class Vehicle:
             return f"{base_info} - Battery: {self.current_battery_charge:.1f}%"
         return base_info
 
+def _record_field(name: str) -> property:
+    """Read-only property that reads an attribute from the wrapped record"""
+    return property(lambda self: getattr(self._record, name))
+
+class VehicleView(Vehicle):
+    """Read-only Vehicle facade over a stored vehicle record
+    
+    The parking lot keeps one VehicleData record per parked vehicle and hands
+    out views instead of copies. Attributes read through to the record and
+    cannot be assigned.
+    """
+    __slots__ = ("_record",)
+
+    def __init__(self, record: "VehicleData"):
+        object.__setattr__(self, "_record", record)
+
+    registration_number = _record_field("registration_number")  # type: ignore[assignment]
+    manufacturer = _record_field("manufacturer")  # type: ignore[assignment]
+    model = _record_field("model")  # type: ignore[assignment]
+    color = _record_field("color")  # type: ignore[assignment]
+    vehicle_type = _record_field("vehicle_type")  # type: ignore[assignment]
+    is_electric = _record_field("is_electric")  # type: ignore[assignment]
+    current_battery_charge = _record_field("current_battery_charge")  # type: ignore[assignment]
+
+    def set_battery_charge(self, charge: float) -> None:
+        """Views are read-only"""
+        raise AttributeError("Cannot set battery charge on a read-only vehicle view")
+
+def default_battery_charge(registration_number: str) -> float:
+    """Initial battery charge for an electric vehicle whose charge is unknown
+    
+    The charge comes from the process-wide provider set with
+    battery.set_charge_provider (random between 20-100% by default).
+    """
+    return get_charge_provider().initial_charge(registration_number)
+
 def create_vehicle(
     registration_number: str,
     manufacturer: str,
@@ -0,0 +1,340 @@
+"""
+Async Parking Manager Module
+
+This module provides an asyncio front-end for a ParkingLotManager, for gate
+controllers and camera services that run on an event loop. Mutations of a
+lot are serialized with one asyncio.Lock per lot when calls run in an
+executor, and change events can be consumed with `async for`.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Executor
+from contextlib import AbstractAsyncContextManager, AsyncExitStack
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from models import (
+    ParkingEvent,
+    ParkingLevelData,
+    ParkingLotData,
+    ParkingSlotData,
+    SearchCriteria,
+    SearchResult,
+    VehicleData
+)
+from Vehicle import Vehicle
+from interfaces import ParkingEventObserver, ParkingLotManager
+
+logger = logging.getLogger(__name__)
+
+class _NoLock(AbstractAsyncContextManager):
+    """Async context manager that does nothing; stands in for the lot locks when calls run on the loop"""
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
+
+_NO_LOCK = _NoLock()
+
+class ChangeEventStream:
+    """Async iterator over the change events of an AsyncParkingLotManager
+
+    Events are buffered per stream. When a stream falls more than `max_queue`
+    events behind, new events are dropped and counted in `dropped`. Close the
+    stream (or leave its `async with` block) to stop receiving events.
+    """
+
+    def __init__(self, owner: "AsyncParkingLotManager", loop: asyncio.AbstractEventLoop, max_queue: int):
+        """Initialize the stream
+
+        Args:
+            owner: The manager the stream is subscribed to
+            loop: The event loop the stream is consumed on
+            max_queue: Maximum number of buffered events
+        """
+        self._owner = owner
+        self._loop = loop
+        self._queue: "asyncio.Queue[Optional[ParkingEvent]]" = asyncio.Queue(max_queue)
+        self._closed = False
+        self.dropped = 0
+
+    def _put(self, event: ParkingEvent) -> None:
+        """Buffer an event; must run on the stream's loop"""
+        if self._closed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """Unsubscribe; iteration ends once the buffered events are consumed"""
+        if self._closed:
+            return
+        self._closed = True
+        self._owner._unsubscribe(self)
+        # Wake a waiting consumer; if the buffer is full it will see the flag instead
+        try:
+            self._queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+    def __aiter__(self) -> "ChangeEventStream":
+        return self
+
+    async def __anext__(self) -> ParkingEvent:
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+        event = await self._queue.get()
+        if event is None:
+            raise StopAsyncIteration
+        return event
+
+    async def __aenter__(self) -> "ChangeEventStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+class AsyncParkingLotManager(ParkingEventObserver):
+    """asyncio front-end for a ParkingLotManager
+
+    By default calls run directly on the event loop, which suits the
+    in-memory manager whose operations take microseconds. Each call then
+    completes without yielding, so the loop already serves them one at a
+    time and no locks are taken.
+
+    Pass an executor to run calls on other threads instead, for backends
+    that block; the wrapped manager must then be thread-safe. Mutations of
+    a lot (park, remove, adding levels) then hold that lot's asyncio.Lock
+    while they wait for the executor, so sessions for one lot are served in
+    turn while sessions for other lots proceed. Reads take no lock.
+    """
+
+    def __init__(self, manager: ParkingLotManager, executor: Optional[Executor] = None):
+        """Initialize the front-end
+
+        Args:
+            manager: The manager to wrap
+            executor: Executor to run manager calls in, or None to run them on the loop
+        """
+        self.manager = manager
+        self.executor = executor
+        self._lot_locks: Dict[str, asyncio.Lock] = {}
+        self._streams: Set[ChangeEventStream] = set()
+        # Guards _streams, which the wrapped manager may read from another thread
+        self._streams_lock = threading.Lock()
+
+    async def _call(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Run a manager call on the loop or in the executor"""
+        if self.executor is None:
+            return function(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    def _lock_for(self, lot_name: str) -> AbstractAsyncContextManager:
+        """Get the lock serializing mutations of a lot, creating it on first use
+
+        Without an executor no call can interleave with another, so a
+        context manager that does nothing is returned instead.
+        """
+        if self.executor is None:
+            return _NO_LOCK
+        lock = self._lot_locks.get(lot_name)
+        if lock is None:
+            lock = self._lot_locks[lot_name] = asyncio.Lock()
+        return lock
+
+    async def create_lot(self, data: ParkingLotData) -> bool:
+        """Create a new parking lot or add levels to an existing one
+
+        Args:
+            data: The parking lot data
+
+        Returns:
+            True if the lot was created or updated successfully
+        """
+        async with self._lock_for(data.name):
+            return await self._call(self.manager.create_lot, data)
+
+    async def park_vehicle(self, lot_name: str, level: int, data: VehicleData) -> Optional[int]:
+        """Park a vehicle in a lot
+
+        Args:
+            lot_name: The name of the lot
+            level: The level to park in
+            data: The vehicle data
+
+        Returns:
+            The slot number where the vehicle was parked, or None if parking failed
+
+        Raises:
+            ValidationError: If the vehicle is already parked
+            OperationError: If the lot doesn't exist or parking fails
+        """
+        async with self._lock_for(lot_name):
+            return await self._call(self.manager.park_vehicle, lot_name, level, data)
+
+    async def remove_vehicle(self, lot_name: str, level: int, slot: int) -> Optional[Vehicle]:
+        """Remove a vehicle from a lot
+
+        Args:
+            lot_name: The name of the lot
+            level: The level to remove from
+            slot: The slot to remove from
+
+        Returns:
+            The removed vehicle, or None if no vehicle was found
+
+        Raises:
+            OperationError: If the lot doesn't exist or removal fails
+        """
+        async with self._lock_for(lot_name):
+            return await self._call(self.manager.remove_vehicle, lot_name, level, slot)
+
+    async def park_many(self, lot_name: str, level: int, vehicles: List[VehicleData]) -> List[Optional[int]]:
+        """Park several vehicles on one level of a lot
+
+        Args:
+            lot_name: The name of the lot
+            level: The level to park in
+            vehicles: The vehicle data, in parking order
+
+        Returns:
+            The slot number for each vehicle, or None where it could not be parked
+        """
+        async with self._lock_for(lot_name):
+            return await self._call(self.manager.park_many, lot_name, level, vehicles)
+
+    async def remove_many(self, locations: List[Tuple[str, int, int]]) -> List[Optional[Vehicle]]:
+        """Remove the vehicles at several locations
+
+        The locks of all lots involved are taken in name order, so concurrent
+        batches cannot deadlock.
+
+        Args:
+            locations: (lot name, level, slot) tuples to clear
+
+        Returns:
+            The removed vehicle for each location, or None where nothing was removed
+        """
+        async with AsyncExitStack() as stack:
+            for lot_name in sorted({location[0] for location in locations}):
+                await stack.enter_async_context(self._lock_for(lot_name))
+            return await self._call(self.manager.remove_many, locations)
+
+    async def search_vehicles(self, lot_name: Optional[str], criteria: SearchCriteria) -> List[SearchResult]:
+        """Search for vehicles matching criteria in a lot, or in all lots if lot_name is None
+
+        Args:
+            lot_name: The name of the lot to search in, or None
+            criteria: The search criteria
+
+        Returns:
+            List of search results
+        """
+        return await self._call(self.manager.search_vehicles, lot_name, criteria)
+
+    async def find_vehicle(self, registration_number: str) -> Optional[SearchResult]:
+        """Find a parked vehicle by registration number in any lot
+
+        Args:
+            registration_number: The registration number to look up
+
+        Returns:
+            The location and details of the vehicle, or None if it is not parked
+        """
+        return await self._call(self.manager.find_vehicle, registration_number)
+
+    async def get_lot_status(self, lot_name: str) -> List[ParkingLevelData]:
+        """Get the status of a lot
+
+        Args:
+            lot_name: The name of the lot
+
+        Returns:
+            List of level data
+        """
+        return await self._call(self.manager.get_lot_status, lot_name)
+
+    async def get_occupied_slots(self, lot_name: str, level: int) -> List[int]:
+        """Get the numbers of the occupied slots on a level of a lot
+
+        Args:
+            lot_name: The name of the lot
+            level: The level number
+
+        Returns:
+            The occupied slot numbers in ascending order
+        """
+        return await self._call(self.manager.get_occupied_slots, lot_name, level)
+
+    async def get_slot(self, lot_name: str, level: int, slot: int) -> Optional[ParkingSlotData]:
+        """Get a snapshot of a single slot
+
+        Args:
+            lot_name: The name of the lot
+            level: The level the slot is on
+            slot: The slot number
+
+        Returns:
+            The slot's data, or None if the level or slot does not exist
+        """
+        return await self._call(self.manager.get_slot, lot_name, level, slot)
+
+    async def is_slot_occupied(self, lot_name: str, level: int, slot: int) -> bool:
+        """Check whether a single slot holds a vehicle
+
+        Args:
+            lot_name: The name of the lot
+            level: The level the slot is on
+            slot: The slot number
+
+        Returns:
+            True if the slot exists and is occupied
+        """
+        return await self._call(self.manager.is_slot_occupied, lot_name, level, slot)
+
+    def events(self, max_queue: int = 10_000) -> ChangeEventStream:
+        """Subscribe to change events
+
+        Must be called from a coroutine; events are delivered on that
+        coroutine's event loop, whichever thread the manager publishes them on.
+
+        Args:
+            max_queue: Maximum number of events buffered for this subscriber
+
+        Returns:
+            A ChangeEventStream to iterate with `async for`
+        """
+        stream = ChangeEventStream(self, asyncio.get_running_loop(), max_queue)
+        with self._streams_lock:
+            if not self._streams:
+                # Only ask for events while someone is listening; registering under
+                # the lock keeps it in step with a stream closing on another thread
+                self.manager.register_event_observer(self)
+            self._streams.add(stream)
+        return stream
+
+    def _unsubscribe(self, stream: ChangeEventStream) -> None:
+        """Remove a stream; stop observing the manager when none are left"""
+        with self._streams_lock:
+            self._streams.discard(stream)
+            if not self._streams:
+                self.manager.unregister_event_observer(self)
+
+    def on_event(self, event: ParkingEvent) -> None:
+        """Fan an event out to every stream, on each stream's own loop"""
+        with self._streams_lock:
+            streams = list(self._streams)
+        for stream in streams:
+            loop = stream._loop
+            if loop.is_closed():
+                continue
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                stream._put(event)
+            else:
+                loop.call_soon_threadsafe(stream._put, event)
@@ -0,0 +1,110 @@
+"""
+Battery Module
+
+This module defines where the initial battery charge of an electric vehicle
+comes from. The parking system asks the active charge provider once, when an
+EV enters, and stores the answer on the vehicle record.
+"""
+
+import logging
+import random
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Range used when a charge has to be made up
+MIN_INITIAL_CHARGE = 20.0
+MAX_INITIAL_CHARGE = 100.0
+
+class BatteryChargeProvider(ABC):
+    """Interface for sources of electric vehicle battery charge"""
+
+    @abstractmethod
+    def initial_charge(self, registration_number: str) -> float:
+        """Gets the battery charge of an electric vehicle as it enters.
+
+        Args:
+            registration_number: The registration number of the vehicle.
+
+        Returns:
+            The charge as a percentage.
+        """
+        pass
+
+class RandomChargeProvider(BatteryChargeProvider):
+    """Draws charges uniformly from a range, optionally from a seeded generator"""
+
+    def __init__(self, seed: Optional[int] = None,
+                 low: float = MIN_INITIAL_CHARGE, high: float = MAX_INITIAL_CHARGE):
+        """Initialize the provider
+
+        Args:
+            seed: Seed for a private random generator, or None for an unseeded one
+            low: Lowest charge to return
+            high: Highest charge to return
+        """
+        self._random = random.Random(seed)
+        self.low = low
+        self.high = high
+
+    def initial_charge(self, registration_number: str) -> float:
+        return self._random.uniform(self.low, self.high)
+
+class FixedChargeProvider(BatteryChargeProvider):
+    """Returns the same charge for every vehicle"""
+
+    def __init__(self, charge: float):
+        """Initialize the provider
+
+        Args:
+            charge: The charge to return
+        """
+        self.charge = charge
+
+    def initial_charge(self, registration_number: str) -> float:
+        return self.charge
+
+class TelemetryChargeProvider(BatteryChargeProvider):
+    """Reads charges from an external telemetry feed
+
+    The feed is called with the registration number and returns the reported
+    charge, or None if it has no reading for the vehicle. Vehicles without a
+    reading, or whose lookup fails, get a charge from the fallback provider.
+    """
+
+    def __init__(self, feed: Callable[[str], Optional[float]],
+                 fallback: Optional[BatteryChargeProvider] = None):
+        """Initialize the provider
+
+        Args:
+            feed: Callable returning the reported charge for a registration number
+            fallback: Provider used when the feed has no reading; defaults to RandomChargeProvider()
+        """
+        self.feed = feed
+        self.fallback = fallback if fallback is not None else RandomChargeProvider()
+
+    def initial_charge(self, registration_number: str) -> float:
+        try:
+            charge = self.feed(registration_number)
+        except Exception as e:
+            logger.warning("Telemetry lookup failed for %s: %s", registration_number, e)
+            charge = None
+        if charge is None:
+            return self.fallback.initial_charge(registration_number)
+        return max(0.0, min(100.0, float(charge)))
+
+_charge_provider: BatteryChargeProvider = RandomChargeProvider()
+
+def get_charge_provider() -> BatteryChargeProvider:
+    """Get the process-wide charge provider"""
+    return _charge_provider
+
+def set_charge_provider(provider: BatteryChargeProvider) -> None:
+    """Replace the process-wide charge provider
+
+    Args:
+        provider: The provider to use from now on
+    """
+    global _charge_provider
+    _charge_provider = provider
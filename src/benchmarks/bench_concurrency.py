@@ -0,0 +1,142 @@
+"""
+Concurrency stress benchmark for the Parking Management System
+
+This script drives one ParkingLotManagerImpl from several threads. It checks
+allocation first: threads race to park more vehicles than one lot has room
+for, and every slot must end up with exactly one vehicle, matching the
+registry. It then measures park/remove throughput with 1, 2, 4, ... threads,
+each working on its own lot, and reports the speed-up over one thread.
+
+On a CPython build with the GIL, pure-Python work cannot run in parallel, so
+throughput stays roughly flat as threads are added; the per-lot locks only
+show near-linear scaling on a free-threaded build. The script prints which
+kind of interpreter it ran on.
+
+Usage (from the src directory):
+    python benchmarks/bench_concurrency.py [--threads 1,2,4,8] [--ops N] [--slots N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+from typing import List, Optional
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ParkingManager import ParkingLotManagerImpl
+from models import ParkingLevelData, ParkingLotData, ParkingSlotData, SlotType, VehicleData
+from Vehicle import VehicleType
+
+
+def make_lot(name: str, slots: int) -> ParkingLotData:
+    """Build a one-level lot with the given number of regular slots."""
+    level = ParkingLevelData(level=1, slots=[
+        ParkingSlotData(slot_number=i + 1, is_occupied=False, slot_type=SlotType.REGULAR) for i in range(slots)
+    ])
+    return ParkingLotData(name=name, levels=[level])
+
+
+def make_vehicle(registration_number: str) -> VehicleData:
+    """Build a regular car."""
+    return VehicleData(registration_number, "Toyota", "Camry", "Red", False, False, VehicleType.CAR)
+
+
+def run_threads(count: int, target, *args) -> float:
+    """Run target(index, *args) on count threads started together.
+
+    Returns:
+        Wall-clock seconds from release to the last thread finishing
+    """
+    barrier = threading.Barrier(count + 1)
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        target(index, *args)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def check_allocation(threads: int, slots: int) -> None:
+    """Race threads to overfill one lot and verify no slot was handed out twice."""
+    manager = ParkingLotManagerImpl()
+    manager.create_lot(make_lot("Contended", slots))
+    per_thread = slots // threads + slots // 2
+    claimed: List[List[Optional[int]]] = [[] for _ in range(threads)]
+
+    def park(index: int) -> None:
+        for i in range(per_thread):
+            claimed[index].append(manager.park_vehicle("Contended", 1, make_vehicle(f"T{index}-{i}")))
+
+    run_threads(threads, park)
+    slots_taken = [slot for results in claimed for slot in results if slot is not None]
+    status = manager.get_lot_status("Contended")[0].slots
+    registry_ok = all(
+        slot.vehicle is not None and manager.find_vehicle(slot.vehicle.registration_number) is not None
+        for slot in status
+    )
+    ok = len(slots_taken) == slots and len(set(slots_taken)) == slots and registry_ok
+    print(f"allocation: {threads} threads, {threads * per_thread} attempts, {slots} slots -> "
+          f"{len(slots_taken)} parked, {len(set(slots_taken))} distinct slots, registry consistent: {registry_ok}")
+    if not ok:
+        raise SystemExit("double allocation detected")
+
+
+def measure_throughput(threads: int, ops: int, slots: int) -> float:
+    """Time park/remove cycles with one lot per thread.
+
+    Returns:
+        Operations per second across all threads
+    """
+    manager = ParkingLotManagerImpl()
+    for index in range(threads):
+        manager.create_lot(make_lot(f"Lot{index}", slots))
+
+    def cycle(index: int) -> None:
+        lot_name = f"Lot{index}"
+        for i in range(ops // 2):
+            slot = manager.park_vehicle(lot_name, 1, make_vehicle(f"{lot_name}-{i}"))
+            if slot is not None:
+                manager.remove_vehicle(lot_name, 1, slot)
+
+    seconds = run_threads(threads, cycle)
+    return threads * (ops // 2) * 2 / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", default="1,2,4,8", help="comma-separated thread counts")
+    parser.add_argument("--ops", type=int, default=20_000, help="operations per thread")
+    parser.add_argument("--slots", type=int, default=1_000, help="slots per lot")
+    args = parser.parse_args()
+    thread_counts = [int(count) for count in args.threads.split(",")]
+
+    # Keep per-operation log records (including expected "no slot" errors) out of the run
+    logging.getLogger("ParkingManager").setLevel(logging.CRITICAL)
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}")
+
+    for count in thread_counts:
+        check_allocation(max(count, 2), args.slots)
+
+    print(f"{'threads':>7} {'ops/sec':>12} {'speed-up':>9}")
+    baseline = None
+    for count in thread_counts:
+        rate = measure_throughput(count, args.ops, args.slots)
+        baseline = baseline or rate
+        print(f"{count:>7} {rate:>12,.0f} {rate / baseline:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Import-time benchmark for the Parking Management System
+
+This script measures the cold-start cost of importing the headless engine
+(the parking_engine package) and the GUI (ParkingLotUI, which brings in
+tkinter) separately. Each target is imported in a fresh interpreter with
+`python -X importtime`, several times, and the script reports the median
+total import time, the number of modules the import loaded and the modules
+with the highest self time. It also checks that the engine loads neither
+tkinter nor any other GUI module.
+
+Results can be written to a JSON file and compared against a stored
+baseline; a target regresses when its median import time grows by more
+than the threshold, and the script then exits with status 1.
+
+Usage (from the src directory):
+    python benchmarks/bench_import.py [--repeat N] [--top N] [--output results.json]
+        [--baseline baseline.json] [--threshold 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Tuple
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Target name -> module to import
+TARGETS = {"engine": "parking_engine", "gui": "ParkingLotUI"}
+
+# Modules the engine must not load
+GUI_MODULES = ("tkinter", "_tkinter", "ParkingLotUI")
+
+
+def import_once(module: str) -> Tuple[int, List[Tuple[str, int]]]:
+    """Import a module in a fresh interpreter under -X importtime
+
+    Returns:
+        The module's cumulative import time in microseconds, and the
+        (module, self time in microseconds) of everything it loaded
+    """
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                               cwd=SRC_DIR, capture_output=True, text=True, check=True)
+    loaded: List[Tuple[str, int]] = []
+    total = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        loaded.append((name.strip(), int(self_us)))
+        if name.strip() == module:
+            total = int(cumulative_us)
+    # site and its dependencies are imported at startup, before the target; everything after it is the target's
+    names = [name for name, _ in loaded]
+    start = names.index("site") + 1 if "site" in names else 0
+    return total, loaded[start:]
+
+
+def measure(module: str, repeat: int, top: int) -> Dict[str, Any]:
+    """Import a module repeat times and summarize the runs."""
+    runs = [import_once(module) for _ in range(repeat)]
+    totals = [total for total, _ in runs]
+    self_times: Dict[str, List[int]] = {}
+    for _, loaded in runs:
+        for name, self_us in loaded:
+            self_times.setdefault(name, []).append(self_us)
+    slowest = sorted(((statistics.median(times), name) for name, times in self_times.items()), reverse=True)[:top]
+    return {
+        "module": module,
+        "median_ms": statistics.median(totals) / 1e3,
+        "min_ms": min(totals) / 1e3,
+        "modules_loaded": len(runs[0][1]),
+        "gui_modules_loaded": sorted(name for name in self_times if name in GUI_MODULES),
+        "slowest": [{"module": name, "self_ms": self_us / 1e3} for self_us, name in slowest],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=7, help="fresh interpreters per target")
+    parser.add_argument("--top", type=int, default=8, help="slowest modules to list per target")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed fractional growth in import time before it counts as a regression")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results: Dict[str, Any] = {"python": platform.python_version(), "platform": platform.platform(), "targets": {}}
+    regressions = []
+    for target, module in TARGETS.items():
+        summary = measure(module, args.repeat, args.top)
+        results["targets"][target] = summary
+        base = (baseline or {}).get("targets", {}).get(target)
+        change = ""
+        if base:
+            change = f", {(summary['median_ms'] / base['median_ms'] - 1) * 100:+.1f}% vs baseline"
+            if summary["median_ms"] > base["median_ms"] * (1 + args.threshold):
+                regressions.append(f"{target}: {summary['median_ms']:.1f} ms, baseline {base['median_ms']:.1f} ms")
+        print(f"\n{target} (import {module}): median {summary['median_ms']:.1f} ms, min {summary['min_ms']:.1f} ms, "
+              f"{summary['modules_loaded']} modules{change}")
+        for entry in summary["slowest"]:
+            print(f"  {entry['module']:<32}{entry['self_ms']:>8.1f} ms self")
+    if results["targets"]["engine"]["gui_modules_loaded"]:
+        regressions.append(f"engine loads GUI modules: {results['targets']['engine']['gui_modules_loaded']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s):")
+        for message in regressions:
+            print(f"  {message}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
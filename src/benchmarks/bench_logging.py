@@ -0,0 +1,136 @@
+"""
+Logging cost benchmark for the Parking Management System
+
+This script measures what logging adds to each park and remove. The same
+park/remove loop runs with INFO filtered out, with INFO records written by a
+synchronous FileHandler on the calling thread (what importing the manager
+used to set up), and with the QueueHandler/QueueListener pipeline from
+logging_config, creating leaner records. For the pipeline it
+reports the time the parking thread spends and the time until the listener
+has written everything out. On a single core the listener competes with the
+parking thread, so the second figure is the one to compare there.
+
+It also times a single filtered log call with an f-string message against
+the same call with lazy %-style arguments.
+
+Usage (from the src directory):
+    python benchmarks/bench_logging.py [--vehicles N] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+from typing import Callable, List, Optional
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ParkingManager import ParkingLotManagerImpl
+from logging_config import LOG_FORMAT, configure_logging, stop_logging
+from models import ParkingLevelData, ParkingLotData, ParkingSlotData, SlotType, VehicleData
+from Vehicle import VehicleType
+
+COLORS = ["Red", "Blue", "White", "Black", "Silver"]
+
+
+def make_lot(name: str, slots: int) -> ParkingLotData:
+    """Build a one-level lot with the given number of regular slots."""
+    level = ParkingLevelData(level=1, slots=[
+        ParkingSlotData(slot_number=i + 1, is_occupied=False, slot_type=SlotType.REGULAR) for i in range(slots)
+    ])
+    return ParkingLotData(name=name, levels=[level])
+
+
+def make_vehicles(count: int) -> List[VehicleData]:
+    """Build count regular cars with distinct registrations."""
+    return [
+        VehicleData(f"REG{i}", "Toyota", "Camry", COLORS[i % len(COLORS)], False, False, VehicleType.CAR)
+        for i in range(count)
+    ]
+
+
+def time_operations(vehicles: List[VehicleData], drain: Optional[Callable[[], None]] = None) -> List[float]:
+    """Park and then remove every vehicle in a fresh manager
+
+    Args:
+        vehicles: The vehicles to park
+        drain: Called after the loop, e.g. to wait for queued records to be written
+
+    Returns:
+        Seconds spent in the loop, and seconds until drain returned
+    """
+    manager = ParkingLotManagerImpl()
+    manager.create_lot(make_lot("Main", len(vehicles)))
+    start = time.perf_counter()
+    for vehicle in vehicles:
+        manager.park_vehicle("Main", 1, vehicle)
+    for slot in range(1, len(vehicles) + 1):
+        manager.remove_vehicle("Main", 1, slot)
+    loop = time.perf_counter() - start
+    if drain is not None:
+        drain()
+    return [loop, time.perf_counter() - start]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vehicles", type=int, default=20_000, help="vehicles to park and remove per run")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per configuration")
+    args = parser.parse_args()
+
+    vehicles = make_vehicles(args.vehicles)
+    operations = 2 * args.vehicles
+    root = logging.getLogger()
+    directory = tempfile.mkdtemp(prefix="parking-bench-")
+    try:
+        results = {"INFO filtered out": [], "synchronous FileHandler": [], "queue, parking thread": [],
+                   "queue, until written": []}
+        for run in range(args.repeat):
+            root.setLevel(logging.WARNING)
+            results["INFO filtered out"].append(time_operations(vehicles)[0])
+
+            # The handler basicConfig used to attach at import, minus the console
+            handler = logging.FileHandler(os.path.join(directory, f"sync-{run}.log"))
+            handler.setFormatter(logging.Formatter(LOG_FORMAT))
+            root.addHandler(handler)
+            root.setLevel(logging.INFO)
+            results["synchronous FileHandler"].append(time_operations(vehicles)[0])
+            root.removeHandler(handler)
+            handler.close()
+
+            configure_logging(log_file=os.path.join(directory, f"queue-{run}.log"), console=False,
+                              lean_records=True)
+            loop, total = time_operations(vehicles, drain=stop_logging)
+            results["queue, parking thread"].append(loop)
+            results["queue, until written"].append(total)
+
+        baseline = statistics.median(results["INFO filtered out"])
+        print(f"park + remove x{args.vehicles:,}, microseconds per operation (median of {args.repeat})")
+        for label, times in results.items():
+            elapsed = statistics.median(times)
+            print(f"  {label + ':':<28}{elapsed / operations * 1e6:>8.2f}  ({(elapsed / baseline - 1) * 100:+.1f}%)")
+
+        root.setLevel(logging.WARNING)
+        logger = logging.getLogger("bench")
+        registration, slot = "REG1", 42
+        number = 1_000_000
+        eager = min(timeit.repeat(lambda: logger.info(f"Parked vehicle {registration} in slot {slot}"),
+                                  number=number, repeat=3))
+        lazy = min(timeit.repeat(lambda: logger.info("Parked vehicle %s in slot %s", registration, slot),
+                                 number=number, repeat=3))
+        print("filtered logger.info call, nanoseconds")
+        print(f"  {'f-string message:':<28}{eager / number * 1e9:>8.0f}")
+        print(f"  {'%-style arguments:':<28}{lazy / number * 1e9:>8.0f}")
+    finally:
+        stop_logging()
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
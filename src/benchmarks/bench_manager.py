@@ -0,0 +1,500 @@
+"""
+Headless workload benchmark for the Parking Management System
+
+This script drives ParkingLotManagerImpl directly, with no UI, at several
+sizes (10^3 to 10^6 slots by default). Each scenario spreads its slots over
+several lots and levels, fills them to a target occupancy with park_many,
+then runs a seeded random mix of park, remove and search calls, timing each
+call. It reports ops/sec and p50/p99 latency per operation and for the
+whole mix.
+
+With --mode memory it instead measures memory with tracemalloc. Each
+size is built through create_lot with both level storage layouts, first
+empty and then fully occupied, and the script reports peak and
+steady-state memory, bytes per slot and bytes per parked vehicle, and a
+breakdown of what the manager holds by object kind (ParkingSlotData,
+VehicleData, strings, level lists, index containers and so on).
+
+Results can be written to a JSON file and compared against a stored
+baseline: an operation regresses when its ops/sec falls, or its p50
+latency rises, by more than the threshold; a memory scenario regresses
+when its bytes per slot or per vehicle grow by more than the threshold.
+The script exits with status 1 if anything regressed, so it can gate a
+CI job.
+
+Usage (from the src directory):
+    python benchmarks/bench_manager.py [--mode throughput|memory] [--sizes 1000,10000,100000,1000000]
+        [--ops N] [--output results.json] [--baseline baseline.json] [--threshold 0.15]
+
+Typical workflow:
+    python benchmarks/bench_manager.py --output baseline.json     # on main
+    python benchmarks/bench_manager.py --baseline baseline.json   # on a branch
+"""
+
+import argparse
+import enum
+import gc
+import json
+import logging
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import types
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ParkingManager import ParkingLotManagerImpl
+from models import ParkingLevelData, ParkingLotData, ParkingSlotData, SearchCriteria, SlotType, VehicleData
+from Vehicle import VehicleType
+
+COLORS = ["Red", "Blue", "White", "Black", "Silver", "Grey", "Green", "Yellow"]
+MANUFACTURERS = ["Toyota", "Honda", "Ford", "Tesla", "BMW", "Kia", "Volvo", "Fiat"]
+MODELS = [f"Model-{i}" for i in range(50)]
+VEHICLE_TYPES = [VehicleType.CAR, VehicleType.CAR, VehicleType.CAR, VehicleType.TRUCK, VehicleType.MOTORCYCLE]
+
+# Operation kinds, in report order
+OPERATIONS = ("park", "remove", "search")
+
+# Object kinds in the memory breakdown; objects of any other type count as "other"
+MEMORY_KINDS = {
+    ParkingSlotData: "ParkingSlotData",
+    VehicleData: "VehicleData",
+    str: "strings",
+    list: "level lists",
+    bytearray: "level columns",
+    array: "level columns",
+    tuple: "location tuples",
+    set: "index sets",
+    dict: "dicts",
+    int: "numbers",
+    float: "numbers",
+}
+
+# Objects that belong to the process rather than to a manager
+SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, enum.Enum)
+
+# Location of a parked vehicle: (lot name, level, slot number)
+Location = Tuple[str, int, int]
+
+
+def make_lot_data(name: str, levels: int, slots_per_level: int, electric_share: float) -> ParkingLotData:
+    """Build lot data with the given number of levels and slots per level."""
+    electric = int(slots_per_level * electric_share)
+    regular = slots_per_level - electric
+    return ParkingLotData(name=name, levels=[
+        ParkingLevelData(level=level, slots=[
+            ParkingSlotData(slot_number=i + 1, is_occupied=False,
+                            slot_type=SlotType.REGULAR if i < regular else SlotType.ELECTRIC)
+            for i in range(slots_per_level)
+        ])
+        for level in range(1, levels + 1)
+    ])
+
+
+class Workload:
+    """Seeded generator of vehicles and operations for one scenario
+
+    Tracks where its vehicles are parked so that removals and registration
+    searches always target a parked vehicle.
+    """
+
+    def __init__(self, lots: List[str], levels: int, electric_share: float, seed: int):
+        """Initialize the workload
+
+        Args:
+            lots: Names of the lots to use
+            levels: Number of levels in each lot
+            electric_share: Fraction of vehicles that are electric
+            seed: Seed for the random generator
+        """
+        self.lots = lots
+        self.levels = levels
+        self.electric_share = electric_share
+        self.random = random.Random(seed)
+        self.counter = 0
+        # Parked locations and their registrations, in a list so a random one can be popped in O(1)
+        self.parked: List[Tuple[Location, str]] = []
+
+    def vehicle(self, electric: Optional[bool] = None) -> VehicleData:
+        """Build a new vehicle with a unique registration number
+
+        Args:
+            electric: Whether the vehicle is electric; random when None
+        """
+        self.counter += 1
+        choice = self.random.choice
+        vehicle_type = choice(VEHICLE_TYPES)
+        if electric is None:
+            electric = self.random.random() < self.electric_share
+        return VehicleData(
+            registration_number=f"BENCH{self.counter:07d}",
+            manufacturer=choice(MANUFACTURERS),
+            model=choice(MODELS),
+            color=choice(COLORS),
+            is_electric=electric,
+            is_motorcycle=vehicle_type == VehicleType.MOTORCYCLE,
+            vehicle_type=vehicle_type,
+            current_battery_charge=50.0
+        )
+
+    def target(self) -> Tuple[str, int]:
+        """Pick a random lot and level."""
+        return self.random.choice(self.lots), self.random.randint(1, self.levels)
+
+    def take_parked(self) -> Optional[Location]:
+        """Remove and return a random parked location, or None if nothing is parked."""
+        if not self.parked:
+            return None
+        index = self.random.randrange(len(self.parked))
+        self.parked[index], self.parked[-1] = self.parked[-1], self.parked[index]
+        return self.parked.pop()[0]
+
+    def search_criteria(self) -> Tuple[Optional[str], SearchCriteria]:
+        """Pick a search: half registration lookups, half attribute searches in one lot."""
+        if self.parked and self.random.random() < 0.5:
+            registration_number = self.random.choice(self.parked)[1]
+            return None, SearchCriteria(registration_number=registration_number)
+        return self.random.choice(self.lots), SearchCriteria(
+            color=self.random.choice(COLORS), model=self.random.choice(MODELS)
+        )
+
+
+def percentile(sorted_values: List[int], fraction: float) -> int:
+    """Nearest-rank percentile of an ascending list."""
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def summarize(latencies: List[int]) -> Dict[str, float]:
+    """Turn per-call latencies in nanoseconds into ops/sec and p50/p99 in microseconds."""
+    if not latencies:
+        return {"count": 0, "ops_per_sec": 0.0, "p50_us": 0.0, "p99_us": 0.0}
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "ops_per_sec": len(ordered) / (sum(ordered) / 1e9),
+        "p50_us": percentile(ordered, 0.50) / 1e3,
+        "p99_us": percentile(ordered, 0.99) / 1e3,
+    }
+
+
+def run_scenario(slots: int, lots: int, levels: int, ops: int, mix: Dict[str, float], occupancy: float,
+                 electric_share: float, seed: int) -> Dict[str, Any]:
+    """Build one scenario, prefill it and time the operation mix
+
+    Returns:
+        The scenario's settings, setup times and per-operation summaries
+    """
+    slots_per_level = max(1, slots // (lots * levels))
+    lot_names = [f"Lot{index}" for index in range(lots)]
+    manager = ParkingLotManagerImpl()
+    workload = Workload(lot_names, levels, electric_share, seed)
+
+    start = time.perf_counter()
+    for name in lot_names:
+        manager.create_lot(make_lot_data(name, levels, slots_per_level, electric_share))
+    create_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    per_level = int(slots_per_level * occupancy)
+    for name in lot_names:
+        for level in range(1, levels + 1):
+            vehicles = [workload.vehicle() for _ in range(per_level)]
+            for vehicle, slot in zip(vehicles, manager.park_many(name, level, vehicles)):
+                if slot is not None:
+                    workload.parked.append(((name, level, slot), vehicle.registration_number))
+    prefill_seconds = time.perf_counter() - start
+
+    latencies: Dict[str, List[int]] = {operation: [] for operation in OPERATIONS}
+    kinds = workload.random.choices(list(mix), weights=list(mix.values()), k=ops)
+    clock = time.perf_counter_ns
+    wall_start = time.perf_counter()
+    for kind in kinds:
+        location = workload.take_parked() if kind == "remove" else None
+        if kind == "remove" and location is not None:
+            start_ns = clock()
+            manager.remove_vehicle(*location)
+            latencies["remove"].append(clock() - start_ns)
+        elif kind == "search":
+            lot_name, criteria = workload.search_criteria()
+            start_ns = clock()
+            manager.search_vehicles(lot_name, criteria)
+            latencies["search"].append(clock() - start_ns)
+        else:
+            # Parks, and removes when nothing is left to remove
+            lot_name, level = workload.target()
+            vehicle = workload.vehicle()
+            start_ns = clock()
+            slot = manager.park_vehicle(lot_name, level, vehicle)
+            latencies["park"].append(clock() - start_ns)
+            if slot is not None:
+                workload.parked.append(((lot_name, level, slot), vehicle.registration_number))
+    wall_seconds = time.perf_counter() - wall_start
+
+    everything = [latency for values in latencies.values() for latency in values]
+    operations = {operation: summarize(values) for operation, values in latencies.items()}
+    operations["mixed"] = dict(summarize(everything), ops_per_sec=len(everything) / wall_seconds)
+    return {
+        "slots": slots_per_level * lots * levels,
+        "lots": lots,
+        "levels": levels,
+        "prefilled": len(workload.parked),
+        "create_seconds": create_seconds,
+        "prefill_seconds": prefill_seconds,
+        "operations": operations,
+    }
+
+
+def memory_breakdown(root: Any) -> Dict[str, Dict[str, int]]:
+    """Count and size the objects reachable from root, by kind
+
+    Classes, modules, functions and enum members are shared with the rest
+    of the process, so they are neither counted nor followed.
+
+    Returns:
+        Kind -> {"count": objects, "bytes": sys.getsizeof total}
+    """
+    totals: Dict[str, Dict[str, int]] = {}
+    seen = set()
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if isinstance(obj, SHARED_TYPES):
+            continue
+        entry = totals.setdefault(MEMORY_KINDS.get(type(obj), "other"), {"count": 0, "bytes": 0})
+        entry["count"] += 1
+        entry["bytes"] += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return totals
+
+
+def run_memory_scenario(slots: int, lots: int, levels: int, electric_share: float, columnar: bool,
+                        seed: int, batch: int = 1000) -> Dict[str, Any]:
+    """Build one scenario under tracemalloc, empty and then fully occupied
+
+    Lots are created through create_lot and filled with park_many in batches,
+    so the caller only ever holds one batch of its own vehicle objects.
+
+    Returns:
+        The scenario's settings, peak and steady-state traced bytes, bytes per
+        slot and per parked vehicle, and a breakdown of the full manager
+    """
+    slots_per_level = max(1, slots // (lots * levels))
+    electric = int(slots_per_level * electric_share)
+    regular = slots_per_level - electric
+    lot_names = [f"Lot{index}" for index in range(lots)]
+    workload = Workload(lot_names, levels, electric_share, seed)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        manager = ParkingLotManagerImpl(columnar_levels=columnar)
+        for name in lot_names:
+            manager.create_lot(make_lot_data(name, levels, slots_per_level, electric_share))
+        gc.collect()
+        empty_bytes, empty_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+
+        vehicles = 0
+        for name in lot_names:
+            for level in range(1, levels + 1):
+                for is_electric, count in ((False, regular), (True, electric)):
+                    for start in range(0, count, batch):
+                        parked = manager.park_many(name, level, [
+                            workload.vehicle(is_electric) for _ in range(min(batch, count - start))
+                        ])
+                        vehicles += sum(1 for slot in parked if slot is not None)
+        gc.collect()
+        full_bytes, full_peak = tracemalloc.get_traced_memory()
+        breakdown = memory_breakdown(manager)
+    finally:
+        tracemalloc.stop()
+
+    total_slots = slots_per_level * lots * levels
+    return {
+        "slots": total_slots,
+        "lots": lots,
+        "levels": levels,
+        "storage": "columnar" if columnar else "slot-list",
+        "vehicles": vehicles,
+        "memory": {
+            "empty_bytes": empty_bytes,
+            "empty_peak_bytes": empty_peak,
+            "full_bytes": full_bytes,
+            "full_peak_bytes": full_peak,
+            "bytes_per_slot": empty_bytes / total_slots,
+            "bytes_per_vehicle": (full_bytes - empty_bytes) / vehicles if vehicles else 0.0,
+            "breakdown": breakdown,
+        },
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Compare results against a baseline
+
+    Args:
+        results: Results of this run
+        baseline: Results loaded from the baseline file
+        threshold: Allowed fractional change, e.g. 0.15 for 15%
+
+    Returns:
+        One message per regression: ops/sec lower, or p50 latency or bytes
+        per slot or vehicle higher, than the baseline by more than the threshold
+    """
+    regressions = []
+    for name, scenario in results["scenarios"].items():
+        base_scenario = baseline.get("scenarios", {}).get(name)
+        if base_scenario is None:
+            continue
+        if "memory" in scenario:
+            for metric in ("bytes_per_slot", "bytes_per_vehicle"):
+                value, base = scenario["memory"][metric], base_scenario.get("memory", {}).get(metric)
+                if base and value > base * (1 + threshold):
+                    regressions.append(f"{name} {metric}: {value:,.1f}, baseline {base:,.1f}")
+            continue
+        for operation, summary in scenario["operations"].items():
+            base = base_scenario["operations"].get(operation)
+            if not base or not base["count"] or not summary["count"]:
+                continue
+            if summary["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+                regressions.append(f"{name} {operation}: {summary['ops_per_sec']:,.0f} ops/sec, "
+                                   f"baseline {base['ops_per_sec']:,.0f}")
+            if summary["p50_us"] > base["p50_us"] * (1 + threshold):
+                regressions.append(f"{name} {operation}: p50 {summary['p50_us']:.1f}us, "
+                                   f"baseline {base['p50_us']:.1f}us")
+    return regressions
+
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Parse an operation mix such as "park=45,remove=45,search=10"."""
+    mix = {}
+    for part in text.split(","):
+        operation, _, weight = part.partition("=")
+        if operation not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {operation!r}; expected one of {OPERATIONS}")
+        mix[operation] = float(weight)
+    return mix
+
+
+def print_scenario(name: str, scenario: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    """Print one scenario's results, with the change from the baseline if there is one."""
+    print(f"\n{name}: {scenario['slots']:,} slots in {scenario['lots']} lots x {scenario['levels']} levels, "
+          f"{scenario['prefilled']:,} parked after the run; create {scenario['create_seconds']:.2f}s, "
+          f"prefill {scenario['prefill_seconds']:.2f}s")
+    print(f"  {'operation':<9} {'count':>7} {'ops/sec':>11} {'p50 us':>9} {'p99 us':>9} {'vs baseline':>12}")
+    base_operations = (baseline or {}).get("scenarios", {}).get(name, {}).get("operations", {})
+    for operation, summary in scenario["operations"].items():
+        change = ""
+        base = base_operations.get(operation)
+        if base and base["ops_per_sec"] and summary["count"]:
+            change = f"{(summary['ops_per_sec'] / base['ops_per_sec'] - 1) * 100:+.1f}%"
+        print(f"  {operation:<9} {summary['count']:>7,} {summary['ops_per_sec']:>11,.0f} "
+              f"{summary['p50_us']:>9.1f} {summary['p99_us']:>9.1f} {change:>12}")
+
+
+def print_memory_scenario(name: str, scenario: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> None:
+    """Print one memory scenario's results, with the change from the baseline if there is one."""
+    memory = scenario["memory"]
+    base = (baseline or {}).get("scenarios", {}).get(name, {}).get("memory", {})
+
+    def change(metric: str) -> str:
+        return f" ({(memory[metric] / base[metric] - 1) * 100:+.1f}% vs baseline)" if base.get(metric) else ""
+
+    mib = 1024 * 1024
+    print(f"\n{name}: {scenario['slots']:,} slots in {scenario['lots']} lots x {scenario['levels']} levels, "
+          f"{scenario['vehicles']:,} vehicles parked")
+    print(f"  empty: {memory['empty_bytes'] / mib:,.1f} MiB steady, {memory['empty_peak_bytes'] / mib:,.1f} MiB peak; "
+          f"{memory['bytes_per_slot']:,.1f} bytes per slot{change('bytes_per_slot')}")
+    print(f"  full:  {memory['full_bytes'] / mib:,.1f} MiB steady, {memory['full_peak_bytes'] / mib:,.1f} MiB peak; "
+          f"{memory['bytes_per_vehicle']:,.1f} bytes per vehicle{change('bytes_per_vehicle')}")
+    print(f"  {'kind':<18} {'objects':>10} {'MiB':>9} {'share':>7}")
+    attributed = 0
+    for kind, entry in sorted(memory["breakdown"].items(), key=lambda item: -item[1]["bytes"]):
+        attributed += entry["bytes"]
+        print(f"  {kind:<18} {entry['count']:>10,} {entry['bytes'] / mib:>9,.1f} "
+              f"{entry['bytes'] / memory['full_bytes']:>7.1%}")
+    unattributed = memory["full_bytes"] - attributed
+    print(f"  {'unattributed':<18} {'':>10} {unattributed / mib:>9,.1f} {unattributed / memory['full_bytes']:>7.1%}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("throughput", "memory"), default="throughput",
+                        help="time an operation mix, or measure memory with tracemalloc")
+    parser.add_argument("--sizes", help="comma-separated total slot counts "
+                                        "(default 1000,10000,100000,1000000; 200000 in memory mode)")
+    parser.add_argument("--storage", default="slot-list,columnar",
+                        help="level storage layouts to measure in memory mode: slot-list, columnar or both")
+    parser.add_argument("--lots", type=int, default=4, help="lots per scenario")
+    parser.add_argument("--levels", type=int, default=3, help="levels per lot")
+    parser.add_argument("--ops", type=int, default=20_000, help="timed operations per scenario")
+    parser.add_argument("--mix", type=parse_mix, default="park=45,remove=45,search=10",
+                        help="operation weights, e.g. park=45,remove=45,search=10")
+    parser.add_argument("--occupancy", type=float, default=0.5, help="fraction of slots filled before timing")
+    parser.add_argument("--electric-share", type=float, default=0.1, help="fraction of electric slots and vehicles")
+    parser.add_argument("--seed", type=int, default=1, help="random seed")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="compare against results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="allowed fractional slowdown before a change counts as a regression")
+    args = parser.parse_args()
+
+    # Keep per-operation log records (including expected "no slot" errors) out of the run
+    logging.getLogger().setLevel(logging.CRITICAL)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results: Dict[str, Any] = {
+        "mode": args.mode,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "ops": args.ops, "mix": args.mix, "occupancy": args.occupancy,
+            "electric_share": args.electric_share, "seed": args.seed,
+        },
+        "scenarios": {},
+    }
+    sizes = args.sizes or ("200000" if args.mode == "memory" else "1000,10000,100000,1000000")
+    for size in (int(size) for size in sizes.split(",")):
+        if args.mode == "memory":
+            for storage in args.storage.split(","):
+                name = f"slots={size} {storage}"
+                scenario = run_memory_scenario(size, args.lots, args.levels, args.electric_share,
+                                               storage == "columnar", args.seed)
+                results["scenarios"][name] = scenario
+                print_memory_scenario(name, scenario, baseline)
+            continue
+        name = f"slots={size}"
+        scenario = run_scenario(size, args.lots, args.levels, args.ops, args.mix, args.occupancy,
+                                args.electric_share, args.seed)
+        results["scenarios"][name] = scenario
+        print_scenario(name, scenario, baseline)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nWrote {args.output}")
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for message in regressions:
+                print(f"  {message}")
+            sys.exit(1)
+        print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Model footprint benchmark for the Parking Management System
+
+This script compares the slotted Vehicle, VehicleData, ParkingSlotData and
+SearchResult classes against equivalent plain dataclasses with a per-instance
+__dict__, reporting memory per instance and construction time.
+
+Usage (from the src directory):
+    python benchmarks/bench_models.py [--count N]
+"""
+
+import argparse
+import dataclasses
+import os
+import sys
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Vehicle import Vehicle, VehicleType
+from models import ParkingSlotData, SearchResult, SlotType, VehicleData
+
+
+def dict_twin(cls: type) -> type:
+    """Build a plain (non-slotted) dataclass with the same fields as cls."""
+    fields: List[Tuple[str, Any, Any]] = []
+    for field in dataclasses.fields(cls):
+        if field.default is not dataclasses.MISSING:
+            fields.append((field.name, field.type, dataclasses.field(default=field.default)))
+        else:
+            fields.append((field.name, field.type, dataclasses.field()))
+    namespace: Dict[str, Any] = {}
+    post_init = getattr(cls, "__post_init__", None)
+    if post_init is not None:
+        namespace["__post_init__"] = post_init
+    return dataclasses.make_dataclass(cls.__name__ + "Dict", fields, namespace=namespace)
+
+
+def measure(factory: Callable[[int], Any], count: int) -> Tuple[float, float]:
+    """Measure bytes per instance and microseconds per construction.
+
+    Args:
+        factory: Builds one instance from an integer seed
+        count: Number of instances to build
+
+    Returns:
+        (bytes per instance, microseconds per construction)
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The list holding the instances is not part of the per-instance cost
+    per_instance = (after - before - sys.getsizeof(instances)) / count
+    del instances
+
+    seconds = min(timeit.repeat(lambda: factory(1), number=count, repeat=7))
+    return per_instance, seconds / count * 1e6
+
+
+def scenarios() -> List[Tuple[str, type, Callable[[type], Callable[[int], Any]]]]:
+    """The classes to compare, with a factory builder for each."""
+    # Strings are shared across instances so the numbers show object overhead only
+    def vehicle(cls: type) -> Callable[[int], Any]:
+        return lambda i: cls("ABC123", "Toyota", "Camry", "Red", VehicleType.CAR, False)
+
+    def vehicle_data(cls: type) -> Callable[[int], Any]:
+        return lambda i: cls("ABC123", "Toyota", "Camry", "Red", False, False, VehicleType.CAR)
+
+    def slot_data(cls: type) -> Callable[[int], Any]:
+        return lambda i: cls(slot_number=i, is_occupied=False, slot_type=SlotType.REGULAR)
+
+    record = VehicleData("ABC123", "Toyota", "Camry", "Red", False, False, VehicleType.CAR)
+
+    def search_result(cls: type) -> Callable[[int], Any]:
+        return lambda i: cls("Downtown", 1, i, record)
+
+    return [
+        ("Vehicle", Vehicle, vehicle),
+        ("VehicleData", VehicleData, vehicle_data),
+        ("ParkingSlotData", ParkingSlotData, slot_data),
+        ("SearchResult", SearchResult, search_result),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100_000, help="instances to build per class")
+    args = parser.parse_args()
+
+    print(f"{'class':<16} {'dict B/obj':>11} {'slots B/obj':>12} {'dict us':>8} {'slots us':>9}")
+    for name, cls, builder in scenarios():
+        dict_bytes, dict_us = measure(builder(dict_twin(cls)), args.count)
+        slot_bytes, slot_us = measure(builder(cls), args.count)
+        print(f"{name:<16} {dict_bytes:>11.0f} {slot_bytes:>12.0f} {dict_us:>8.3f} {slot_us:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
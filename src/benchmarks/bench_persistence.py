@@ -0,0 +1,128 @@
+"""
+Persistence benchmark for the Parking Management System
+
+This script measures what journaling costs and how long a restart takes.
+Parks are timed with no journal, with a JournalWriter whose flusher is held
+back (the cost on the park path itself), and with a normally flushing
+JournalWriter, alternating runs and reporting the median. The flusher's
+encoding shares the GIL with the parking thread, so on a machine with a
+single core its work shows up in the last figure too. Recovery is timed
+twice for the same state: by replaying the journal, and by loading a snapshot.
+
+Usage (from the src directory):
+    python benchmarks/bench_persistence.py [--vehicles N] [--repeat N]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ParkingManager import ParkingLotManagerImpl
+from persistence import JournalWriter, ParkingStore
+from models import ParkingLevelData, ParkingLotData, ParkingSlotData, SlotType, VehicleData
+from Vehicle import VehicleType
+
+COLORS = ["Red", "Blue", "White", "Black", "Silver"]
+
+
+def make_lot(name: str, slots: int) -> ParkingLotData:
+    """Build a one-level lot with the given number of regular slots."""
+    level = ParkingLevelData(level=1, slots=[
+        ParkingSlotData(slot_number=i + 1, is_occupied=False, slot_type=SlotType.REGULAR) for i in range(slots)
+    ])
+    return ParkingLotData(name=name, levels=[level])
+
+
+def make_vehicles(count: int) -> List[VehicleData]:
+    """Build count regular cars with distinct registrations."""
+    return [
+        VehicleData(f"REG{i}", "Toyota", "Camry", COLORS[i % len(COLORS)], False, False, VehicleType.CAR)
+        for i in range(count)
+    ]
+
+
+def time_parks(vehicles: List[VehicleData], journal: Optional[JournalWriter]) -> float:
+    """Park every vehicle in a fresh manager and return the elapsed seconds."""
+    manager = ParkingLotManagerImpl(journal=journal)
+    manager.create_lot(make_lot("Main", len(vehicles)))
+    start = time.perf_counter()
+    for vehicle in vehicles:
+        manager.park_vehicle("Main", 1, vehicle)
+    return time.perf_counter() - start
+
+
+def time_open(directory: str) -> float:
+    """Open a store on directory and return the seconds taken to restore it."""
+    start = time.perf_counter()
+    store = ParkingStore(directory, snapshot_every=None)
+    store.open()
+    elapsed = time.perf_counter() - start
+    store.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--vehicles", type=int, default=100_000, help="vehicles to park")
+    parser.add_argument("--repeat", type=int, default=5, help="timed park runs per configuration")
+    args = parser.parse_args()
+
+    # Keep per-operation log records out of the run
+    logging.getLogger().setLevel(logging.CRITICAL)
+    vehicles = make_vehicles(args.vehicles)
+    directory = tempfile.mkdtemp(prefix="parking-bench-")
+    try:
+        plain, queued, flushed, journaled = [], [], [], []
+        for run in range(args.repeat):
+            plain.append(time_parks(vehicles, None))
+
+            # Flush only at the end, so the park loop pays for queueing alone
+            journal = JournalWriter(os.path.join(directory, f"park-{run}.log"),
+                                    group_size=len(vehicles) + 1, flush_interval=3600)
+            queued.append(time_parks(vehicles, journal))
+            start = time.perf_counter()
+            journal.close()
+            flushed.append(time.perf_counter() - start)
+            os.remove(journal.path)
+
+            journal = JournalWriter(os.path.join(directory, f"park-{run}.log"))
+            journaled.append(time_parks(vehicles, journal))
+            journal.close()
+            os.remove(journal.path)
+        plain_time = statistics.median(plain)
+        print(f"park x{args.vehicles:,}, {'no journal:':<26}{plain_time:.3f}s")
+        for label, times in (("journal, park path only", queued), ("journal, flushing", journaled)):
+            elapsed = statistics.median(times)
+            print(f"park x{args.vehicles:,}, {label + ':':<26}{elapsed:.3f}s ({(elapsed / plain_time - 1) * 100:+.1f}%)")
+        print(f"journal flush: {statistics.median(flushed) / len(vehicles) * 1e6:.2f} us per record")
+
+        store = ParkingStore(directory, snapshot_every=None)
+        manager = store.open()
+        manager.create_lot(make_lot("Main", len(vehicles)))
+        for vehicle in vehicles:
+            manager.park_vehicle("Main", 1, vehicle)
+        store.close()
+        print(f"restore {args.vehicles:,} vehicles from journal: {time_open(directory):.3f}s")
+
+        store = ParkingStore(directory, snapshot_every=None)
+        store.open()
+        start = time.perf_counter()
+        path = store.snapshot()
+        print(f"snapshot: {time.perf_counter() - start:.3f}s, {os.path.getsize(path):,} bytes")
+        store.close()
+        print(f"restore {args.vehicles:,} vehicles from snapshot: {time_open(directory):.3f}s")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
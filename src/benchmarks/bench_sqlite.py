@@ -0,0 +1,136 @@
+"""
+SQLite backend benchmark for the Parking Management System
+
+This script runs the same workload against the in-memory
+ParkingLotManagerImpl and the SQLiteParkingLotManager (both an in-memory
+database and a WAL-mode database file) and prints the time per operation:
+creating a lot, parking one vehicle at a time, parking in batches with
+park_many, attribute searches, registration lookups and removals.
+
+Usage (from the src directory):
+    python benchmarks/bench_sqlite.py [--slots N] [--batch N] [--searches N]
+"""
+
+import argparse
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ParkingManager import ParkingLotManagerImpl
+from sqlite_manager import SQLiteParkingLotManager
+from interfaces import ParkingLotManager
+from models import ParkingLevelData, ParkingLotData, ParkingSlotData, SearchCriteria, SlotType, VehicleData
+from Vehicle import VehicleType
+
+COLORS = ["Red", "Blue", "White", "Black", "Silver"]
+MANUFACTURERS = ["Toyota", "Honda", "Ford", "Tesla"]
+
+
+def make_lot(name: str, slots: int) -> ParkingLotData:
+    """Build a one-level lot with the given number of regular slots."""
+    level = ParkingLevelData(level=1, slots=[
+        ParkingSlotData(slot_number=i + 1, is_occupied=False, slot_type=SlotType.REGULAR) for i in range(slots)
+    ])
+    return ParkingLotData(name=name, levels=[level])
+
+
+def make_vehicles(prefix: str, count: int) -> List[VehicleData]:
+    """Build count regular cars with distinct registrations."""
+    return [
+        VehicleData(f"{prefix}{i}", MANUFACTURERS[i % len(MANUFACTURERS)], "Model",
+                    COLORS[i % len(COLORS)], False, False, VehicleType.CAR)
+        for i in range(count)
+    ]
+
+
+def run(manager: ParkingLotManager, slots: int, batch: int, searches: int) -> Dict[str, float]:
+    """Run the workload and return microseconds per operation for each step."""
+    timings: Dict[str, float] = {}
+
+    def timed(label: str, count: int, step: Callable[[], None]) -> None:
+        start = time.perf_counter()
+        step()
+        timings[label] = (time.perf_counter() - start) / count * 1e6
+
+    half = slots // 2
+    singles = make_vehicles("S", half)
+    batched = make_vehicles("B", slots - half)
+
+    timed("create_lot (per slot)", slots, lambda: manager.create_lot(make_lot("Main", slots)))
+
+    def park_singles() -> None:
+        for vehicle in singles:
+            manager.park_vehicle("Main", 1, vehicle)
+    timed("park_vehicle", len(singles), park_singles)
+
+    def park_batches() -> None:
+        for start in range(0, len(batched), batch):
+            manager.park_many("Main", 1, batched[start:start + batch])
+    timed(f"park_many (per vehicle, batch {batch})", len(batched), park_batches)
+
+    def search() -> None:
+        for i in range(searches):
+            manager.search_vehicles(None, SearchCriteria(color=COLORS[i % len(COLORS)],
+                                                         manufacturer=MANUFACTURERS[i % len(MANUFACTURERS)]))
+    timed(f"search_vehicles (~{slots // 20:,} hits)", searches, search)
+
+    def find() -> None:
+        for vehicle in singles[:searches * 100]:
+            manager.find_vehicle(vehicle.registration_number)
+    timed("find_vehicle", min(len(singles), searches * 100), find)
+
+    def remove() -> None:
+        for slot in range(1, half + 1):
+            manager.remove_vehicle("Main", 1, slot)
+    timed("remove_vehicle", half, remove)
+
+    locations = [("Main", 1, slot) for slot in range(half + 1, slots + 1)]
+
+    def remove_batches() -> None:
+        for start in range(0, len(locations), batch):
+            manager.remove_many(locations[start:start + batch])
+    timed(f"remove_many (per vehicle, batch {batch})", len(locations), remove_batches)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slots", type=int, default=20_000, help="slots in the lot")
+    parser.add_argument("--batch", type=int, default=500, help="vehicles per park_many/remove_many call")
+    parser.add_argument("--searches", type=int, default=20, help="attribute searches to run")
+    args = parser.parse_args()
+
+    # Keep per-operation log records out of the run
+    logging.getLogger().setLevel(logging.CRITICAL)
+    directory = tempfile.mkdtemp(prefix="parking-bench-")
+    try:
+        backends: Dict[str, Callable[[], ParkingLotManager]] = {
+            "in-memory": ParkingLotManagerImpl,
+            "sqlite :memory:": SQLiteParkingLotManager,
+            "sqlite file (WAL)": lambda: SQLiteParkingLotManager(os.path.join(directory, "bench.db")),
+        }
+        results = {}
+        for name, factory in backends.items():
+            manager = factory()
+            results[name] = run(manager, args.slots, args.batch, args.searches)
+            if isinstance(manager, SQLiteParkingLotManager):
+                manager.close()
+    finally:
+        shutil.rmtree(directory)
+
+    names = list(results)
+    print(f"{args.slots:,} slots, microseconds per operation")
+    print(f"{'operation':<40}" + "".join(f"{name:>20}" for name in names))
+    for label in results[names[0]]:
+        print(f"{label:<40}" + "".join(f"{results[name][label]:>20,.1f}" for name in names))
+
+
+if __name__ == "__main__":
+    main()
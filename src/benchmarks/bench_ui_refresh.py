@@ -0,0 +1,187 @@
+"""
+UI refresh benchmark for the Parking Management System
+
+This script measures whether ParkingLotUI keeps up with a steady stream
+of parks. A feeder thread parks vehicles through the UI's own manager at a
+fixed rate (1,000 per second by default). Each park notifies the UI from
+the feeder thread, so the UI has to hand the notification to the Tk thread,
+merge it with the others and refresh the widgets bound to the lot. The
+remove combos and the Lot Details view are pointed at the lot being filled,
+so every refresh does real work.
+
+While the feeder runs, a heartbeat scheduled on the Tk event loop every few
+milliseconds measures how late it fires, which is how long input and
+repainting would wait. The script reports the park rate achieved, the
+number and cost of refreshes, the heartbeat lag, and how long the UI took
+after the last park to show it. It exits with status 1 if the feeder fell
+behind, the lag exceeded the limit or the UI never caught up.
+
+Tk needs a display; without one the script exits with status 2. It has
+not yet been run on a machine with one, so whether the UI keeps up with
+1,000 parks per second is still unmeasured.
+
+Usage (from the src directory):
+    python benchmarks/bench_ui_refresh.py [--rate N] [--seconds N] [--slots N]
+        [--interval MS] [--max-lag MS]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+import tkinter as tk
+from typing import Dict, List, Optional
+
+# Add the parent directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import ParkingLevelData, ParkingLotData, ParkingSlotData, SlotType, VehicleData
+from ui_tasks import DEFAULT_REFRESH_INTERVAL_MS, RefreshDebouncer
+from Vehicle import VehicleType
+
+LOT_NAME = "Bench"
+HEARTBEAT_MS = 5
+
+
+def make_lot(slots: int) -> ParkingLotData:
+    """Build a one-level lot with the given number of regular slots."""
+    return ParkingLotData(name=LOT_NAME, levels=[ParkingLevelData(level=1, slots=[
+        ParkingSlotData(slot_number=i + 1, is_occupied=False, slot_type=SlotType.REGULAR) for i in range(slots)
+    ])])
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Get a percentile of some values by the nearest-rank method."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] if ordered else 0.0
+
+
+class Feeder(threading.Thread):
+    """Parks vehicles at a fixed rate and records how far it falls behind."""
+
+    def __init__(self, manager, rate: int, count: int):
+        super().__init__(name="bench-feeder", daemon=True)
+        self.manager = manager
+        self.rate = rate
+        self.count = count
+        self.parked = 0
+        self.elapsed = 0.0
+        self.finished_at: Optional[float] = None
+
+    def run(self) -> None:
+        start = time.perf_counter()
+        for i in range(self.count):
+            due = start + i / self.rate
+            delay = due - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            vehicle = VehicleData(f"BEN{i:06d}", "Toyota", "Camry", "Red", False, False, VehicleType.CAR)
+            self.manager.park_vehicle(LOT_NAME, 1, vehicle)
+            self.parked += 1
+        self.finished_at = time.perf_counter()
+        self.elapsed = self.finished_at - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=int, default=1_000, help="parks per second fed from the manager")
+    parser.add_argument("--seconds", type=float, default=5.0, help="how long to feed parks")
+    parser.add_argument("--slots", type=int, default=10_000, help="slots in the lot being filled")
+    parser.add_argument("--interval", type=int, default=None,
+                        help="refresh interval in milliseconds (default: the UI's own)")
+    parser.add_argument("--max-lag", type=float, default=100.0,
+                        help="largest acceptable p99 event-loop lag in milliseconds")
+    args = parser.parse_args()
+
+    count = int(args.rate * args.seconds)
+    if count > args.slots:
+        parser.error(f"--rate x --seconds ({count}) parks need at least that many --slots")
+
+    from ParkingLotUI import ParkingLotUI
+    try:
+        ui = ParkingLotUI()
+    except tk.TclError as e:
+        print(f"Cannot create the Tk window ({e}); this benchmark needs a display.")
+        sys.exit(2)
+    root = ui.main_window
+
+    # Time every refresh the UI makes
+    refresh_times: List[float] = []
+
+    def timed_refresh(changed) -> None:
+        start = time.perf_counter()
+        ui._refresh_lots(changed)
+        refresh_times.append(time.perf_counter() - start)
+    interval = DEFAULT_REFRESH_INTERVAL_MS if args.interval is None else args.interval
+    ui.refresher = RefreshDebouncer(root.after, timed_refresh, interval_ms=interval)
+
+    # Point the bound widgets at the lot so every refresh has work to do
+    ui.parking_manager.create_lot(make_lot(args.slots))
+    ui.refresher.flush()
+    ui.state_manager.remove_lot_value.set(LOT_NAME)
+    ui.state_manager.remove_level_value.set("1")
+    ui.state_manager.details_lot_name_value.set(LOT_NAME)
+    ui.state_manager.details_parking_level_value.set("1")
+    ui.state_manager.details_filter_value.set("All Slots")
+    ui._handle_show_details()
+    refresh_times.clear()
+
+    lags: List[float] = []
+    state: Dict[str, float] = {}
+    feeder = Feeder(ui.parking_manager, args.rate, count)
+
+    def heartbeat(expected: float) -> None:
+        now = time.perf_counter()
+        lags.append(max(0.0, now - expected))
+        if feeder.finished_at is not None and not ui.refresher.pending and not ui.tasks.busy:
+            # The UI has seen the last park once its slot shows in the remove combo
+            slots = ui.remove_slot_combo["values"]
+            if len(slots) == count:
+                state["caught_up"] = now - feeder.finished_at
+                root.quit()
+                return
+        if now - state["start"] > args.seconds * 4 + 5:
+            root.quit()
+            return
+        root.after(HEARTBEAT_MS, heartbeat, time.perf_counter() + HEARTBEAT_MS / 1000)
+
+    def begin() -> None:
+        state["start"] = time.perf_counter()
+        feeder.start()
+        heartbeat(time.perf_counter())
+
+    root.after(100, begin)
+    root.mainloop()
+    feeder.join(timeout=5)
+    ui.tasks.shutdown()
+    root.destroy()
+
+    achieved = feeder.parked / feeder.elapsed if feeder.elapsed else 0.0
+    caught_up = state.get("caught_up")
+    lag_p99 = percentile(lags, 0.99) * 1000
+    print(f"parks:       {feeder.parked:,} at {achieved:,.0f}/s (target {args.rate:,}/s, {args.slots:,} slots)")
+    print(f"refreshes:   {len(refresh_times):,}"
+          f" (one per {feeder.parked / max(1, len(refresh_times)):.1f} parks),"
+          f" median {statistics.median(refresh_times) * 1000 if refresh_times else 0:.2f} ms,"
+          f" max {max(refresh_times, default=0) * 1000:.2f} ms")
+    print(f"loop lag:    p50 {percentile(lags, 0.5) * 1000:.2f} ms, p99 {lag_p99:.2f} ms,"
+          f" max {max(lags, default=0) * 1000:.2f} ms")
+    print(f"caught up:   {'never' if caught_up is None else f'{caught_up * 1000:.1f} ms after the last park'}")
+
+    failures = []
+    if achieved < args.rate * 0.95:
+        failures.append("the feeder fell behind its rate")
+    if lag_p99 > args.max_lag:
+        failures.append(f"p99 event-loop lag above {args.max_lag:g} ms")
+    if caught_up is None:
+        failures.append("the UI never showed the last park")
+    if failures:
+        print("FAILED: " + "; ".join(failures))
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+"""
+Observer Dispatch Module
+
+This module decides how and when the parking manager's change notifications
+reach its observers. The synchronous dispatcher delivers each notification
+inside the call that caused it. The coalescing dispatcher queues
+notifications, merges repeated ones for the same lot and delivers them from
+a worker thread, off the park and remove path.
+
+Typed change events for ParkingEventObserver subscribers go through the same
+dispatcher. They are delivered in order and are never merged.
+"""
+
+import dataclasses
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from models import DispatchStats, ParkingEvent
+from interfaces import ParkingEventObserver, ParkingLotObserver
+
+logger = logging.getLogger(__name__)
+
+def _deliver(lot_name: str, observers: Iterable[ParkingLotObserver]) -> int:
+    """Call update on each observer, logging any exception it raises
+
+    Args:
+        lot_name: The name of the lot that changed
+        observers: The observers to notify
+
+    Returns:
+        The number of observers that raised
+    """
+    errors = 0
+    for observer in observers:
+        try:
+            observer.update(lot_name)
+        except Exception as e:
+            errors += 1
+            logger.error("Observer %s failed to handle update for %s: %s", observer, lot_name, e)
+    return errors
+
+def _deliver_events(events: Sequence[ParkingEvent], observers: Iterable[ParkingEventObserver]) -> int:
+    """Pass each event to each event observer, logging any exception raised
+
+    Args:
+        events: The events, in the order they happened
+        observers: The event observers to notify
+
+    Returns:
+        The number of calls that raised
+    """
+    errors = 0
+    for observer in observers:
+        for event in events:
+            try:
+                observer.on_event(event)
+            except Exception as e:
+                errors += 1
+                logger.error("Event observer %s failed to handle %s: %s", observer, event, e)
+    return errors
+
+class ObserverDispatcher(ABC):
+    """Interface for delivering lot change notifications to observers"""
+
+    @abstractmethod
+    def submit(self, lot_name: str, observers: Iterable[ParkingLotObserver]) -> None:
+        """Hands over a notification that a lot changed.
+
+        Args:
+            lot_name: The name of the lot that changed.
+            observers: The observers to notify.
+        """
+        pass
+
+    @abstractmethod
+    def submit_events(self, events: Sequence[ParkingEvent], observers: Iterable[ParkingEventObserver]) -> None:
+        """Hands over change events for delivery, in order and without merging.
+
+        Args:
+            events: The events, in the order they happened.
+            observers: The event observers to notify.
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> DispatchStats:
+        """Gets a snapshot of the dispatcher's counters.
+
+        Returns:
+            A DispatchStats object.
+        """
+        pass
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every submitted notification has been delivered.
+
+        Args:
+            timeout: Maximum number of seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            True if nothing is left to deliver, False if the timeout expired first.
+        """
+        return True
+
+    def close(self) -> None:
+        """Delivers anything still queued and stops the dispatcher."""
+        pass
+
+class SynchronousDispatcher(ObserverDispatcher):
+    """Delivers each notification immediately, on the calling thread"""
+
+    def __init__(self):
+        """Initialize the dispatcher"""
+        self._stats = DispatchStats()
+        # Guards the counters only; observers are called without it
+        self._stats_lock = threading.Lock()
+
+    def submit(self, lot_name: str, observers: Iterable[ParkingLotObserver]) -> None:
+        errors = _deliver(lot_name, observers)
+        with self._stats_lock:
+            self._stats.submitted += 1
+            self._stats.delivered += 1
+            self._stats.observer_errors += errors
+
+    def submit_events(self, events: Sequence[ParkingEvent], observers: Iterable[ParkingEventObserver]) -> None:
+        errors = _deliver_events(events, observers)
+        with self._stats_lock:
+            self._stats.events_delivered += len(events)
+            self._stats.observer_errors += errors
+
+    def stats(self) -> DispatchStats:
+        with self._stats_lock:
+            return dataclasses.replace(self._stats)
+
+class CoalescingDispatcher(ObserverDispatcher):
+    """Queues notifications and delivers them from a worker thread
+
+    A notification waits up to `window` seconds before delivery. Further
+    notifications for a lot that is already waiting are merged into it, so a
+    burst of changes to one lot reaches each observer as a single update.
+    A lot that keeps changing is still delivered once per window, because
+    merging does not push its delivery time back.
+
+    At most `max_pending` lots can be waiting at once; notifications for
+    further lots are dropped and counted. Change events are not merged: they
+    are queued in order and delivered on the worker's next pass, and events
+    beyond `max_events` waiting ones are dropped and counted.
+
+    Observers are called on the worker thread, so observers that are not
+    thread-safe (such as Tk widgets) must hand the work back to their own
+    thread.
+    """
+
+    def __init__(self, window: float = 0.05, max_pending: int = 10_000, max_events: int = 100_000,
+                 thread_name: str = "parking-observer-dispatch"):
+        """Initialize the dispatcher and start its worker thread
+
+        Args:
+            window: Seconds a notification may wait for others to merge with it
+            max_pending: Maximum number of lots waiting for delivery at once
+            max_events: Maximum number of change events waiting for delivery at once
+            thread_name: Name of the worker thread
+        """
+        self._window = window
+        self.max_pending = max_pending
+        self.max_events = max_events
+        self._condition = threading.Condition()
+        # Lot name -> (delivery deadline, observers), in submission order. Every
+        # entry gets the same window, so deadlines are ascending in this order.
+        self._pending: Dict[str, Tuple[float, Tuple[ParkingLotObserver, ...]]] = {}
+        # Event batches waiting for delivery, oldest first, and their total event count
+        self._events: Deque[Tuple[Sequence[ParkingEvent], Tuple[ParkingEventObserver, ...]]] = deque()
+        self._queued_events = 0
+        self._stats = DispatchStats()
+        self._delivering = False
+        self._flush_requests = 0
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=thread_name, daemon=True)
+        self._thread.start()
+
+    @property
+    def window(self) -> float:
+        """Seconds a notification may wait for others to merge with it"""
+        return self._window
+
+    def submit(self, lot_name: str, observers: Iterable[ParkingLotObserver]) -> None:
+        observers = tuple(observers)
+        with self._condition:
+            self._stats.submitted += 1
+            if self._closed:
+                self._stats.dropped += 1
+                logger.warning("Dispatcher is closed; dropped update for %s", lot_name)
+                return
+
+            pending = self._pending.get(lot_name)
+            if pending is not None:
+                # Keep the original deadline; deliver to the latest set of observers
+                self._pending[lot_name] = (pending[0], observers)
+                self._stats.merged += 1
+                return
+
+            if len(self._pending) >= self.max_pending:
+                self._stats.dropped += 1
+                logger.warning("Dispatch queue full (%s lots); dropped update for %s", self.max_pending, lot_name)
+                return
+
+            self._pending[lot_name] = (time.monotonic() + self._window, observers)
+            self._condition.notify_all()
+
+    def submit_events(self, events: Sequence[ParkingEvent], observers: Iterable[ParkingEventObserver]) -> None:
+        observers = tuple(observers)
+        with self._condition:
+            if self._closed or self._queued_events + len(events) > self.max_events:
+                self._stats.dropped += len(events)
+                logger.warning("Dispatcher closed or event queue full; dropped %s events", len(events))
+                return
+            self._events.append((events, observers))
+            self._queued_events += len(events)
+            self._condition.notify_all()
+
+    def stats(self) -> DispatchStats:
+        with self._condition:
+            return dataclasses.replace(self._stats, queue_depth=len(self._pending) + self._queued_events)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            # Waiting entries are delivered without sitting out their window
+            self._flush_requests += 1
+            self._condition.notify_all()
+            try:
+                while self._pending or self._events or self._delivering:
+                    if deadline is None:
+                        self._condition.wait()
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        self._condition.wait(remaining)
+                return True
+            finally:
+                self._flush_requests -= 1
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _take_due(self) -> Optional[Tuple[List[Tuple[str, Tuple[ParkingLotObserver, ...]]],
+                                          List[Tuple[Sequence[ParkingEvent], Tuple[ParkingEventObserver, ...]]]]]:
+        """Wait for waiting entries to fall due and remove them from the queue
+
+        Must be called with the condition held.
+
+        Returns:
+            The due (lot name, observers) pairs and all queued event batches,
+            or None once the dispatcher is closed and the queue is empty
+        """
+        while True:
+            hurry = self._closed or self._flush_requests > 0
+            if self._pending:
+                now = time.monotonic()
+                first_deadline = next(iter(self._pending.values()))[0]
+                if hurry or first_deadline <= now or self._events:
+                    break
+                self._condition.wait(first_deadline - now)
+            elif self._events:
+                break
+            elif self._closed:
+                return None
+            else:
+                self._condition.wait()
+
+        due: List[Tuple[str, Tuple[ParkingLotObserver, ...]]] = []
+        now = time.monotonic()
+        for lot_name, (deadline, observers) in self._pending.items():
+            if not hurry and deadline > now:
+                break
+            due.append((lot_name, observers))
+        for lot_name, _ in due:
+            del self._pending[lot_name]
+
+        event_batches = list(self._events)
+        self._events.clear()
+        self._queued_events = 0
+        return due, event_batches
+
+    def _run(self) -> None:
+        """Worker loop: deliver due notifications until closed"""
+        while True:
+            with self._condition:
+                taken = self._take_due()
+                if taken is None:
+                    return
+                due, event_batches = taken
+                self._delivering = True
+
+            errors = 0
+            event_count = 0
+            for events, event_observers in event_batches:
+                errors += _deliver_events(events, event_observers)
+                event_count += len(events)
+            for lot_name, observers in due:
+                errors += _deliver(lot_name, observers)
+
+            with self._condition:
+                self._stats.delivered += len(due)
+                self._stats.events_delivered += event_count
+                self._stats.observer_errors += errors
+                self._delivering = False
+                self._condition.notify_all()
@@ -5,13 +5,17 @@ This module defines the interfaces used in the parking system.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterator, Tuple
 from models import (
     VehicleData,
+    OccupancyData,
+    ParkingEvent,
     ParkingLotData,
     ParkingLevelData,
+    ParkingSlotData,
     SearchCriteria,
-    SearchResult
+    SearchResult,
+    SlotType
 )
 from Vehicle import Vehicle
 
@@ -43,6 +47,173 @@ class ParkingLotObserver(ABC):
         """
         pass
 
+class ParkingEventObserver(ABC):
+    """Interface for observers of typed parking change events
+    
+    Unlike ParkingLotObserver, which is only told which lot changed, an event
+    observer is told what changed, so it can update incrementally.
+    """
+    
+    @abstractmethod
+    def on_event(self, event: ParkingEvent) -> None:
+        """Handle a change event
+        
+        Args:
+            event: A LotCreated, LevelsAdded, VehicleParked or VehicleRemoved event
+        """
+        pass
+
+class ParkingLevelStore(ABC):
+    """Interface for the storage backing the slots of a single parking level.
+
+    Slots are numbered densely from 1. Callers are responsible for passing
+    slot numbers in the range 1..len(store).
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Gets the number of slots on the level.
+
+        Returns:
+            The slot count.
+        """
+        pass
+
+    @abstractmethod
+    def slot_type(self, slot: int) -> SlotType:
+        """Gets the type of a slot.
+
+        Args:
+            slot: The slot number.
+
+        Returns:
+            The SlotType of the slot.
+        """
+        pass
+
+    @abstractmethod
+    def get_vehicle(self, slot: int) -> Optional[VehicleData]:
+        """Gets the vehicle parked in a slot.
+
+        Args:
+            slot: The slot number.
+
+        Returns:
+            The stored VehicleData, or None if the slot is empty.
+        """
+        pass
+
+    @abstractmethod
+    def occupy(self, slot: int, vehicle: VehicleData) -> None:
+        """Marks a slot as occupied by a vehicle.
+
+        Args:
+            slot: The slot number.
+            vehicle: The vehicle record to store.
+        """
+        pass
+
+    @abstractmethod
+    def release(self, slot: int) -> Optional[VehicleData]:
+        """Empties a slot.
+
+        Args:
+            slot: The slot number.
+
+        Returns:
+            The VehicleData that was stored in the slot, or None if it was already empty.
+        """
+        pass
+
+    @abstractmethod
+    def get_slot(self, slot: int) -> ParkingSlotData:
+        """Gets a ParkingSlotData view of a single slot.
+
+        Args:
+            slot: The slot number.
+
+        Returns:
+            The ParkingSlotData for the slot.
+        """
+        pass
+
+    @abstractmethod
+    def get_slots(self) -> List[ParkingSlotData]:
+        """Gets ParkingSlotData views of every slot on the level, ordered by slot number.
+
+        Returns:
+            A list of ParkingSlotData objects.
+        """
+        pass
+
+    @abstractmethod
+    def iter_occupied(self) -> Iterator[Tuple[int, VehicleData]]:
+        """Iterates over the occupied slots in slot number order.
+
+        Returns:
+            An iterator of (slot number, VehicleData) pairs.
+        """
+        pass
+
+    @abstractmethod
+    def occupied_slots(self) -> List[int]:
+        """Gets the numbers of the occupied slots.
+
+        Returns:
+            The occupied slot numbers in ascending order.
+        """
+        pass
+
+    @abstractmethod
+    def count_occupied(self) -> int:
+        """Counts the occupied slots on the level.
+
+        Returns:
+            The number of occupied slots.
+        """
+        pass
+
+class ParkingJournal(ABC):
+    """Interface for durable logs of parking state changes.
+
+    The manager calls these methods while holding the lock of the lot that
+    changed, so the calls for any one lot arrive in the order the changes
+    were made.
+    """
+
+    @abstractmethod
+    def log_create_lot(self, lot_name: str, levels: List[Tuple[int, int, int]]) -> None:
+        """Records that a lot was created or that levels were added to it.
+
+        Args:
+            lot_name: The name of the parking lot.
+            levels: (level, regular slots, electric slots) for each level added.
+        """
+        pass
+
+    @abstractmethod
+    def log_park(self, lot_name: str, level: int, slot: int, vehicle: VehicleData) -> None:
+        """Records that a vehicle was parked.
+
+        Args:
+            lot_name: The name of the parking lot.
+            level: The level number.
+            slot: The slot number the vehicle was given.
+            vehicle: The stored vehicle record.
+        """
+        pass
+
+    @abstractmethod
+    def log_remove(self, lot_name: str, level: int, slot: int) -> None:
+        """Records that a vehicle was removed.
+
+        Args:
+            lot_name: The name of the parking lot.
+            level: The level number.
+            slot: The slot number that was emptied.
+        """
+        pass
+
 class ParkingLotInterface(ABC):
     """Interface for parking lot operations"""
     
@@ -132,6 +303,9 @@ class ParkingLotManager(ABC):
 
         Returns:
             The slot number where the vehicle was parked, or None if parking failed.
+
+        Raises:
+            ValidationError: If a vehicle with the same registration number is already parked.
         """
         pass
     
@@ -148,13 +322,45 @@ class ParkingLotManager(ABC):
             The removed Vehicle object, or None if no vehicle was found.
         """
         pass
-    
+
+    @abstractmethod
+    def park_many(self, lot_name: str, level: int, vehicles: List[VehicleData]) -> List[Optional[int]]:
+        """Parks several vehicles on one level of a parking lot.
+
+        Observers are notified once for the whole batch.
+
+        Args:
+            lot_name: The name of the parking lot.
+            level: The level number to park the vehicles on.
+            vehicles: VehicleData objects for the vehicles to be parked, in parking order.
+
+        Returns:
+            One entry per vehicle, in input order: the slot number where it was parked,
+            or None if it could not be parked (no free slot, or already parked).
+        """
+        pass
+
+    @abstractmethod
+    def remove_many(self, locations: List[Tuple[str, int, int]]) -> List[Optional[Vehicle]]:
+        """Removes the vehicles at several locations.
+
+        Observers are notified once per lot that changed.
+
+        Args:
+            locations: (lot name, level, slot) tuples to clear.
+
+        Returns:
+            One entry per location, in input order: the removed Vehicle object,
+            or None if no vehicle was found there.
+        """
+        pass
+
     @abstractmethod
-    def search_vehicles(self, lot_name: str, criteria: SearchCriteria) -> List[SearchResult]:
+    def search_vehicles(self, lot_name: Optional[str], criteria: SearchCriteria) -> List[SearchResult]:
         """Searches for vehicles in a parking lot based on given criteria.
 
         Args:
-            lot_name: The name of the parking lot to search within.
+            lot_name: The name of the parking lot to search within, or None to search all lots.
             criteria: SearchCriteria object specifying the search parameters.
 
         Returns:
@@ -162,6 +368,18 @@ class ParkingLotManager(ABC):
         """
         pass
     
+    @abstractmethod
+    def find_vehicle(self, registration_number: str) -> Optional[SearchResult]:
+        """Finds a parked vehicle by registration number across all lots.
+
+        Args:
+            registration_number: The registration number of the vehicle.
+
+        Returns:
+            A SearchResult giving the vehicle's lot, level and slot, or None if it is not parked.
+        """
+        pass
+    
     @abstractmethod
     def get_lot_status(self, lot_name: str) -> List[ParkingLevelData]:
         """Gets the current status of a specific parking lot.
@@ -174,6 +392,15 @@ class ParkingLotManager(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_occupancy_summary(self) -> List[OccupancyData]:
+        """Gets capacity and availability counters for every lot, level and slot type.
+
+        Returns:
+            A list of OccupancyData objects ordered by lot, level and slot type.
+        """
+        pass
+    
     @abstractmethod
     def get_lot_names(self) -> List[str]:
         """Gets the names of all available parking lots.
@@ -201,6 +428,24 @@ class ParkingLotManager(ABC):
         """
         pass
 
+    @abstractmethod
+    def register_event_observer(self, observer: ParkingEventObserver) -> None:
+        """Registers an observer to receive typed change events.
+
+        Args:
+            observer: The ParkingEventObserver instance to register.
+        """
+        pass
+
+    @abstractmethod
+    def unregister_event_observer(self, observer: ParkingEventObserver) -> None:
+        """Removes a previously registered event observer.
+
+        Args:
+            observer: The ParkingEventObserver instance to remove.
+        """
+        pass
+
     @abstractmethod
     def get_vehicles_in_lot(self, lot_name: str, level: int) -> Dict[int, Vehicle]:
         """Gets all vehicles parked on a specific level of a specific lot.
@@ -212,4 +457,48 @@ class ParkingLotManager(ABC):
         Returns:
             A dictionary mapping slot numbers to Vehicle objects for the specified level and lot.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_occupied_slots(self, lot_name: str, level: int) -> List[int]:
+        """Gets the numbers of the occupied slots on one level of a lot.
+
+        Only the given level is looked at, so this is much cheaper than
+        filtering get_lot_status.
+
+        Args:
+            lot_name: The name of the parking lot.
+            level: The level number.
+
+        Returns:
+            The occupied slot numbers in ascending order, or an empty list if the level does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def get_slot(self, lot_name: str, level: int, slot: int) -> Optional[ParkingSlotData]:
+        """Gets a snapshot of a single slot.
+
+        Args:
+            lot_name: The name of the parking lot.
+            level: The level number.
+            slot: The slot number.
+
+        Returns:
+            A ParkingSlotData for the slot, or None if the level or slot does not exist.
+        """
+        pass
+
+    @abstractmethod
+    def is_slot_occupied(self, lot_name: str, level: int, slot: int) -> bool:
+        """Checks whether a single slot holds a vehicle.
+
+        Args:
+            lot_name: The name of the parking lot.
+            level: The level number.
+            slot: The slot number.
+
+        Returns:
+            True if the slot exists and is occupied.
+        """
+        pass
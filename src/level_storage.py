@@ -0,0 +1,186 @@
+"""
+Level Storage Module
+
+This module provides the storage backends that hold the slots of a single
+parking level. SlotListLevelStore keeps one ParkingSlotData object per slot;
+ColumnarLevelStore keeps compact array columns and only builds
+ParkingSlotData views when callers ask for them.
+"""
+
+from array import array
+from bisect import bisect_left, insort
+from typing import Iterator, List, Optional, Tuple
+from models import ParkingSlotData, SlotType, VehicleData
+from interfaces import ParkingLevelStore
+
+# Slot type codes stored in the columnar slot type column
+SLOT_TYPE_CODES = {SlotType.REGULAR: 0, SlotType.ELECTRIC: 1}
+SLOT_TYPES_BY_CODE = (SlotType.REGULAR, SlotType.ELECTRIC)
+
+# Marker in the vehicle reference column for an empty slot
+NO_VEHICLE = -1
+
+class SlotListLevelStore(ParkingLevelStore):
+    """Level storage backed by a list of ParkingSlotData objects
+    
+    Slot N is stored at index N - 1. get_slots returns the live slot objects,
+    which must only be changed through occupy and release: the numbers of
+    the occupied slots are also kept in a sorted list, so listing or
+    counting them does not visit the empty ones.
+    """
+    
+    def __init__(self, regular_slots: int, electric_slots: int):
+        """Initialize the level storage
+        
+        Args:
+            regular_slots: Number of regular slots, numbered from 1
+            electric_slots: Number of electric slots, numbered after the regular slots
+        """
+        self._slots: List[ParkingSlotData] = [
+            ParkingSlotData(slot_number=i + 1, is_occupied=False, slot_type=SlotType.REGULAR)
+            for i in range(regular_slots)
+        ] + [
+            ParkingSlotData(slot_number=regular_slots + i + 1, is_occupied=False, slot_type=SlotType.ELECTRIC)
+            for i in range(electric_slots)
+        ]
+        # Occupied slot numbers, ascending
+        self._occupied: List[int] = []
+    
+    def __len__(self) -> int:
+        return len(self._slots)
+    
+    def slot_type(self, slot: int) -> SlotType:
+        return self._slots[slot - 1].slot_type
+    
+    def get_vehicle(self, slot: int) -> Optional[VehicleData]:
+        parking_slot = self._slots[slot - 1]
+        return parking_slot.vehicle if parking_slot.is_occupied else None
+    
+    def occupy(self, slot: int, vehicle: VehicleData) -> None:
+        parking_slot = self._slots[slot - 1]
+        if not parking_slot.is_occupied:
+            insort(self._occupied, slot)
+        parking_slot.is_occupied = True
+        parking_slot.vehicle = vehicle
+    
+    def release(self, slot: int) -> Optional[VehicleData]:
+        parking_slot = self._slots[slot - 1]
+        if parking_slot.is_occupied:
+            occupied = self._occupied
+            del occupied[bisect_left(occupied, slot)]
+        vehicle = parking_slot.vehicle if parking_slot.is_occupied else None
+        parking_slot.is_occupied = False
+        parking_slot.vehicle = None
+        return vehicle
+    
+    def get_slot(self, slot: int) -> ParkingSlotData:
+        return self._slots[slot - 1]
+    
+    def get_slots(self) -> List[ParkingSlotData]:
+        return self._slots
+    
+    def iter_occupied(self) -> Iterator[Tuple[int, VehicleData]]:
+        slots = self._slots
+        for slot in self._occupied:
+            vehicle = slots[slot - 1].vehicle
+            if vehicle is not None:
+                yield slot, vehicle
+    
+    def occupied_slots(self) -> List[int]:
+        return list(self._occupied)
+    
+    def count_occupied(self) -> int:
+        return len(self._occupied)
+
+class ColumnarLevelStore(ParkingLevelStore):
+    """Level storage backed by array columns
+    
+    Per slot it keeps one byte of occupied flag, one byte of slot type code
+    and a 32-bit index into a vehicle table that only holds parked vehicles.
+    ParkingSlotData objects are built on demand and are snapshots: changing
+    them does not change the level.
+    """
+    
+    def __init__(self, regular_slots: int, electric_slots: int):
+        """Initialize the level storage
+        
+        Args:
+            regular_slots: Number of regular slots, numbered from 1
+            electric_slots: Number of electric slots, numbered after the regular slots
+        """
+        size = regular_slots + electric_slots
+        self._occupied = bytearray(size)
+        self._slot_types = bytearray(regular_slots) + bytes([SLOT_TYPE_CODES[SlotType.ELECTRIC]]) * electric_slots
+        self._vehicle_refs = array('i', [NO_VEHICLE]) * size
+        # Vehicle table; entries freed by release are recycled through _free_refs
+        self._vehicles: List[Optional[VehicleData]] = []
+        self._free_refs: List[int] = []
+    
+    def __len__(self) -> int:
+        return len(self._occupied)
+    
+    def slot_type(self, slot: int) -> SlotType:
+        return SLOT_TYPES_BY_CODE[self._slot_types[slot - 1]]
+    
+    def get_vehicle(self, slot: int) -> Optional[VehicleData]:
+        ref = self._vehicle_refs[slot - 1]
+        return None if ref == NO_VEHICLE else self._vehicles[ref]
+    
+    def occupy(self, slot: int, vehicle: VehicleData) -> None:
+        index = slot - 1
+        ref = self._vehicle_refs[index]
+        if ref == NO_VEHICLE:
+            if self._free_refs:
+                ref = self._free_refs.pop()
+                self._vehicles[ref] = vehicle
+            else:
+                ref = len(self._vehicles)
+                self._vehicles.append(vehicle)
+            self._vehicle_refs[index] = ref
+        else:
+            self._vehicles[ref] = vehicle
+        self._occupied[index] = 1
+    
+    def release(self, slot: int) -> Optional[VehicleData]:
+        index = slot - 1
+        ref = self._vehicle_refs[index]
+        if ref == NO_VEHICLE:
+            return None
+        vehicle = self._vehicles[ref]
+        self._vehicles[ref] = None
+        self._free_refs.append(ref)
+        self._vehicle_refs[index] = NO_VEHICLE
+        self._occupied[index] = 0
+        return vehicle
+    
+    def get_slot(self, slot: int) -> ParkingSlotData:
+        return ParkingSlotData(
+            slot_number=slot,
+            is_occupied=bool(self._occupied[slot - 1]),
+            vehicle=self.get_vehicle(slot),
+            slot_type=self.slot_type(slot)
+        )
+    
+    def get_slots(self) -> List[ParkingSlotData]:
+        return [self.get_slot(slot) for slot in range(1, len(self._occupied) + 1)]
+    
+    def iter_occupied(self) -> Iterator[Tuple[int, VehicleData]]:
+        occupied = self._occupied
+        index = occupied.find(1)
+        while index != -1:
+            vehicle = self._vehicles[self._vehicle_refs[index]]
+            if vehicle is not None:
+                yield index + 1, vehicle
+            index = occupied.find(1, index + 1)
+    
+    def occupied_slots(self) -> List[int]:
+        occupied = self._occupied
+        slots = []
+        index = occupied.find(1)
+        while index != -1:
+            slots.append(index + 1)
+            index = occupied.find(1, index + 1)
+        return slots
+    
+    def count_occupied(self) -> int:
+        return self._occupied.count(1)
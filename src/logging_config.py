@@ -0,0 +1,120 @@
+"""
+Logging Configuration Module
+
+This module sets up logging for the parking application. Library modules
+only create loggers; nothing is configured when they are imported. The
+application calls configure_logging once at startup.
+
+Records are put on an in-process queue by a QueueHandler on the root logger
+and a QueueListener thread formats them and writes them to the log file and
+the console, so the threads that park and remove vehicles never wait for
+disk or terminal I/O.
+
+LOG_FORMAT uses neither the caller's source location nor thread or process
+details. An application whose handlers all do without them can pass
+lean_records=True to have records created without them, as suggested in
+the Optimization section of the logging HOWTO, which halves the cost of
+creating a record. This changes the logging module's own settings for the
+whole process, so it is off by default.
+"""
+
+import atexit
+import copy
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, List, Optional
+
+DEFAULT_LOG_FILE = "parking_system.log"
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_queue_handler: Optional[QueueHandler] = None
+_listener: Optional[QueueListener] = None
+# Values of the logging module's record options before configure_logging changed them
+_saved_options: Optional[Dict[str, Any]] = None
+
+# Record options of the logging module and their values with lean_records; a
+# _srcfile of None skips looking up the caller's source location
+_LEAN_RECORD_OPTIONS = {"_srcfile": None, "logThreads": False, "logProcesses": False, "logMultiprocessing": False}
+
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler that leaves exception formatting to the listener thread
+
+    The standard handler formats each whole record on the logging thread so
+    that it can be pickled. These records never leave the process, so only
+    the message is built before queueing, which fixes the arguments' values
+    at the time of the call; tracebacks are formatted by the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.msg = record.getMessage()
+        record.args = None
+        return record
+
+def configure_logging(level: int = logging.INFO, log_file: Optional[str] = DEFAULT_LOG_FILE,
+                      console: bool = True, lean_records: bool = False) -> QueueListener:
+    """Route log records through a queue to file and console handlers
+
+    Calling it again replaces the previous configuration. The listener is
+    stopped, and its queue drained, at interpreter exit or by stop_logging.
+
+    Args:
+        level: Level of the root logger
+        log_file: File to append records to, or None for no file
+        console: Whether to also write records to standard error
+        lean_records: Create records without source location, thread and process
+            details, for every logger in the process, until logging is stopped
+
+    Returns:
+        The started QueueListener
+    """
+    global _queue_handler, _listener, _saved_options
+    stop_logging()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers: List[logging.Handler] = []
+    if log_file is not None:
+        handlers.append(logging.FileHandler(log_file))
+    if console:
+        handlers.append(logging.StreamHandler())
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_handler = _InProcessQueueHandler(records)
+    _listener = QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+
+    if lean_records:
+        _saved_options = {name: getattr(logging, name) for name in _LEAN_RECORD_OPTIONS}
+        for name, value in _LEAN_RECORD_OPTIONS.items():
+            setattr(logging, name, value)
+
+    root = logging.getLogger()
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+    return _listener
+
+def stop_logging() -> None:
+    """Write out queued records, stop the listener and close its handlers
+
+    Also restores the logging module's record options if lean_records
+    changed them. Does nothing if
+    logging was not configured by configure_logging.
+    """
+    global _queue_handler, _listener, _saved_options
+    if _queue_handler is not None:
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+    if _saved_options is not None:
+        for name, value in _saved_options.items():
+            setattr(logging, name, value)
+        _saved_options = None
+
+atexit.register(stop_logging)
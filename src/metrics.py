@@ -0,0 +1,221 @@
+"""
+Metrics Module
+
+This module instruments the parking manager's operations. A MetricsRecorder
+counts the calls to each operation and the exceptions they raise, and keeps
+a latency histogram per operation. The buckets are fixed powers of two from
+1 microsecond to about 8 seconds, so recording a call is a bit_length and a
+few integer additions under a lock.
+
+Managers take a recorder as an optional dependency. Given one, a manager
+instruments its own operations by wrapping them on the instance, so a
+manager created without a recorder calls its methods exactly as before and
+pays nothing.
+
+format_prometheus renders a snapshot in the Prometheus text exposition
+format, and PrometheusExporter serves it over HTTP from a daemon thread.
+"""
+
+import functools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from models import MetricsSnapshot, OperationMetrics
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the latency buckets in microseconds; a last, unbounded bucket follows.
+# Bucket i holds calls that took less than 2**i microseconds and at least 2**(i - 1).
+LATENCY_BUCKET_BOUNDS_US = tuple(2 ** i for i in range(24))
+_BUCKET_COUNT = len(LATENCY_BUCKET_BOUNDS_US) + 1
+_LAST_BUCKET = len(LATENCY_BUCKET_BOUNDS_US)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+class MetricsRecorder:
+    """Per-operation call counters, error counters and latency histograms
+
+    Safe to use from several threads at once.
+    """
+
+    def __init__(self):
+        """Initialize the recorder with no operations recorded"""
+        # Operation -> [calls, total nanoseconds, per-bucket counts]
+        self._operations: Dict[str, List[Any]] = {}
+        # (operation, exception type name) -> count
+        self._errors: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation: str, elapsed_ns: int, error: Optional[BaseException] = None) -> None:
+        """Record one call of an operation
+
+        Args:
+            operation: The operation name
+            elapsed_ns: How long the call took, in nanoseconds
+            error: The exception the call raised, if it raised
+        """
+        bucket = (elapsed_ns // 1000).bit_length()
+        if bucket > _LAST_BUCKET:
+            bucket = _LAST_BUCKET
+        with self._lock:
+            entry = self._operations.get(operation)
+            if entry is None:
+                entry = self._operations[operation] = [0, 0, [0] * _BUCKET_COUNT]
+            entry[0] += 1
+            entry[1] += elapsed_ns
+            entry[2][bucket] += 1
+            if error is not None:
+                key = (operation, type(error).__name__)
+                self._errors[key] = self._errors.get(key, 0) + 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Get a copy of the current counters and histograms
+
+        Returns:
+            A MetricsSnapshot with one OperationMetrics per recorded operation
+        """
+        with self._lock:
+            operations = {
+                name: OperationMetrics(operation=name, calls=calls, total_seconds=total_ns / 1e9,
+                                       bucket_counts=list(buckets))
+                for name, (calls, total_ns, buckets) in self._operations.items()
+            }
+            for (name, error_type), count in self._errors.items():
+                operations[name].errors[error_type] = count
+        return MetricsSnapshot(bucket_bounds=bucket_bounds(), operations=operations)
+
+    def reset(self) -> None:
+        """Discard everything recorded so far"""
+        with self._lock:
+            self._operations.clear()
+            self._errors.clear()
+
+def bucket_bounds() -> List[float]:
+    """Get the upper bounds of the bounded latency buckets, in seconds"""
+    return [bound / 1e6 for bound in LATENCY_BUCKET_BOUNDS_US]
+
+def instrument(target: Any, recorder: MetricsRecorder, operations: Iterable[str]) -> None:
+    """Record every call of some of an object's methods
+
+    Each method is replaced, on the object only, by a wrapper that times
+    the call and records it under the method's name. Objects that are
+    never instrumented keep calling their methods directly.
+
+    Args:
+        target: The object whose methods to instrument
+        recorder: The recorder to record calls in
+        operations: Names of the methods to instrument
+    """
+    for operation in operations:
+        setattr(target, operation, _timed(getattr(target, operation), operation, recorder))
+
+def _timed(method: Callable[..., Any], operation: str, recorder: MetricsRecorder) -> Callable[..., Any]:
+    """Wrap a bound method so each call is recorded as an operation"""
+    clock = time.perf_counter_ns
+    record = recorder.record
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            record(operation, clock() - start, e)
+            raise
+        record(operation, clock() - start)
+        return result
+    return wrapper
+
+def format_prometheus(snapshot: MetricsSnapshot, prefix: str = "parking") -> str:
+    """Render a metrics snapshot in the Prometheus text exposition format
+
+    Args:
+        snapshot: The metrics to render
+        prefix: Prefix for every metric name
+
+    Returns:
+        The exposition text, ending with a newline
+    """
+    operations = sorted(snapshot.operations.items())
+    lines = [
+        f"# HELP {prefix}_operations_total Manager operation calls, including failed ones.",
+        f"# TYPE {prefix}_operations_total counter",
+    ]
+    for name, metrics in operations:
+        lines.append(f'{prefix}_operations_total{{operation="{name}"}} {metrics.calls}')
+
+    lines.append(f"# HELP {prefix}_operation_errors_total Manager operation calls that raised, by exception type.")
+    lines.append(f"# TYPE {prefix}_operation_errors_total counter")
+    for name, metrics in operations:
+        for error_type, count in sorted(metrics.errors.items()):
+            lines.append(f'{prefix}_operation_errors_total{{operation="{name}",exception="{error_type}"}} {count}')
+
+    histogram = f"{prefix}_operation_duration_seconds"
+    lines.append(f"# HELP {histogram} Manager operation latency.")
+    lines.append(f"# TYPE {histogram} histogram")
+    for name, metrics in operations:
+        cumulative = 0
+        for bound, count in zip(snapshot.bucket_bounds, metrics.bucket_counts):
+            cumulative += count
+            lines.append(f'{histogram}_bucket{{operation="{name}",le="{bound!r}"}} {cumulative}')
+        lines.append(f'{histogram}_bucket{{operation="{name}",le="+Inf"}} {metrics.calls}')
+        lines.append(f'{histogram}_sum{{operation="{name}"}} {metrics.total_seconds!r}')
+        lines.append(f'{histogram}_count{{operation="{name}"}} {metrics.calls}')
+    return "\n".join(lines) + "\n"
+
+class PrometheusExporter:
+    """Serves metrics in the Prometheus text format over HTTP
+
+    Every GET request, whatever its path, gets a fresh snapshot from the
+    source. Requests are handled on daemon threads.
+    """
+
+    def __init__(self, source: Callable[[], MetricsSnapshot], host: str = "127.0.0.1", port: int = 9108,
+                 prefix: str = "parking"):
+        """Initialize the exporter and start serving
+
+        Args:
+            source: Returns the snapshot to serve, e.g. a manager's get_metrics
+            host: Address to listen on
+            port: Port to listen on, or 0 for any free port
+            prefix: Prefix for every metric name
+        """
+        # Imported here: http.server pulls in the email and ssl packages, which
+        # would otherwise roughly double the cost of importing the manager
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = format_prometheus(exporter.source(), exporter.prefix).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logger.debug("Metrics request from %s: " + format, self.address_string(), *args)
+
+        self.source = source
+        self.prefix = prefix
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="parking-metrics-exporter",
+                                        daemon=True)
+        self._thread.start()
+        logger.info("Serving metrics on http://%s:%s/metrics", host, self.port)
+
+    @property
+    def port(self) -> int:
+        """The port the exporter listens on"""
+        return self._server.server_address[1]
+
+    def close(self) -> None:
+        """Stop serving and close the listening socket"""
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
@@ -4,17 +4,22 @@ Data Models Module
 This module defines the data models used in the parking system.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
 from enum import Enum, auto
-from Vehicle import VehicleType
+from Vehicle import Vehicle, VehicleType
+
+# Instances of the hot-path models are created in large numbers, so give them
+# __slots__ instead of a per-instance __dict__ where the Python version allows it
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 class SlotType(Enum):
     """Enum for slot types"""
     REGULAR = auto()
     ELECTRIC = auto()
 
-@dataclass
+@dataclass(**_SLOTS)
 class VehicleData:
     """Data transfer object for vehicle information"""
     registration_number: str  # Unique identifier for the vehicle
@@ -26,7 +31,7 @@ class VehicleData:
     vehicle_type: VehicleType  # Type of the vehicle (e.g., CAR, TRUCK)
     current_battery_charge: Optional[float] = None  # Current battery charge percentage for electric vehicles
 
-@dataclass
+@dataclass(**_SLOTS)
 class ParkingSlotData:
     """Data transfer object for parking slot information"""
     slot_number: int  # Unique identifier for the slot within its level
@@ -55,6 +60,124 @@ class ParkingLotData:
     name: str  # The unique name of the parking lot
     levels: List[ParkingLevelData]  # A list of ParkingLevelData objects representing all levels in this lot
 
+@dataclass(**_SLOTS)
+class OccupancyData:
+    """
+    Data transfer object for occupancy counters.
+    Capacity and availability of one slot type on one level of a parking lot.
+    """
+    lot_name: str  # The name of the parking lot
+    level: int  # The level number
+    slot_type: SlotType  # The type of slot these counters cover
+    capacity: int  # Total number of slots of this type on the level
+    available: int  # Number of those slots that are free
+
+    @property
+    def occupied(self) -> int:
+        """Number of slots of this type that are occupied"""
+        return self.capacity - self.available
+
+@dataclass(**_SLOTS)
+class ParkingEvent:
+    """
+    Base class for change events published by the parking manager.
+    Every event names the lot it happened in.
+    """
+    lot_name: str  # The name of the parking lot that changed
+
+@dataclass(**_SLOTS)
+class LotCreated(ParkingEvent):
+    """Event published when a new parking lot is created"""
+    levels: List[int]  # The level numbers the lot was created with
+
+@dataclass(**_SLOTS)
+class LevelsAdded(ParkingEvent):
+    """Event published when levels are added to an existing parking lot"""
+    levels: List[int]  # The level numbers that were added
+
+@dataclass(**_SLOTS)
+class VehicleParked(ParkingEvent):
+    """Event published when a vehicle is parked"""
+    level: int  # The level the vehicle was parked on
+    slot: int  # The slot the vehicle was parked in
+    vehicle: Vehicle  # Read-only view of the parked vehicle
+
+@dataclass(**_SLOTS)
+class VehicleRemoved(ParkingEvent):
+    """Event published when a vehicle is removed"""
+    level: int  # The level the vehicle was removed from
+    slot: int  # The slot the vehicle was removed from
+    vehicle: Vehicle  # The removed vehicle
+
+@dataclass
+class DispatchStats:
+    """
+    Data transfer object for observer dispatch statistics.
+    A snapshot of the counters kept by an observer dispatcher.
+    """
+    queue_depth: int = 0  # Notifications and change events waiting to be delivered
+    submitted: int = 0  # Notifications handed to the dispatcher
+    delivered: int = 0  # Notifications passed on to observers
+    merged: int = 0  # Notifications folded into one already waiting for the same lot
+    dropped: int = 0  # Notifications and events discarded because the queue was full
+    events_delivered: int = 0  # Change events passed on to event observers
+    observer_errors: int = 0  # Exceptions raised by observers during delivery
+
+@dataclass
+class OperationMetrics:
+    """
+    Data transfer object for the metrics of one manager operation.
+    Call and error counters and a latency histogram with fixed buckets.
+    """
+    operation: str  # Name of the manager method, e.g. park_vehicle
+    calls: int = 0  # Calls made, including those that raised
+    errors: Dict[str, int] = field(default_factory=dict)  # Exception type name -> calls that raised it
+    total_seconds: float = 0.0  # Time spent in all calls
+    bucket_counts: List[int] = field(default_factory=list)  # Calls per latency bucket, not cumulative
+
+    @property
+    def error_count(self) -> int:
+        """Number of calls that raised"""
+        return sum(self.errors.values())
+
+    @property
+    def mean_seconds(self) -> float:
+        """Mean latency of a call, or 0.0 if there were none"""
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+@dataclass
+class MetricsSnapshot:
+    """
+    Data transfer object for a point-in-time copy of a manager's metrics.
+    Every operation's histogram uses the same buckets.
+    """
+    bucket_bounds: List[float] = field(default_factory=list)  # Upper bound in seconds of each bucket but the last, which is unbounded
+    operations: Dict[str, OperationMetrics] = field(default_factory=dict)  # Operation name -> its metrics
+
+    def quantile(self, operation: str, q: float) -> Optional[float]:
+        """Estimate a latency quantile of an operation from its histogram
+
+        Args:
+            operation: The operation name
+            q: The quantile, between 0 and 1
+
+        Returns:
+            The upper bound in seconds of the bucket the quantile falls in,
+            infinity if that is the unbounded bucket, or None if the operation
+            has no calls
+        """
+        metrics = self.operations.get(operation)
+        if metrics is None or not metrics.calls:
+            return None
+        target = q * metrics.calls
+        seen = 0
+        for bound, count in zip(self.bucket_bounds, metrics.bucket_counts):
+            seen += count
+            # Empty buckets hold no sample, so q=0 falls in the first one that does
+            if count and seen >= target:
+                return bound
+        return float("inf")
+
 @dataclass
 class SearchCriteria:
     """
@@ -70,7 +193,7 @@ class SearchCriteria:
     is_motorcycle: Optional[bool] = None # Whether to search for motorcycles
     vehicle_type: Optional[VehicleType] = None  # Specific vehicle type to search for
 
-@dataclass
+@dataclass(**_SLOTS)
 class SearchResult:
     """
     Data transfer object for search results.
@@ -0,0 +1,96 @@
+"""
+Parking Engine Package
+
+The headless parking engine: the manager, its data models, interfaces and
+optional extensions, importable by workers and command-line tools without
+the GUI. Importing this package does no file or network I/O, configures no
+logging and does not import tkinter.
+
+The core API is imported eagerly. Extensions with heavier dependencies
+(asyncio, sqlite3, the persistence layer, the metrics exporter's HTTP
+server) are imported the first time one of their names is used, and the
+Tkinter UI only by run_ui.
+
+The package re-exports the flat modules in the src directory (models,
+ParkingManager and so on) and imports them by their top-level names, so it
+is not self-contained: the src directory itself must be on sys.path, as it
+is when running from src or with PYTHONPATH=src.
+
+Usage (with the src directory on the path):
+    from parking_engine import ParkingLotManagerImpl, ParkingLotData, VehicleData
+    python -m parking_engine    # run the UI
+"""
+
+import importlib
+from typing import Any, List
+
+from models import (
+    DispatchStats,
+    LevelsAdded,
+    LotCreated,
+    MetricsSnapshot,
+    OccupancyData,
+    OperationMetrics,
+    ParkingEvent,
+    ParkingLevelData,
+    ParkingLotData,
+    ParkingSlotData,
+    SearchCriteria,
+    SearchResult,
+    SlotType,
+    VehicleData,
+    VehicleParked,
+    VehicleRemoved
+)
+from Vehicle import Vehicle, VehicleType
+from battery import (
+    BatteryChargeProvider,
+    FixedChargeProvider,
+    RandomChargeProvider,
+    TelemetryChargeProvider,
+    get_charge_provider,
+    set_charge_provider
+)
+from dispatch import CoalescingDispatcher, ObserverDispatcher, SynchronousDispatcher
+from interfaces import (
+    OperationError,
+    ParkingEventObserver,
+    ParkingJournal,
+    ParkingLotManager,
+    ParkingLotObserver,
+    ParkingSystemError,
+    ValidationError
+)
+from metrics import MetricsRecorder, PrometheusExporter, format_prometheus
+from ParkingManager import ParkingLotManagerImpl
+
+# Names imported on first use -> the module that defines them
+_LAZY_NAMES = {
+    "AsyncParkingLotManager": "async_manager",
+    "ChangeEventStream": "async_manager",
+    "JournalWriter": "persistence",
+    "ParkingStore": "persistence",
+    "SQLiteParkingLotManager": "sqlite_manager",
+    "configure_logging": "logging_config",
+    "stop_logging": "logging_config",
+}
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily exported name on first use"""
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
+def run_ui() -> None:
+    """Configure logging and run the Tkinter UI
+
+    tkinter and the UI module are imported only when this is called.
+    """
+    from ParkingManager import main
+    main()
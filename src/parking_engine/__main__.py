@@ -0,0 +1,5 @@
+"""Run the parking lot UI: python -m parking_engine"""
+
+from parking_engine import run_ui
+
+run_ui()
@@ -0,0 +1,592 @@
+"""
+Persistence Module
+
+This module keeps parking state on disk so a restart does not lose parked
+vehicles. Every lot creation, park and remove is appended to a binary
+journal that a background thread writes and fsyncs in groups. Snapshots
+store the whole state in a compact binary file, after which older journals
+are deleted. On startup the latest snapshot is loaded and the journal tail
+replayed on top of it.
+
+Files in the data directory:
+    snapshot.bin            The latest snapshot
+    journal-<generation>.log  Journals; a snapshot of generation G covers
+                              every journal below G
+
+Journal frame: <body length u32><crc32 u32><body>. Each frame holds one
+flushed group of records, stored column by column with marshal so that
+encoding a group is a handful of C-level passes rather than per-record
+Python work. A torn or corrupt frame ends the replay of its file. The
+marshal format is only guaranteed within a Python version, so take a
+snapshot (which uses a fixed struct layout) before upgrading the interpreter.
+"""
+
+import gc
+import logging
+import marshal
+import os
+import struct
+import threading
+import zlib
+from collections import deque
+from operator import attrgetter
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from models import ParkingLevelData, ParkingLotData, ParkingSlotData, SlotType, VehicleData
+from Vehicle import VehicleType
+from interfaces import ParkingJournal
+from ParkingManager import ParkingLotManagerImpl
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "snapshot.bin"
+SNAPSHOT_MAGIC = b"PKSNAP01"
+JOURNAL_PREFIX = "journal-"
+JOURNAL_SUFFIX = ".log"
+
+# Journal operation codes
+OP_CREATE_LOT = 1
+OP_PARK = 2
+OP_REMOVE = 3
+
+# Vehicle type codes, fixed so that files stay readable if the enum changes
+VEHICLE_TYPE_CODES = {VehicleType.CAR: 0, VehicleType.TRUCK: 1, VehicleType.MOTORCYCLE: 2, VehicleType.BUS: 3}
+VEHICLE_TYPES_BY_CODE = (VehicleType.CAR, VehicleType.TRUCK, VehicleType.MOTORCYCLE, VehicleType.BUS)
+
+# Vehicle flag bits
+FLAG_ELECTRIC = 1
+FLAG_MOTORCYCLE = 2
+FLAG_HAS_CHARGE = 4
+
+# Vehicle columns of a journal frame, one value per park record; vehicle
+# types are stored as VEHICLE_TYPE_CODES
+_JOURNAL_VEHICLE_FIELDS = tuple(attrgetter(field) for field in (
+    "registration_number", "manufacturer", "model", "color",
+    "is_electric", "is_motorcycle", "vehicle_type", "current_battery_charge"
+))
+
+# Fields per queued journal record: op code, lot name, level, slot, payload
+_RECORD_FIELDS = 5
+
+_RECORD_HEADER = struct.Struct("<II")  # body length, crc32 of body
+_LEVEL_LAYOUT = struct.Struct("<iII")  # level, regular slots, electric slots
+# generation, lot count, vehicle count, string count, string table size
+_SNAPSHOT_HEADER = struct.Struct("<QIIII")
+_SNAPSHOT_LOT = struct.Struct("<IH")  # lot name string, level count
+# lot name, level, slot, registration, manufacturer, model, color strings, flags, type code, charge
+_SNAPSHOT_VEHICLE = struct.Struct("<IiIIIIIBBd")
+
+def _vehicle_flags(record: VehicleData) -> int:
+    """Pack a record's boolean fields into flag bits"""
+    flags = 0
+    if record.is_electric:
+        flags |= FLAG_ELECTRIC
+    if record.is_motorcycle:
+        flags |= FLAG_MOTORCYCLE
+    if record.current_battery_charge is not None:
+        flags |= FLAG_HAS_CHARGE
+    return flags
+
+def _make_record(registration_number: str, manufacturer: str, model: str, color: str,
+                 flags: int, type_code: int, charge: float) -> VehicleData:
+    """Rebuild a vehicle record from its stored fields"""
+    return VehicleData(
+        registration_number=registration_number,
+        manufacturer=manufacturer,
+        model=model,
+        color=color,
+        is_electric=bool(flags & FLAG_ELECTRIC),
+        is_motorcycle=bool(flags & FLAG_MOTORCYCLE),
+        vehicle_type=VEHICLE_TYPES_BY_CODE[type_code],
+        current_battery_charge=charge if flags & FLAG_HAS_CHARGE else None
+    )
+
+def _lot_data(name: str, layout: List[Tuple[int, int, int]]) -> ParkingLotData:
+    """Build the ParkingLotData that create_lot expects from a level layout"""
+    # create_lot only counts slots of each type and numbers them itself, so
+    # one shared object per type stands in for every slot
+    regular = ParkingSlotData(slot_number=0, is_occupied=False, slot_type=SlotType.REGULAR)
+    electric = ParkingSlotData(slot_number=0, is_occupied=False, slot_type=SlotType.ELECTRIC)
+    levels = [
+        ParkingLevelData(level=level, slots=[regular] * regular_slots + [electric] * electric_slots)
+        for level, regular_slots, electric_slots in layout
+    ]
+    return ParkingLotData(name=name, levels=levels)
+
+class JournalWriter(ParkingJournal):
+    """Append-only journal file with group commit
+
+    Logging a change only queues it. A background thread encodes the queued
+    records as one frame, writes it and fsyncs the file every
+    `flush_interval` seconds, or sooner once `group_size` records are
+    waiting. A crash can therefore lose up to one interval of changes;
+    call sync() when a change must be on disk before continuing.
+
+    Queued records keep references to the parked VehicleData records, which
+    the manager never modifies after parking.
+    """
+
+    def __init__(self, path: str, group_size: int = 512, flush_interval: float = 0.05):
+        """Open (or create) the journal file and start the flusher thread
+
+        Args:
+            path: Path of the journal file; frames are appended
+            group_size: Number of waiting records that triggers an early flush
+            flush_interval: Maximum seconds between flushes
+        """
+        self.path = path
+        self.group_size = group_size
+        self._group_fields = group_size * _RECORD_FIELDS
+        self.flush_interval = flush_interval
+        self.records_written = 0
+        self._file = open(path, "ab")
+        # Queued records, flattened: op code, lot name, level, slot, layout or
+        # vehicle record, then the next record. A deque extend is atomic, so
+        # logging takes no lock, and no per-record container is kept alive
+        # for the cyclic garbage collector to count and scan.
+        self._fields: Deque[Any] = deque()
+        self._condition = threading.Condition()
+        # Serializes encoding and writing of frames
+        self._io_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="parking-journal-flush", daemon=True)
+        self._thread.start()
+
+    def log_create_lot(self, lot_name: str, levels: List[Tuple[int, int, int]]) -> None:
+        self._append((OP_CREATE_LOT, lot_name, 0, 0, tuple(levels)))
+
+    def log_park(self, lot_name: str, level: int, slot: int, vehicle: VehicleData) -> None:
+        # _append, inlined: this runs on every park
+        if self._closed:
+            raise ValueError(f"Journal {self.path} is closed")
+        fields = self._fields
+        fields.extend((OP_PARK, lot_name, level, slot, vehicle))
+        if len(fields) >= self._group_fields:
+            self._wake_flusher()
+
+    def log_remove(self, lot_name: str, level: int, slot: int) -> None:
+        self._append((OP_REMOVE, lot_name, level, slot, None))
+
+    def _append(self, record: Tuple[int, str, int, int, Any]) -> None:
+        """Queue a record, waking the flusher once a group is full"""
+        if self._closed:
+            raise ValueError(f"Journal {self.path} is closed")
+        fields = self._fields
+        fields.extend(record)
+        if len(fields) >= self._group_fields:
+            self._wake_flusher()
+
+    def _wake_flusher(self) -> None:
+        with self._condition:
+            self._condition.notify()
+
+    def sync(self) -> None:
+        """Write and fsync every record logged so far"""
+        with self._io_lock:
+            queued = len(self._fields)
+            if not queued:
+                return
+            popleft = self._fields.popleft
+            body = _encode_frame([popleft() for _ in range(queued)])
+            count = queued // _RECORD_FIELDS
+            self._file.write(_RECORD_HEADER.pack(len(body), zlib.crc32(body)))
+            self._file.write(body)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.records_written += count
+
+    def close(self) -> None:
+        """Flush outstanding records, stop the flusher and close the file
+
+        Stop logging to the journal before closing it.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self.sync()
+        self._file.close()
+
+    def _run(self) -> None:
+        """Flusher loop"""
+        while True:
+            with self._condition:
+                if not self._closed and len(self._fields) < self._group_fields:
+                    self._condition.wait(self.flush_interval)
+                if self._closed:
+                    return
+            self.sync()
+
+def _encode_frame(fields: List[Any]) -> bytes:
+    """Encode queued journal records as one frame body
+
+    The body is a marshalled tuple of columns: op codes, lot names, levels,
+    slots, the layouts of created lots, then one column per field in
+    _JOURNAL_VEHICLE_FIELDS for the parked vehicles, all in record order.
+
+    Args:
+        fields: The records' fields, flattened as JournalWriter queues them
+    """
+    ops, lot_names, levels, slots, payloads = (fields[i::_RECORD_FIELDS] for i in range(_RECORD_FIELDS))
+    layouts = tuple(payload for op, payload in zip(ops, payloads) if op == OP_CREATE_LOT)
+    vehicles = [payload for op, payload in zip(ops, payloads) if op == OP_PARK]
+    columns = [tuple(map(field, vehicles)) for field in _JOURNAL_VEHICLE_FIELDS]
+    # Enum members cannot be marshalled; the code lookup also beats reading .name
+    columns[6] = tuple(map(VEHICLE_TYPE_CODES.__getitem__, columns[6]))
+    return marshal.dumps((ops, lot_names, levels, slots, layouts, *columns))
+
+def _decode_frame(body: bytes) -> List[Tuple[int, str, int, int, Any]]:
+    """Decode a frame body back into (op code, lot name, level, slot, layout or record) tuples"""
+    ops, lot_names, levels, slots, layouts, *vehicle_columns = marshal.loads(body)
+    created = iter(layouts)
+    parked = iter([
+        VehicleData(
+            registration_number=registration_number,
+            manufacturer=manufacturer,
+            model=model,
+            color=color,
+            is_electric=is_electric,
+            is_motorcycle=is_motorcycle,
+            vehicle_type=VEHICLE_TYPES_BY_CODE[type_code],
+            current_battery_charge=charge
+        )
+        for registration_number, manufacturer, model, color, is_electric, is_motorcycle, type_code, charge
+        in zip(*vehicle_columns)
+    ])
+    entries = []
+    for op, lot_name, level, slot in zip(ops, lot_names, levels, slots):
+        if op == OP_PARK:
+            payload = next(parked)
+        elif op == OP_CREATE_LOT:
+            payload = next(created)
+        else:
+            payload = None
+        entries.append((op, lot_name, level, slot, payload))
+    return entries
+
+class ParkingStore:
+    """Snapshot and journal storage for a ParkingLotManagerImpl
+
+    Typical use:
+        store = ParkingStore("data")
+        manager = store.open()      # load snapshot, replay journals, start journaling
+        ...
+        store.close()
+
+    A snapshot is taken automatically, on a background thread, once
+    `snapshot_every` records have been journaled since the last one.
+    """
+
+    def __init__(self, directory: str, group_size: int = 512, flush_interval: float = 0.05,
+                 snapshot_every: Optional[int] = 200_000):
+        """Initialize the store
+
+        Args:
+            directory: Directory holding the snapshot and journals; created if missing
+            group_size: Journal records that trigger an early group flush
+            flush_interval: Maximum seconds between journal flushes
+            snapshot_every: Journal records between automatic snapshots, or None to
+                snapshot only when snapshot() is called
+        """
+        self.directory = directory
+        self.group_size = group_size
+        self.flush_interval = flush_interval
+        self.snapshot_every = snapshot_every
+        self.manager: Optional[ParkingLotManagerImpl] = None
+        self.journal: Optional[JournalWriter] = None
+        self._generation = 0
+        self._records_at_snapshot = 0
+        self._snapshot_lock = threading.Lock()
+        # Guards the record count and the snapshot thread; parks on any thread update them
+        self._trigger_lock = threading.Lock()
+        self._snapshot_thread: Optional[threading.Thread] = None
+        os.makedirs(directory, exist_ok=True)
+
+    def open(self, manager: Optional[ParkingLotManagerImpl] = None) -> ParkingLotManagerImpl:
+        """Load saved state into a manager and start journaling its changes
+
+        Args:
+            manager: An empty manager to load into, or None to create one
+
+        Returns:
+            The manager, with its journal attached
+        """
+        if manager is None:
+            manager = ParkingLotManagerImpl()
+        # Loading allocates hundreds of thousands of long-lived objects; cyclic
+        # collections triggered along the way would find nothing to free
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            snapshot_generation = self._load_snapshot(manager)
+            replayed = 0
+            generations = self._journal_generations()
+            for generation in generations:
+                if generation >= snapshot_generation:
+                    replayed += self._replay_journal(manager, self._journal_path(generation))
+            manager.finish_restore()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        logger.info("Replayed %s journal records", replayed)
+
+        self._generation = max(generations + [snapshot_generation - 1]) + 1
+        self.journal = JournalWriter(self._journal_path(self._generation), self.group_size, self.flush_interval)
+        manager.journal = _SnapshotTrigger(self.journal, self) if self.snapshot_every else self.journal
+        self.manager = manager
+        return manager
+
+    def snapshot(self) -> str:
+        """Write a snapshot of the current state and delete the journals it covers
+
+        Returns:
+            The path of the snapshot file
+        """
+        if self.manager is None or self.journal is None:
+            raise ValueError("Store is not open")
+        with self._snapshot_lock:
+            new_generation = self._generation + 1
+            old_journal = self.journal
+
+            def rotate() -> None:
+                # Runs with every lot locked: later changes go to the new journal
+                self.journal = JournalWriter(self._journal_path(new_generation), self.group_size, self.flush_interval)
+                self._retarget(self.journal)
+
+            layouts, vehicles = self.manager.capture_state(rotate)
+            self._generation = new_generation
+            with self._trigger_lock:
+                self._records_at_snapshot = 0
+            old_journal.close()
+
+            path = os.path.join(self.directory, SNAPSHOT_FILE)
+            self._write_snapshot(path, new_generation, layouts, vehicles)
+            for generation in self._journal_generations():
+                if generation < new_generation:
+                    os.remove(self._journal_path(generation))
+            logger.info("Wrote snapshot of %s vehicles in %s lots", len(vehicles), len(layouts))
+            return path
+
+    def close(self) -> None:
+        """Wait for any snapshot in progress, flush the journal and detach it"""
+        with self._trigger_lock:
+            thread = self._snapshot_thread
+        if thread is not None:
+            thread.join()
+        with self._snapshot_lock:
+            if self.manager is not None:
+                self.manager.journal = None
+            if self.journal is not None:
+                self.journal.close()
+            self.journal = None
+            self.manager = None
+
+    def _retarget(self, journal: JournalWriter) -> None:
+        """Point the manager at a new journal, keeping the snapshot trigger in front"""
+        if self.manager is None:
+            return
+        if isinstance(self.manager.journal, _SnapshotTrigger):
+            self.manager.journal.journal = journal
+        else:
+            self.manager.journal = journal
+
+    def _maybe_snapshot(self) -> None:
+        """Start a background snapshot once enough records have been journaled"""
+        if self.snapshot_every is None:
+            return
+        with self._trigger_lock:
+            self._records_at_snapshot += 1
+            if self._records_at_snapshot < self.snapshot_every:
+                return
+            if self._snapshot_thread is not None and self._snapshot_thread.is_alive():
+                return
+            self._records_at_snapshot = 0
+            self._snapshot_thread = threading.Thread(target=self.snapshot, name="parking-snapshot", daemon=True)
+            self._snapshot_thread.start()
+
+    def _journal_path(self, generation: int) -> str:
+        return os.path.join(self.directory, f"{JOURNAL_PREFIX}{generation:08d}{JOURNAL_SUFFIX}")
+
+    def _journal_generations(self) -> List[int]:
+        """Generations of the journal files present, ascending"""
+        generations = []
+        for name in os.listdir(self.directory):
+            if name.startswith(JOURNAL_PREFIX) and name.endswith(JOURNAL_SUFFIX):
+                try:
+                    generations.append(int(name[len(JOURNAL_PREFIX):-len(JOURNAL_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(generations)
+
+    def _write_snapshot(self, path: str, generation: int, layouts: List[Tuple[str, List[Tuple[int, int, int]]]],
+                        vehicles: List[Tuple[str, int, int, VehicleData]]) -> None:
+        """Write a snapshot file atomically
+
+        Strings are stored once in a NUL-separated table and referenced by
+        index, so repeated makes, models and colors cost four bytes each.
+        """
+        strings: Dict[str, int] = {}
+
+        def string_id(value: str) -> int:
+            index = strings.get(value)
+            if index is None:
+                if "\0" in value:
+                    raise ValueError(f"Cannot store string containing NUL: {value!r}")
+                index = strings[value] = len(strings)
+            return index
+
+        lots = bytearray()
+        for name, layout in layouts:
+            lots += _SNAPSHOT_LOT.pack(string_id(name), len(layout))
+            for level_layout in layout:
+                lots += _LEVEL_LAYOUT.pack(*level_layout)
+
+        rows = bytearray()
+        for lot_name, level, slot, record in vehicles:
+            charge = record.current_battery_charge
+            rows += _SNAPSHOT_VEHICLE.pack(
+                string_id(lot_name), level, slot,
+                string_id(record.registration_number), string_id(record.manufacturer),
+                string_id(record.model), string_id(record.color),
+                _vehicle_flags(record), VEHICLE_TYPE_CODES[record.vehicle_type],
+                charge if charge is not None else 0.0
+            )
+
+        table = "\0".join(strings).encode("utf-8")
+        header = _SNAPSHOT_HEADER.pack(generation, len(layouts), len(vehicles), len(strings), len(table))
+        payload = b"".join((header, table, bytes(lots), bytes(rows)))
+
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(SNAPSHOT_MAGIC)
+            f.write(_RECORD_HEADER.pack(len(payload), zlib.crc32(payload)))
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        if hasattr(os, "O_DIRECTORY"):
+            directory = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+
+    def _load_snapshot(self, manager: ParkingLotManagerImpl) -> int:
+        """Load the snapshot, if there is one, into the manager
+
+        Returns:
+            The snapshot's generation: journals from this generation on must be replayed
+        """
+        path = os.path.join(self.directory, SNAPSHOT_FILE)
+        if not os.path.exists(path):
+            return 0
+        with open(path, "rb") as f:
+            data = f.read()
+        if data[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a parking snapshot")
+        offset = len(SNAPSHOT_MAGIC)
+        length, checksum = _RECORD_HEADER.unpack_from(data, offset)
+        offset += _RECORD_HEADER.size
+        payload = memoryview(data)[offset:offset + length]
+        if len(payload) != length or zlib.crc32(payload) != checksum:
+            raise ValueError(f"Snapshot {path} is corrupt")
+
+        generation, lot_count, vehicle_count, string_count, table_size = _SNAPSHOT_HEADER.unpack_from(payload, 0)
+        offset = _SNAPSHOT_HEADER.size
+        strings = bytes(payload[offset:offset + table_size]).decode("utf-8").split("\0") if string_count else []
+        offset += table_size
+
+        for _ in range(lot_count):
+            name_id, level_count = _SNAPSHOT_LOT.unpack_from(payload, offset)
+            offset += _SNAPSHOT_LOT.size
+            layout = []
+            for _ in range(level_count):
+                layout.append(_LEVEL_LAYOUT.unpack_from(payload, offset))
+                offset += _LEVEL_LAYOUT.size
+            manager.create_lot(_lot_data(strings[name_id], layout))
+
+        rows = payload[offset:offset + vehicle_count * _SNAPSHOT_VEHICLE.size]
+        restored = manager.restore_vehicles(
+            (strings[lot_id], level, slot, _make_record(
+                strings[registration_id], strings[manufacturer_id], strings[model_id], strings[color_id],
+                flags, type_code, charge
+            ))
+            for (lot_id, level, slot, registration_id, manufacturer_id, model_id, color_id,
+                 flags, type_code, charge) in _SNAPSHOT_VEHICLE.iter_unpack(rows)
+        )
+        if restored != vehicle_count:
+            logger.warning("Snapshot %s: %s of %s vehicles could not be restored", path, vehicle_count - restored, vehicle_count)
+        logger.info("Loaded snapshot of %s vehicles in %s lots", restored, lot_count)
+        return generation
+
+    def _replay_journal(self, manager: ParkingLotManagerImpl, path: str) -> int:
+        """Apply a journal file's records to the manager
+
+        Runs of park records are restored as one batch; a batch is applied
+        before any other record so that the order of changes is kept.
+
+        Returns:
+            The number of records applied
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        offset = 0
+        applied = 0
+        parks: List[Tuple[str, int, int, VehicleData]] = []
+        while offset < len(data):
+            if offset + _RECORD_HEADER.size > len(data):
+                logger.warning("Journal %s ends with a torn frame header at byte %s", path, offset)
+                break
+            length, checksum = _RECORD_HEADER.unpack_from(data, offset)
+            start = offset + _RECORD_HEADER.size
+            body = data[start:start + length]
+            if len(body) != length or zlib.crc32(body) != checksum:
+                logger.warning("Journal %s has a torn or corrupt frame at byte %s", path, offset)
+                break
+            entries = _decode_frame(body)
+            for op, lot_name, level, slot, payload in entries:
+                if op == OP_PARK:
+                    parks.append((lot_name, level, slot, payload))
+                    continue
+                self._restore_parks(manager, parks)
+                if op == OP_CREATE_LOT:
+                    manager.create_lot(_lot_data(lot_name, payload))
+                elif op == OP_REMOVE:
+                    manager.remove_vehicle(lot_name, level, slot)
+                else:
+                    raise ValueError(f"Unknown journal operation {op}")
+            applied += len(entries)
+            offset = start + length
+        self._restore_parks(manager, parks)
+        return applied
+
+    @staticmethod
+    def _restore_parks(manager: ParkingLotManagerImpl, parks: List[Tuple[str, int, int, VehicleData]]) -> None:
+        """Restore a batch of decoded park records and empty the list"""
+        if not parks:
+            return
+        restored = manager.restore_vehicles(parks)
+        if restored != len(parks):
+            logger.warning("%s journaled parks could not be applied", len(parks) - restored)
+        parks.clear()
+
+class _SnapshotTrigger(ParkingJournal):
+    """Journal front that counts records and starts automatic snapshots"""
+
+    def __init__(self, journal: JournalWriter, store: ParkingStore):
+        self.journal = journal
+        self.store = store
+
+    def log_create_lot(self, lot_name: str, levels: List[Tuple[int, int, int]]) -> None:
+        self.journal.log_create_lot(lot_name, levels)
+        self.store._maybe_snapshot()
+
+    def log_park(self, lot_name: str, level: int, slot: int, vehicle: VehicleData) -> None:
+        self.journal.log_park(lot_name, level, slot, vehicle)
+        self.store._maybe_snapshot()
+
+    def log_remove(self, lot_name: str, level: int, slot: int) -> None:
+        self.journal.log_remove(lot_name, level, slot)
+        self.store._maybe_snapshot()
@@ -0,0 +1,812 @@
+"""
+SQLite Parking Manager Module
+
+This module implements ParkingLotManager on top of an SQLite database
+(stdlib sqlite3), so parking state is durable without a separate journal
+and can be inspected with ordinary SQL tools.
+
+All slots live in one table. A free slot has a NULL registration number;
+a partial index over free slots finds the lowest free slot of a type on a
+level without scanning, and partial indexes over parked vehicles answer
+registration lookups and attribute searches. File databases run in WAL
+mode with synchronous=NORMAL: a commit is durable once the WAL is synced
+at the next checkpoint, and readers never block the writer.
+"""
+
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from models import (
+    DispatchStats,
+    LevelsAdded,
+    LotCreated,
+    OccupancyData,
+    ParkingEvent,
+    ParkingLevelData,
+    ParkingLotData,
+    ParkingSlotData,
+    SearchCriteria,
+    SearchResult,
+    SlotType,
+    VehicleData,
+    VehicleParked,
+    VehicleRemoved
+)
+from Vehicle import Vehicle, VehicleType, VehicleView, default_battery_charge
+from battery import BatteryChargeProvider
+from dispatch import ObserverDispatcher, SynchronousDispatcher
+from interfaces import (
+    OperationError,
+    ParkingEventObserver,
+    ParkingLotManager,
+    ParkingLotObserver,
+    ValidationError
+)
+
+logger = logging.getLogger(__name__)
+
+# Slot type codes stored in the slots table
+SLOT_TYPE_CODES = {SlotType.REGULAR: 0, SlotType.ELECTRIC: 1}
+SLOT_TYPES_BY_CODE = (SlotType.REGULAR, SlotType.ELECTRIC)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lots (
+    lot_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS levels (
+    lot_id INTEGER NOT NULL REFERENCES lots(lot_id),
+    level INTEGER NOT NULL,
+    regular_slots INTEGER NOT NULL,
+    electric_slots INTEGER NOT NULL,
+    PRIMARY KEY (lot_id, level)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS slots (
+    lot_id INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    slot INTEGER NOT NULL,
+    slot_type INTEGER NOT NULL,
+    registration_number TEXT,
+    manufacturer TEXT,
+    model TEXT,
+    color TEXT,
+    is_electric INTEGER,
+    is_motorcycle INTEGER,
+    vehicle_type TEXT,
+    battery_charge REAL,
+    PRIMARY KEY (lot_id, level, slot)
+);
+CREATE INDEX IF NOT EXISTS slots_free
+    ON slots (lot_id, level, slot_type, slot) WHERE registration_number IS NULL;
+CREATE INDEX IF NOT EXISTS slots_occupied
+    ON slots (lot_id, level, slot) WHERE registration_number IS NOT NULL;
+CREATE UNIQUE INDEX IF NOT EXISTS slots_registration
+    ON slots (registration_number) WHERE registration_number IS NOT NULL;
+CREATE INDEX IF NOT EXISTS slots_color ON slots (color) WHERE registration_number IS NOT NULL;
+CREATE INDEX IF NOT EXISTS slots_manufacturer ON slots (manufacturer) WHERE registration_number IS NOT NULL;
+CREATE INDEX IF NOT EXISTS slots_model ON slots (model) WHERE registration_number IS NOT NULL;
+CREATE INDEX IF NOT EXISTS slots_vehicle_type ON slots (vehicle_type) WHERE registration_number IS NOT NULL;
+"""
+
+# Statements are module constants so that sqlite3's per-connection statement
+# cache, keyed by SQL text, prepares each of them once
+_VEHICLE_COLUMNS = ("registration_number, manufacturer, model, color, is_electric, is_motorcycle, "
+                    "vehicle_type, battery_charge")
+_SQL_LOT_ID = "SELECT lot_id FROM lots WHERE name = ?"
+_SQL_LOT_NAMES = "SELECT name FROM lots ORDER BY lot_id"
+_SQL_INSERT_LOT = "INSERT INTO lots (name) VALUES (?)"
+_SQL_LEVELS = "SELECT level FROM levels WHERE lot_id = ? ORDER BY level"
+_SQL_LEVEL_EXISTS = "SELECT 1 FROM levels WHERE lot_id = ? AND level = ?"
+_SQL_INSERT_LEVEL = "INSERT INTO levels (lot_id, level, regular_slots, electric_slots) VALUES (?, ?, ?, ?)"
+_SQL_INSERT_SLOT = "INSERT INTO slots (lot_id, level, slot, slot_type) VALUES (?, ?, ?, ?)"
+_SQL_LOCATE = "SELECT lots.name, level, slot FROM slots JOIN lots USING (lot_id) WHERE registration_number = ?"
+_SQL_FREE_SLOTS = ("SELECT slot FROM slots WHERE lot_id = ? AND level = ? AND slot_type = ? "
+                   "AND registration_number IS NULL ORDER BY slot LIMIT ?")
+_SQL_OCCUPY = ("UPDATE slots SET registration_number = ?, manufacturer = ?, model = ?, color = ?, "
+               "is_electric = ?, is_motorcycle = ?, vehicle_type = ?, battery_charge = ? "
+               "WHERE lot_id = ? AND level = ? AND slot = ?")
+_SQL_SLOT_VEHICLE = f"SELECT {_VEHICLE_COLUMNS} FROM slots WHERE lot_id = ? AND level = ? AND slot = ?"
+_SQL_RELEASE = ("UPDATE slots SET registration_number = NULL, manufacturer = NULL, model = NULL, color = NULL, "
+                "is_electric = NULL, is_motorcycle = NULL, vehicle_type = NULL, battery_charge = NULL "
+                "WHERE lot_id = ? AND level = ? AND slot = ?")
+_SQL_FIND = (f"SELECT lots.name, level, slot, {_VEHICLE_COLUMNS} FROM slots JOIN lots USING (lot_id) "
+             "WHERE registration_number = ?")
+_SQL_STATUS = (f"SELECT level, slot, slot_type, {_VEHICLE_COLUMNS} FROM slots "
+               "WHERE lot_id = ? ORDER BY level, slot")
+_SQL_OCCUPIED_SLOTS = ("SELECT slot FROM slots WHERE lot_id = ? AND level = ? "
+                       "AND registration_number IS NOT NULL ORDER BY slot")
+_SQL_SLOT = f"SELECT slot_type, {_VEHICLE_COLUMNS} FROM slots WHERE lot_id = ? AND level = ? AND slot = ?"
+_SQL_SLOT_OCCUPIED = ("SELECT 1 FROM slots WHERE lot_id = ? AND level = ? AND slot = ? "
+                      "AND registration_number IS NOT NULL")
+_SQL_LEVEL_VEHICLES = (f"SELECT slot, {_VEHICLE_COLUMNS} FROM slots "
+                       "WHERE lot_id = ? AND level = ? AND registration_number IS NOT NULL ORDER BY slot")
+_SQL_OCCUPANCY = ("SELECT lots.name, levels.level, levels.regular_slots, levels.electric_slots, "
+                  "(SELECT COUNT(*) FROM slots WHERE slots.lot_id = levels.lot_id AND slots.level = levels.level "
+                  "AND slot_type = 0 AND registration_number IS NULL), "
+                  "(SELECT COUNT(*) FROM slots WHERE slots.lot_id = levels.lot_id AND slots.level = levels.level "
+                  "AND slot_type = 1 AND registration_number IS NULL) "
+                  "FROM levels JOIN lots USING (lot_id) ORDER BY levels.lot_id, levels.level")
+
+# Search criteria that map to a plain column comparison, in SearchCriteria order
+_SEARCH_COLUMNS = ("color", "manufacturer", "model", "is_electric", "is_motorcycle")
+
+def _record_from_row(row: Sequence[Any]) -> VehicleData:
+    """Build a vehicle record from the eight vehicle columns of a slots row"""
+    registration_number, manufacturer, model, color, is_electric, is_motorcycle, vehicle_type, charge = row
+    return VehicleData(
+        registration_number=registration_number,
+        manufacturer=manufacturer,
+        model=model,
+        color=color,
+        is_electric=bool(is_electric),
+        is_motorcycle=bool(is_motorcycle),
+        vehicle_type=VehicleType[vehicle_type],
+        current_battery_charge=charge
+    )
+
+def _record_params(record: VehicleData) -> Tuple[Any, ...]:
+    """Get the values of the eight vehicle columns for a record"""
+    return (
+        record.registration_number,
+        record.manufacturer,
+        record.model,
+        record.color,
+        int(record.is_electric),
+        int(record.is_motorcycle),
+        record.vehicle_type.name,
+        record.current_battery_charge
+    )
+
+class SQLiteParkingLotManager(ParkingLotManager):
+    """Parking lot manager that keeps its state in an SQLite database
+
+    One connection is shared by all callers and guarded by a lock, so the
+    manager is thread-safe. Observers are notified after each change has
+    been committed, outside the lock.
+    """
+
+    def __init__(self, path: str = ":memory:", charge_provider: Optional[BatteryChargeProvider] = None,
+                 dispatcher: Optional[ObserverDispatcher] = None):
+        """Open (or create) the database
+
+        Args:
+            path: Path of the database file, or ":memory:" for a private in-memory database
+            charge_provider: Source of the initial battery charge of electric vehicles
+                parked without one; defaults to the process-wide provider
+            dispatcher: Delivers change notifications to observers; defaults to
+                a SynchronousDispatcher, which notifies inside each call
+        """
+        self.path = path
+        self.charge_provider = charge_provider
+        self.dispatcher = dispatcher if dispatcher is not None else SynchronousDispatcher()
+        self.observers: Set[ParkingLotObserver] = set()
+        self.event_observers: Set[ParkingEventObserver] = set()
+        # Transactions are managed explicitly with BEGIN/COMMIT
+        self._connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode = WAL")
+        self._connection.execute("PRAGMA synchronous = NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._lock = threading.RLock()
+        logger.info("Initialized SQLiteParkingLotManager on %s", path)
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._connection.close()
+
+    def create_lot(self, data: ParkingLotData) -> bool:
+        """Create a new parking lot or add levels to an existing lot
+
+        Args:
+            data: The parking lot data
+
+        Returns:
+            True if the lot was created or updated successfully
+
+        Raises:
+            ValidationError: If the lot data is invalid
+            OperationError: If the operation fails
+        """
+        if not data.name:
+            raise ValidationError("Lot name is required")
+
+        try:
+            layout = [
+                (
+                    level_data.level,
+                    len([s for s in level_data.slots if s.slot_type == SlotType.REGULAR]),
+                    len([s for s in level_data.slots if s.slot_type == SlotType.ELECTRIC])
+                )
+                for level_data in data.levels
+            ]
+            with self._lock:
+                with self._transaction() as cursor:
+                    row = cursor.execute(_SQL_LOT_ID, (data.name,)).fetchone()
+                    created = row is None
+                    if created:
+                        lot_id = cursor.execute(_SQL_INSERT_LOT, (data.name,)).lastrowid
+                    else:
+                        lot_id = row[0]
+                    for level, regular_slots, electric_slots in layout:
+                        if cursor.execute(_SQL_LEVEL_EXISTS, (lot_id, level)).fetchone() is not None:
+                            raise OperationError(f"Level {level} already exists in lot {data.name}")
+                        cursor.execute(_SQL_INSERT_LEVEL, (lot_id, level, regular_slots, electric_slots))
+                        # Slots are numbered densely from 1, regular slots first
+                        cursor.executemany(_SQL_INSERT_SLOT, (
+                            (lot_id, level, slot, 0 if slot <= regular_slots else 1)
+                            for slot in range(1, regular_slots + electric_slots + 1)
+                        ))
+                        logger.info("Added level %s to %s with %s regular and %s electric slots",
+                                    level, data.name, regular_slots, electric_slots)
+
+                levels = [level_data.level for level_data in data.levels]
+                if created:
+                    logger.info("Created new parking lot: %s", data.name)
+                    event: ParkingEvent = LotCreated(data.name, levels)
+                else:
+                    logger.info("Added new level to existing lot: %s", data.name)
+                    event = LevelsAdded(data.name, levels)
+                self._publish([event])
+            self._notify_observers(data.name)
+            return True
+        except Exception as e:
+            logger.error("Error creating/updating lot %s: %s", data.name, e)
+            raise OperationError(f"Failed to create/update lot: {str(e)}")
+
+    def park_vehicle(self, lot_name: str, level: int, data: VehicleData) -> Optional[int]:
+        """Park a vehicle in a lot
+
+        Args:
+            lot_name: The name of the lot
+            level: The level to park in
+            data: The vehicle data
+
+        Returns:
+            The slot number where the vehicle was parked, or None if parking failed
+
+        Raises:
+            ValidationError: If the vehicle is already parked
+            OperationError: If the lot doesn't exist or parking fails
+        """
+        record = self._build_record(data)
+        with self._lock:
+            lot_id = self._lot_id(lot_name)
+            location = self._connection.execute(_SQL_LOCATE, (data.registration_number,)).fetchone()
+            if location is not None:
+                parked_lot, parked_level, parked_slot = location
+                raise ValidationError(
+                    f"Vehicle {data.registration_number} is already parked in lot {parked_lot}, "
+                    f"level {parked_level}, slot {parked_slot}"
+                )
+            try:
+                with self._transaction() as cursor:
+                    slot_type = SLOT_TYPE_CODES[SlotType.ELECTRIC if record.is_electric else SlotType.REGULAR]
+                    row = cursor.execute(_SQL_FREE_SLOTS, (lot_id, level, slot_type, 1)).fetchone()
+                    if row is None:
+                        logger.error("No suitable slot found for vehicle %s on level %s of %s",
+                                     record.registration_number, level, lot_name)
+                        return None
+                    slot = row[0]
+                    cursor.execute(_SQL_OCCUPY, _record_params(record) + (lot_id, level, slot))
+            except Exception as e:
+                logger.error("Error parking vehicle in lot %s: %s", lot_name, e)
+                raise OperationError(f"Failed to park vehicle: {str(e)}")
+            if self.event_observers:
+                self._publish([VehicleParked(lot_name, level, slot, VehicleView(record))])
+
+        logger.info("Parked vehicle %s in slot %s", record.registration_number, slot)
+        self._notify_observers(lot_name)
+        return slot
+
+    def remove_vehicle(self, lot_name: str, level: int, slot: int) -> Optional[Vehicle]:
+        """Remove a vehicle from a lot
+
+        Args:
+            lot_name: The name of the lot
+            level: The level to remove from
+            slot: The slot to remove from
+
+        Returns:
+            The removed vehicle, or None if no vehicle was found
+
+        Raises:
+            OperationError: If the lot doesn't exist or removal fails
+        """
+        with self._lock:
+            lot_id = self._lot_id(lot_name)
+            try:
+                with self._transaction() as cursor:
+                    record = self._release(cursor, lot_id, level, slot)
+            except Exception as e:
+                logger.error("Error removing vehicle from lot %s: %s", lot_name, e)
+                raise OperationError(f"Failed to remove vehicle: {str(e)}")
+            if record is None:
+                logger.error("No vehicle found in slot %s on level %s of %s", slot, level, lot_name)
+                return None
+            vehicle = VehicleView(record)
+            if self.event_observers:
+                self._publish([VehicleRemoved(lot_name, level, slot, vehicle)])
+
+        logger.info("Removed vehicle %s from slot %s", record.registration_number, slot)
+        self._notify_observers(lot_name)
+        return vehicle
+
+    def park_many(self, lot_name: str, level: int, vehicles: List[VehicleData]) -> List[Optional[int]]:
+        """Park several vehicles on one level of a lot in one transaction
+
+        Free slots are fetched with one query per slot type and filled with
+        a single executemany, so each vehicle gets the lowest slot still free
+        when its turn comes. Observers are notified once for the batch.
+
+        Args:
+            lot_name: The name of the lot
+            level: The level to park in
+            vehicles: The vehicle data, in parking order
+
+        Returns:
+            The slot number for each vehicle, or None where it could not be parked
+            because no suitable slot was free or it is already parked
+
+        Raises:
+            OperationError: If the lot doesn't exist or parking fails
+        """
+        results: List[Optional[int]] = [None] * len(vehicles)
+        records = [self._build_record(data) for data in vehicles]
+        events: List[ParkingEvent] = []
+        with self._lock:
+            lot_id = self._lot_id(lot_name)
+            try:
+                with self._transaction() as cursor:
+                    # Skip vehicles already parked, or repeated within the batch
+                    seen: Set[str] = set()
+                    candidates: List[int] = []
+                    for position, record in enumerate(records):
+                        registration_number = record.registration_number
+                        if registration_number in seen or cursor.execute(
+                                _SQL_LOCATE, (registration_number,)).fetchone() is not None:
+                            logger.error("Vehicle %s is already parked", registration_number)
+                            continue
+                        seen.add(registration_number)
+                        candidates.append(position)
+
+                    wanted = {0: 0, 1: 0}
+                    for position in candidates:
+                        wanted[1 if records[position].is_electric else 0] += 1
+                    free = {
+                        slot_type: iter([row[0] for row in cursor.execute(
+                            _SQL_FREE_SLOTS, (lot_id, level, slot_type, count))])
+                        for slot_type, count in wanted.items() if count
+                    }
+
+                    updates = []
+                    for position in candidates:
+                        record = records[position]
+                        slot = next(free[1 if record.is_electric else 0], None)
+                        if slot is None:
+                            logger.error("No suitable slot found for vehicle %s", record.registration_number)
+                            continue
+                        results[position] = slot
+                        updates.append(_record_params(record) + (lot_id, level, slot))
+                        if self.event_observers:
+                            events.append(VehicleParked(lot_name, level, slot, VehicleView(record)))
+                    cursor.executemany(_SQL_OCCUPY, updates)
+            except Exception as e:
+                logger.error("Error parking vehicles in lot %s: %s", lot_name, e)
+                raise OperationError(f"Failed to park vehicles: {str(e)}")
+            self._publish(events)
+
+        parked = sum(1 for slot in results if slot is not None)
+        logger.info("Parked %s of %s vehicles on level %s of %s", parked, len(vehicles), level, lot_name)
+        if parked:
+            self._notify_observers(lot_name)
+        return results
+
+    def remove_many(self, locations: List[Tuple[str, int, int]]) -> List[Optional[Vehicle]]:
+        """Remove the vehicles at several locations in one transaction
+
+        Observers are notified once per lot that changed.
+
+        Args:
+            locations: (lot name, level, slot) tuples to clear
+
+        Returns:
+            The removed vehicle for each location, or None where the lot, level
+            or slot does not exist or the slot is empty
+
+        Raises:
+            OperationError: If removal fails
+        """
+        results: List[Optional[Vehicle]] = []
+        events: List[ParkingEvent] = []
+        # Changed lots in first-change order
+        changed_lots: Dict[str, None] = {}
+        with self._lock:
+            try:
+                with self._transaction() as cursor:
+                    lot_ids = dict(cursor.execute("SELECT name, lot_id FROM lots"))
+                    # Slots to clear with one executemany, in first-seen order
+                    released: Dict[Tuple[int, int, int], None] = {}
+                    for lot_name, level, slot in locations:
+                        lot_id = lot_ids.get(lot_name)
+                        row = None
+                        if lot_id is None:
+                            logger.error("Lot %s not found", lot_name)
+                        elif (lot_id, level, slot) not in released:
+                            row = cursor.execute(_SQL_SLOT_VEHICLE, (lot_id, level, slot)).fetchone()
+                        if row is None or row[0] is None:
+                            results.append(None)
+                            continue
+                        vehicle = VehicleView(_record_from_row(row))
+                        released[(lot_id, level, slot)] = None
+                        results.append(vehicle)
+                        changed_lots[lot_name] = None
+                        if self.event_observers:
+                            events.append(VehicleRemoved(lot_name, level, slot, vehicle))
+                    cursor.executemany(_SQL_RELEASE, released)
+            except Exception as e:
+                logger.error("Error removing vehicles: %s", e)
+                raise OperationError(f"Failed to remove vehicles: {str(e)}")
+            self._publish(events)
+
+        for lot_name in changed_lots:
+            self._notify_observers(lot_name)
+        return results
+
+    def search_vehicles(self, lot_name: Optional[str], criteria: SearchCriteria) -> List[SearchResult]:
+        """Search for vehicles matching criteria in a specific lot or in all lots
+
+        Args:
+            lot_name: The name of the lot to search in, or None to search every lot
+            criteria: The search criteria
+
+        Returns:
+            List of search results, ordered by lot creation order, level and slot
+
+        Raises:
+            OperationError: If the lot doesn't exist or search fails
+        """
+        conditions = ["registration_number IS NOT NULL"]
+        params: List[Any] = []
+        if criteria.registration_number:
+            conditions.append("registration_number = ?")
+            params.append(criteria.registration_number)
+        for column in _SEARCH_COLUMNS:
+            value = getattr(criteria, column)
+            # Empty strings mean "any", as in ParkingLotManagerImpl
+            if value is None or value == "":
+                continue
+            conditions.append(f"{column} = ?")
+            params.append(int(value) if isinstance(value, bool) else value)
+        if criteria.vehicle_type:
+            conditions.append("vehicle_type = ?")
+            params.append(criteria.vehicle_type.name)
+
+        with self._lock:
+            if lot_name is not None:
+                conditions.append("lot_id = ?")
+                params.append(self._lot_id(lot_name))
+            try:
+                rows = self._connection.execute(
+                    f"SELECT lots.name, level, slot, {_VEHICLE_COLUMNS} FROM slots JOIN lots USING (lot_id) "
+                    f"WHERE {' AND '.join(conditions)} ORDER BY lot_id, level, slot",
+                    params
+                ).fetchall()
+            except Exception as e:
+                logger.error("Error searching vehicles in lot %s: %s", lot_name, e)
+                raise OperationError(f"Failed to search vehicles: {str(e)}")
+        return [
+            SearchResult(lot_name=row[0], level=row[1], slot=row[2], vehicle=_record_from_row(row[3:]))
+            for row in rows
+        ]
+
+    def find_vehicle(self, registration_number: str) -> Optional[SearchResult]:
+        """Find a parked vehicle by registration number in any lot
+
+        Args:
+            registration_number: The registration number to look up
+
+        Returns:
+            The location and details of the vehicle, or None if it is not parked
+        """
+        with self._lock:
+            row = self._connection.execute(_SQL_FIND, (registration_number,)).fetchone()
+        if row is None:
+            return None
+        return SearchResult(lot_name=row[0], level=row[1], slot=row[2], vehicle=_record_from_row(row[3:]))
+
+    def get_lot_status(self, lot_name: str) -> List[ParkingLevelData]:
+        """Get the status of a lot
+
+        The returned slot objects are snapshots; changing them does not
+        change the database.
+
+        Args:
+            lot_name: The name of the lot
+
+        Returns:
+            List of level data
+
+        Raises:
+            OperationError: If the lot doesn't exist or status retrieval fails
+        """
+        with self._lock:
+            lot_id = self._lot_id(lot_name)
+            try:
+                level_numbers = [row[0] for row in self._connection.execute(_SQL_LEVELS, (lot_id,))]
+                rows = self._connection.execute(_SQL_STATUS, (lot_id,)).fetchall()
+            except Exception as e:
+                logger.error("Error getting status for lot %s: %s", lot_name, e)
+                raise OperationError(f"Failed to get lot status: {str(e)}")
+
+        levels = {level: ParkingLevelData(level=level, slots=[]) for level in level_numbers}
+        for row in rows:
+            level, slot, slot_type = row[:3]
+            vehicle = _record_from_row(row[3:]) if row[3] is not None else None
+            levels[level].slots.append(ParkingSlotData(
+                slot_number=slot,
+                is_occupied=vehicle is not None,
+                vehicle=vehicle,
+                slot_type=SLOT_TYPES_BY_CODE[slot_type]
+            ))
+        return list(levels.values())
+
+    def get_occupancy_summary(self) -> List[OccupancyData]:
+        """Get capacity and availability counters for every lot, level and slot type
+
+        Free slots are counted from the free-slot index.
+
+        Returns:
+            List of occupancy data ordered by lot creation order, level and slot type
+        """
+        with self._lock:
+            rows = self._connection.execute(_SQL_OCCUPANCY).fetchall()
+        summary: List[OccupancyData] = []
+        for lot_name, level, regular_slots, electric_slots, regular_free, electric_free in rows:
+            summary.append(OccupancyData(lot_name, level, SlotType.REGULAR, regular_slots, regular_free))
+            summary.append(OccupancyData(lot_name, level, SlotType.ELECTRIC, electric_slots, electric_free))
+        return summary
+
+    def get_lot_names(self) -> List[str]:
+        """Get the names of all lots
+
+        Returns:
+            List of lot names, in creation order
+        """
+        with self._lock:
+            return [row[0] for row in self._connection.execute(_SQL_LOT_NAMES)]
+
+    def get_levels_for_lot(self, lot_name: str) -> List[int]:
+        """Get the levels in a lot
+
+        Args:
+            lot_name: The name of the lot
+
+        Returns:
+            List of level numbers, or an empty list if the lot doesn't exist
+        """
+        with self._lock:
+            row = self._connection.execute(_SQL_LOT_ID, (lot_name,)).fetchone()
+            if row is None:
+                logger.error("Lot %s not found", lot_name)
+                return []
+            return [level for (level,) in self._connection.execute(_SQL_LEVELS, (row[0],))]
+
+    def get_vehicles_in_lot(self, lot_name: str, level: int) -> Dict[int, Vehicle]:
+        """Get all vehicles in a specific lot and level
+
+        Args:
+            lot_name: The name of the lot
+            level: The level to get vehicles from
+
+        Returns:
+            Dictionary mapping slot numbers to vehicles
+
+        Raises:
+            OperationError: If the lot doesn't exist or retrieval fails
+        """
+        with self._lock:
+            lot_id = self._lot_id(lot_name)
+            try:
+                rows = self._connection.execute(_SQL_LEVEL_VEHICLES, (lot_id, level)).fetchall()
+            except Exception as e:
+                logger.error("Error getting vehicles in lot %s, level %s: %s", lot_name, level, e)
+                raise OperationError(f"Failed to get vehicles: {str(e)}")
+        return {row[0]: VehicleView(_record_from_row(row[1:])) for row in rows}
+
+    def get_occupied_slots(self, lot_name: str, level: int) -> List[int]:
+        """Get the numbers of the occupied slots on a level of a lot
+
+        Read from the occupied-slot index alone.
+
+        Args:
+            lot_name: The name of the lot
+            level: The level number
+
+        Returns:
+            The occupied slot numbers in ascending order, or an empty list if the level does not exist
+
+        Raises:
+            OperationError: If the lot doesn't exist
+        """
+        with self._lock:
+            lot_id = self._lot_id(lot_name)
+            return [row[0] for row in self._connection.execute(_SQL_OCCUPIED_SLOTS, (lot_id, level))]
+
+    def get_slot(self, lot_name: str, level: int, slot: int) -> Optional[ParkingSlotData]:
+        """Get a snapshot of a single slot
+
+        Args:
+            lot_name: The name of the lot
+            level: The level the slot is on
+            slot: The slot number
+
+        Returns:
+            The slot's data, or None if the level or slot does not exist
+
+        Raises:
+            OperationError: If the lot doesn't exist
+        """
+        with self._lock:
+            lot_id = self._lot_id(lot_name)
+            row = self._connection.execute(_SQL_SLOT, (lot_id, level, slot)).fetchone()
+        if row is None:
+            return None
+        vehicle = _record_from_row(row[1:]) if row[1] is not None else None
+        return ParkingSlotData(slot_number=slot, is_occupied=vehicle is not None, vehicle=vehicle,
+                               slot_type=SLOT_TYPES_BY_CODE[row[0]])
+
+    def is_slot_occupied(self, lot_name: str, level: int, slot: int) -> bool:
+        """Check whether a single slot holds a vehicle
+
+        Args:
+            lot_name: The name of the lot
+            level: The level the slot is on
+            slot: The slot number
+
+        Returns:
+            True if the slot exists and is occupied
+
+        Raises:
+            OperationError: If the lot doesn't exist
+        """
+        with self._lock:
+            lot_id = self._lot_id(lot_name)
+            return self._connection.execute(_SQL_SLOT_OCCUPIED, (lot_id, level, slot)).fetchone() is not None
+
+    def register_observer(self, observer: ParkingLotObserver) -> None:
+        """Register an observer
+
+        Args:
+            observer: The observer to register
+        """
+        self.observers.add(observer)
+        logger.info("Registered observer: %s", observer)
+
+    def remove_observer(self, observer: ParkingLotObserver) -> None:
+        """Remove an observer
+
+        Args:
+            observer: The observer to remove
+        """
+        if observer in self.observers:
+            self.observers.remove(observer)
+            logger.info("Unregistered observer: %s", observer)
+
+    def register_event_observer(self, observer: ParkingEventObserver) -> None:
+        """Register an observer of typed change events
+
+        Args:
+            observer: The event observer to register
+        """
+        self.event_observers.add(observer)
+        logger.info("Registered event observer: %s", observer)
+
+    def unregister_event_observer(self, observer: ParkingEventObserver) -> None:
+        """Unregister an observer of typed change events
+
+        Args:
+            observer: The event observer to unregister
+        """
+        if observer in self.event_observers:
+            self.event_observers.remove(observer)
+            logger.info("Unregistered event observer: %s", observer)
+
+    def get_dispatch_stats(self) -> DispatchStats:
+        """Get the observer dispatcher's counters
+
+        Returns:
+            Queue depth and submitted, delivered, merged and dropped notification counts
+        """
+        return self.dispatcher.stats()
+
+    def _lot_id(self, lot_name: str) -> int:
+        """Look up a lot's id; the caller must hold the lock
+
+        Raises:
+            OperationError: If the lot doesn't exist
+        """
+        row = self._connection.execute(_SQL_LOT_ID, (lot_name,)).fetchone()
+        if row is None:
+            raise OperationError(f"Lot {lot_name} not found")
+        return row[0]
+
+    def _release(self, cursor: sqlite3.Cursor, lot_id: int, level: int, slot: int) -> Optional[VehicleData]:
+        """Empty a slot inside the current transaction
+
+        Returns:
+            The record of the vehicle that was in the slot, or None if the slot
+            does not exist or is empty
+        """
+        row = cursor.execute(_SQL_SLOT_VEHICLE, (lot_id, level, slot)).fetchone()
+        if row is None or row[0] is None:
+            return None
+        cursor.execute(_SQL_RELEASE, (lot_id, level, slot))
+        return _record_from_row(row)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Cursor]:
+        """Run a block in BEGIN IMMEDIATE ... COMMIT, rolling back if it raises
+
+        The caller must hold the lock.
+
+        Yields:
+            A cursor on the connection
+        """
+        cursor = self._connection.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield cursor
+        except BaseException:
+            cursor.execute("ROLLBACK")
+            raise
+        cursor.execute("COMMIT")
+
+    def _build_record(self, data: VehicleData) -> VehicleData:
+        """Build the record stored for a vehicle, fixing an EV's initial charge
+
+        Args:
+            data: The vehicle data passed in by the caller
+
+        Returns:
+            A new VehicleData record
+        """
+        charge = data.current_battery_charge
+        if data.is_electric and charge is None:
+            if self.charge_provider is not None:
+                charge = self.charge_provider.initial_charge(data.registration_number)
+            else:
+                charge = default_battery_charge(data.registration_number)
+        return VehicleData(
+            registration_number=data.registration_number,
+            manufacturer=data.manufacturer,
+            model=data.model,
+            color=data.color,
+            is_electric=data.is_electric,
+            is_motorcycle=data.vehicle_type == VehicleType.MOTORCYCLE,
+            vehicle_type=data.vehicle_type,
+            current_battery_charge=charge if data.is_electric else None
+        )
+
+    def _notify_observers(self, lot_name: str) -> None:
+        """Notify all observers of a change through the dispatcher
+
+        Args:
+            lot_name: The name of the lot that was updated
+        """
+        if self.observers:
+            self.dispatcher.submit(lot_name, tuple(self.observers))
+
+    def _publish(self, events: List[ParkingEvent]) -> None:
+        """Send change events to all event observers through the dispatcher
+
+        Called with the manager's lock held, so events reach the dispatcher in
+        the order the changes were committed.
+
+        Args:
+            events: The events, in the order they happened
+        """
+        if events and self.event_observers:
+            self.dispatcher.submit_events(events, tuple(self.event_observers))
@@ -20,6 +20,7 @@ if 'tkinter.messagebox' not in sys.modules:
 
 from Vehicle import VehicleType, create_vehicle
 from ParkingManager import ParkingLot
+from models import SlotType
 
 class TestVehicle(unittest.TestCase):
     """Test cases for Vehicle class and factory functions."""
@@ -132,6 +133,29 @@ class TestParkingLot(unittest.TestCase):
             removed_again = self.lot.remove_vehicle(1, slot)
             self.assertIsNone(removed_again)
 
+    def test_freed_slot_is_reused_first(self):
+        """Test that the lowest freed slot is handed out before higher free slots."""
+        for reg in ("REG1", "REG2", "REG3"):
+            self.lot.park_vehicle(1, create_vehicle(reg, "Toyota", "Corolla", "Red", VehicleType.CAR, False))
+
+        # Free slots 3 and 1, in that order
+        self.lot.remove_vehicle(1, 3)
+        self.lot.remove_vehicle(1, 1)
+
+        car = create_vehicle("REG4", "Honda", "Civic", "Blue", VehicleType.CAR, False)
+        self.assertEqual(self.lot.park_vehicle(1, car), 1)
+        car2 = create_vehicle("REG5", "Honda", "Civic", "Blue", VehicleType.CAR, False)
+        self.assertEqual(self.lot.park_vehicle(1, car2), 3)
+
+        # Electric slot pool is independent of the regular pool
+        ev = create_vehicle("EV1", "Tesla", "Model S", "Blue", VehicleType.CAR, True)
+        self.assertEqual(self.lot.park_vehicle(1, ev), 4)
+
+    def test_park_on_missing_level(self):
+        """Test that parking on a level that does not exist fails."""
+        car = create_vehicle("REG1", "Toyota", "Corolla", "Red", VehicleType.CAR, False)
+        self.assertIsNone(self.lot.park_vehicle(2, car))
+
     def test_get_vehicle(self):
         # Park a vehicle
         regular_car = create_vehicle("REG1", "Toyota", "Corolla", "Red", VehicleType.CAR, False)
@@ -145,6 +169,14 @@ class TestParkingLot(unittest.TestCase):
             if retrieved_vehicle is not None:
                 self.assertEqual(retrieved_vehicle.registration_number, "REG1")
 
+    def test_out_of_range_slot(self):
+        """Test that slot numbers outside the level are rejected."""
+        self.lot.park_vehicle(1, create_vehicle("REG1", "Toyota", "Corolla", "Red", VehicleType.CAR, False))
+        for slot in (0, -1, 5):
+            self.assertIsNone(self.lot.get_vehicle(1, slot))
+            self.assertIsNone(self.lot.remove_vehicle(1, slot))
+        self.assertIsNotNone(self.lot.get_vehicle(1, 1))
+
     def test_status(self):
         # Park some vehicles
         regular_car = create_vehicle("REG1", "Toyota", "Corolla", "Red", VehicleType.CAR, False)
@@ -162,5 +194,30 @@ class TestParkingLot(unittest.TestCase):
         occupied_slots = [slot for slot in status[0].slots if slot.is_occupied]
         self.assertEqual(len(occupied_slots), 2)
 
+class TestColumnarParkingLot(TestParkingLot):
+    """Runs the ParkingLot tests against columnar level storage."""
+    def setUp(self):
+        self.lot = ParkingLot("TestLot", columnar=True)
+        self.lot.add_level(1, 3, 1)
+
+    def test_status_views_are_built_on_demand(self):
+        """Test that status views reflect the columns and count occupancy."""
+        electric_car = create_vehicle("EV1", "Tesla", "Model S", "Blue", VehicleType.CAR, True)
+        self.lot.park_vehicle(1, electric_car)
+        self.assertEqual(self.lot.count_occupied(1), 1)
+
+        slots = self.lot.get_status()[0].slots
+        self.assertEqual([slot.slot_number for slot in slots], [1, 2, 3, 4])
+        self.assertEqual([slot.slot_type for slot in slots], [SlotType.REGULAR] * 3 + [SlotType.ELECTRIC])
+        self.assertTrue(slots[3].is_occupied)
+        vehicle = slots[3].vehicle
+        self.assertIsNotNone(vehicle)
+        if vehicle is not None:
+            self.assertEqual(vehicle.registration_number, "EV1")
+
+        self.lot.remove_vehicle(1, 4)
+        self.assertEqual(self.lot.count_occupied(1), 0)
+        self.assertFalse(self.lot.get_status()[0].slots[3].is_occupied)
+
 if __name__ == "__main__":
     unittest.main()
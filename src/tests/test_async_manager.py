@@ -0,0 +1,144 @@
+"""
+Unit tests for the asyncio front-end.
+
+This module contains unit tests for AsyncParkingLotManager and its change
+event streams, running calls both on the event loop and in an executor.
+"""
+
+import asyncio
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from async_manager import AsyncParkingLotManager
+from dispatch import CoalescingDispatcher
+from interfaces import ValidationError
+from ParkingManager import ParkingLotManagerImpl
+from models import (
+    LotCreated, ParkingLevelData, ParkingLotData, ParkingSlotData, SearchCriteria, SlotType, VehicleData,
+    VehicleParked, VehicleRemoved
+)
+from Vehicle import VehicleType
+
+
+def make_level(level: int, regular_slots: int) -> ParkingLevelData:
+    """Build level data with the given number of regular slots."""
+    return ParkingLevelData(level=level, slots=[
+        ParkingSlotData(slot_number=i + 1, is_occupied=False, slot_type=SlotType.REGULAR)
+        for i in range(regular_slots)
+    ])
+
+
+def make_vehicle(registration_number: str) -> VehicleData:
+    """Build a red regular car."""
+    return VehicleData(registration_number, "Toyota", "Camry", "Red", False, False, VehicleType.CAR)
+
+
+class TestAsyncParkingLotManager(unittest.TestCase):
+    """Test cases for AsyncParkingLotManager."""
+
+    def setUp(self):
+        self.manager = AsyncParkingLotManager(ParkingLotManagerImpl())
+
+    def test_concurrent_sessions(self):
+        """Test that many concurrent gate sessions each get their own slot."""
+        async def scenario():
+            await self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 100)]))
+            await self.manager.create_lot(ParkingLotData(name="South", levels=[make_level(1, 100)]))
+            slots = await asyncio.gather(*(
+                self.manager.park_vehicle("North" if i % 2 else "South", 1, make_vehicle(f"REG{i}"))
+                for i in range(200)
+            ))
+            status = await self.manager.get_lot_status("North")
+            found = await self.manager.search_vehicles(None, SearchCriteria(color="Red"))
+            return slots, status, found
+
+        slots, status, found = asyncio.run(scenario())
+        self.assertEqual(sorted(slots[1::2]), list(range(1, 101)))
+        self.assertEqual(sorted(slots[0::2]), list(range(1, 101)))
+        self.assertTrue(all(slot.is_occupied for slot in status[0].slots))
+        self.assertEqual(len(found), 200)
+        # Calls on the loop cannot interleave, so no lot locks are needed
+        self.assertEqual(self.manager._lot_locks, {})
+
+    def test_errors_propagate(self):
+        """Test that manager exceptions reach the awaiting caller."""
+        async def scenario():
+            await self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 2)]))
+            await self.manager.park_vehicle("North", 1, make_vehicle("REG1"))
+            await self.manager.park_vehicle("North", 1, make_vehicle("REG1"))
+
+        with self.assertRaises(ValidationError):
+            asyncio.run(scenario())
+
+    def test_event_stream(self):
+        """Test that change events can be consumed with async for."""
+        async def scenario():
+            received = []
+            async with self.manager.events() as stream:
+                await self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 2)]))
+                slot = await self.manager.park_vehicle("North", 1, make_vehicle("REG1"))
+                await self.manager.remove_many([("North", 1, slot)])
+                async for event in stream:
+                    received.append(event)
+                    if len(received) == 3:
+                        break
+            # Closing the stream stops the manager from building events
+            self.assertEqual(self.manager.manager.event_observers, set())
+            return received
+
+        received = asyncio.run(scenario())
+        self.assertIsInstance(received[0], LotCreated)
+        self.assertIsInstance(received[1], VehicleParked)
+        self.assertIsInstance(received[2], VehicleRemoved)
+        self.assertEqual(received[2].vehicle.registration_number, "REG1")
+
+    def test_observer_follows_open_streams(self):
+        """Test that the manager stays observed while any stream is open."""
+        observers = self.manager.manager.event_observers
+
+        async def scenario():
+            first = self.manager.events()
+            second = self.manager.events()
+            self.assertEqual(observers, {self.manager})
+            first.close()
+            self.assertEqual(observers, {self.manager})
+            second.close()
+            self.assertEqual(observers, set())
+            async with self.manager.events():
+                self.assertEqual(observers, {self.manager})
+            self.assertEqual(observers, set())
+
+        asyncio.run(scenario())
+
+    def test_executor_and_threaded_dispatch(self):
+        """Test running calls in an executor with events published from a worker thread."""
+        dispatcher = CoalescingDispatcher(window=0.01)
+        executor = ThreadPoolExecutor(max_workers=4)
+        manager = AsyncParkingLotManager(ParkingLotManagerImpl(dispatcher=dispatcher), executor=executor)
+
+        async def scenario():
+            stream = manager.events()
+            await manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 20)]))
+            slots = await asyncio.gather(*(
+                manager.park_vehicle("North", 1, make_vehicle(f"REG{i}")) for i in range(20)
+            ))
+            parked = []
+            async for event in stream:
+                if isinstance(event, VehicleParked):
+                    parked.append(event.slot)
+                if len(parked) == 20:
+                    stream.close()
+            return slots, parked
+
+        try:
+            slots, parked = asyncio.run(scenario())
+        finally:
+            executor.shutdown()
+            dispatcher.close()
+        self.assertEqual(sorted(slots), list(range(1, 21)))
+        self.assertEqual(sorted(parked), list(range(1, 21)))
+        self.assertEqual(set(manager._lot_locks), {"North"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Unit tests for the battery charge providers.
+
+This module contains unit tests that verify the charge providers and how
+vehicles and the parking lot manager use them.
+"""
+
+import unittest
+
+from battery import (
+    FixedChargeProvider,
+    RandomChargeProvider,
+    TelemetryChargeProvider,
+    get_charge_provider,
+    set_charge_provider
+)
+from Vehicle import VehicleType, create_vehicle
+from ParkingManager import ParkingLotManagerImpl
+from models import ParkingLotData, ParkingLevelData, ParkingSlotData, SlotType, VehicleData
+
+class TestChargeProviders(unittest.TestCase):
+    """Test cases for the individual charge providers."""
+
+    def test_seeded_provider_is_reproducible(self):
+        """Test that two providers with the same seed produce the same charges."""
+        first = RandomChargeProvider(seed=42)
+        second = RandomChargeProvider(seed=42)
+        charges = [first.initial_charge(f"EV{i}") for i in range(10)]
+        self.assertEqual(charges, [second.initial_charge(f"EV{i}") for i in range(10)])
+        for charge in charges:
+            self.assertGreaterEqual(charge, 20.0)
+            self.assertLessEqual(charge, 100.0)
+
+    def test_fixed_provider(self):
+        """Test that the fixed provider always returns its charge."""
+        provider = FixedChargeProvider(75.0)
+        self.assertEqual(provider.initial_charge("EV1"), 75.0)
+        self.assertEqual(provider.initial_charge("EV2"), 75.0)
+
+    def test_telemetry_provider(self):
+        """Test that telemetry readings are used, clamped, and fall back when missing."""
+        readings = {"EV1": 64.5, "EV2": 130.0}
+
+        def feed(registration_number):
+            if registration_number == "BROKEN":
+                raise ConnectionError("feed offline")
+            return readings.get(registration_number)
+
+        provider = TelemetryChargeProvider(feed, fallback=FixedChargeProvider(50.0))
+        self.assertEqual(provider.initial_charge("EV1"), 64.5)
+        self.assertEqual(provider.initial_charge("EV2"), 100.0)
+        self.assertEqual(provider.initial_charge("EV3"), 50.0)
+        self.assertEqual(provider.initial_charge("BROKEN"), 50.0)
+
+class TestChargeProviderUsage(unittest.TestCase):
+    """Test cases for vehicles and the manager drawing charges from providers."""
+
+    def setUp(self):
+        self.original_provider = get_charge_provider()
+
+    def tearDown(self):
+        set_charge_provider(self.original_provider)
+
+    def test_vehicle_uses_process_wide_provider(self):
+        """Test that new electric vehicles take their charge from the process-wide provider."""
+        set_charge_provider(FixedChargeProvider(42.0))
+        vehicle = create_vehicle("EV1", "Tesla", "Model 3", "White", VehicleType.CAR, True)
+        self.assertEqual(vehicle.get_battery_charge(), 42.0)
+
+    def test_manager_provider(self):
+        """Test that the manager's provider is asked once per EV at entry."""
+        calls = []
+
+        def feed(registration_number):
+            calls.append(registration_number)
+            return 33.0
+
+        manager = ParkingLotManagerImpl(charge_provider=TelemetryChargeProvider(feed))
+        manager.create_lot(ParkingLotData(name="North", levels=[ParkingLevelData(level=1, slots=[
+            ParkingSlotData(slot_number=1, is_occupied=False, slot_type=SlotType.ELECTRIC)
+        ])]))
+        manager.park_vehicle("North", 1, VehicleData(
+            registration_number="EV1", manufacturer="Tesla", model="Model 3", color="White",
+            is_electric=True, is_motorcycle=False, vehicle_type=VehicleType.CAR
+        ))
+        for _ in range(3):
+            self.assertEqual(manager.get_vehicles_in_lot("North", 1)[1].current_battery_charge, 33.0)
+        self.assertEqual(calls, ["EV1"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Unit tests for observer dispatch.
+
+This module contains unit tests for the synchronous and coalescing observer
+dispatchers, on their own and plugged into ParkingLotManagerImpl.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from dispatch import CoalescingDispatcher, SynchronousDispatcher
+from ParkingManager import ParkingLotManagerImpl
+from models import LotCreated, ParkingLotData, ParkingLevelData, ParkingSlotData, SlotType, VehicleData
+from Vehicle import VehicleType
+
+
+class RecordingObserver:
+    """Observer that records the lots it was told about, optionally slowly."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.updates = []
+        self.threads = set()
+
+    def update(self, message: str):
+        if self.delay:
+            time.sleep(self.delay)
+        self.updates.append(message)
+        self.threads.add(threading.current_thread().name)
+
+    def on_event(self, event):
+        self.updates.append(event)
+
+
+class TestSynchronousDispatcher(unittest.TestCase):
+    """Test cases for SynchronousDispatcher."""
+
+    def test_delivers_immediately(self):
+        """Test that observers are called during submit."""
+        dispatcher = SynchronousDispatcher()
+        observer = RecordingObserver()
+        dispatcher.submit("North", [observer])
+        self.assertEqual(observer.updates, ["North"])
+        stats = dispatcher.stats()
+        self.assertEqual((stats.submitted, stats.delivered, stats.queue_depth), (1, 1, 0))
+
+    def test_observer_errors_are_counted(self):
+        """Test that a failing observer does not stop the others."""
+        dispatcher = SynchronousDispatcher()
+        failing = MagicMock()
+        failing.update.side_effect = RuntimeError("boom")
+        observer = RecordingObserver()
+        dispatcher.submit("North", [failing, observer])
+        self.assertEqual(observer.updates, ["North"])
+        self.assertEqual(dispatcher.stats().observer_errors, 1)
+
+
+class TestCoalescingDispatcher(unittest.TestCase):
+    """Test cases for CoalescingDispatcher."""
+
+    def setUp(self):
+        self.dispatcher = CoalescingDispatcher(window=0.05)
+
+    def tearDown(self):
+        self.dispatcher.close()
+
+    def test_merges_updates_per_lot(self):
+        """Test that repeated updates for a lot within the window are merged."""
+        observer = RecordingObserver()
+        for _ in range(10):
+            self.dispatcher.submit("North", [observer])
+        self.dispatcher.submit("South", [observer])
+        self.assertEqual(self.dispatcher.stats().queue_depth, 2)
+
+        self.assertTrue(self.dispatcher.flush(timeout=5))
+        self.assertEqual(observer.updates, ["North", "South"])
+        self.assertEqual(observer.threads, {"parking-observer-dispatch"})
+        stats = self.dispatcher.stats()
+        self.assertEqual((stats.submitted, stats.merged, stats.delivered, stats.queue_depth), (11, 9, 2, 0))
+
+    def test_delivers_after_window(self):
+        """Test that updates are delivered without an explicit flush."""
+        observer = RecordingObserver()
+        self.dispatcher.submit("North", [observer])
+        deadline = time.monotonic() + 5
+        while not observer.updates and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(observer.updates, ["North"])
+
+    def test_events_are_not_merged(self):
+        """Test that change events are delivered in order, one by one."""
+        observer = RecordingObserver()
+        events = [LotCreated("North", [1]), LotCreated("South", [1])]
+        self.dispatcher.submit_events(events[:1], [observer])
+        self.dispatcher.submit_events(events[1:], [observer])
+        self.dispatcher.submit_events(events[:1], [observer])
+        self.assertTrue(self.dispatcher.flush(timeout=5))
+        self.assertEqual(observer.updates, events + events[:1])
+        stats = self.dispatcher.stats()
+        self.assertEqual((stats.events_delivered, stats.merged), (3, 0))
+
+    def test_drops_when_full(self):
+        """Test that lots beyond max_pending are dropped and counted."""
+        dispatcher = CoalescingDispatcher(window=60, max_pending=2)
+        observer = RecordingObserver()
+        try:
+            for lot_name in ("A", "B", "C", "A"):
+                dispatcher.submit(lot_name, [observer])
+            stats = dispatcher.stats()
+            self.assertEqual((stats.queue_depth, stats.merged, stats.dropped), (2, 1, 1))
+        finally:
+            dispatcher.close()
+        self.assertEqual(observer.updates, ["A", "B"])
+
+    def test_slow_observer_is_off_the_mutation_path(self):
+        """Test that parking does not wait for a slow observer."""
+        # A long window keeps all twenty updates in one merged notification
+        self.dispatcher.close()
+        self.dispatcher = CoalescingDispatcher(window=5)
+        manager = ParkingLotManagerImpl(dispatcher=self.dispatcher)
+        slots = [ParkingSlotData(slot_number=i + 1, is_occupied=False, slot_type=SlotType.REGULAR) for i in range(20)]
+        manager.create_lot(ParkingLotData(name="North", levels=[ParkingLevelData(level=1, slots=slots)]))
+        observer = RecordingObserver(delay=0.2)
+        manager.register_observer(observer)
+
+        start = time.perf_counter()
+        for i in range(20):
+            manager.park_vehicle("North", 1, VehicleData(
+                registration_number=f"REG{i}", manufacturer="Toyota", model="Camry", color="Red",
+                is_electric=False, is_motorcycle=False, vehicle_type=VehicleType.CAR
+            ))
+        self.assertLess(time.perf_counter() - start, 0.2)
+
+        self.assertTrue(manager.dispatcher.flush(timeout=5))
+        self.assertEqual(observer.updates, ["North"])
+        self.assertEqual(manager.get_dispatch_stats().merged, 19)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+"""
+Unit tests for the headless engine package.
+
+This module contains unit tests for parking_engine, checking that importing
+it has no side effects and that its lazily exported names resolve.
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import parking_engine
+
+
+class TestEngineImport(unittest.TestCase):
+    """Test cases for importing parking_engine."""
+
+    def test_import_is_headless(self):
+        """Test that a fresh import loads no GUI or optional modules and touches no files."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        source = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = ("import logging, sys, parking_engine; "
+                  "print(sorted(m for m in ('tkinter', 'ParkingLotUI', 'sqlite3', 'asyncio', 'http.server', "
+                  "'logging.handlers') if m in sys.modules)); "
+                  "print(len(logging.getLogger().handlers))")
+        output = subprocess.run([sys.executable, "-c", script], cwd=directory, capture_output=True, text=True,
+                                env=dict(os.environ, PYTHONPATH=source), check=True).stdout.splitlines()
+        self.assertEqual(output, ["[]", "0"])
+        self.assertEqual(os.listdir(directory), [])
+
+    def test_exports(self):
+        """Test the eager and lazy exports."""
+        manager = parking_engine.ParkingLotManagerImpl()
+        self.assertIsInstance(manager, parking_engine.ParkingLotManager)
+        from sqlite_manager import SQLiteParkingLotManager
+        self.assertIs(parking_engine.SQLiteParkingLotManager, SQLiteParkingLotManager)
+        self.assertIn("ParkingStore", dir(parking_engine))
+        for name in ("FixedChargeProvider", "RandomChargeProvider", "TelemetryChargeProvider"):
+            self.assertTrue(issubclass(getattr(parking_engine, name), parking_engine.BatteryChargeProvider))
+        with self.assertRaises(AttributeError):
+            parking_engine.ParkingLotUI
+
+
+if __name__ == "__main__":
+    unittest.main()
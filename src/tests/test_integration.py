@@ -115,6 +115,7 @@ class TestParkingSystemIntegration(unittest.TestCase):
         self.ui.state_manager.search_registration_number_value.set("ABC123")
         self.ui.state_manager.search_type_value.set("registration")
         self.ui._handle_search()
+        self.ui.tasks.drain(timeout=5)
         
         # Verify search results
         items = self.ui.results_tree.get_children()
@@ -185,6 +186,7 @@ class TestParkingSystemIntegration(unittest.TestCase):
             self.ui.state_manager.search_registration_number_value.set(reg)
             self.ui.state_manager.search_type_value.set("registration")
             self.ui._handle_search()
+            self.ui.tasks.drain(timeout=5)
             
             # Verify search results
             items = self.ui.results_tree.get_children()
@@ -0,0 +1,96 @@
+"""
+Unit tests for logging configuration.
+
+This module contains unit tests for configure_logging, checking that
+records reach the log file through the queue listener and that importing
+the parking modules configures nothing.
+"""
+
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from logging.handlers import QueueHandler
+
+from logging_config import configure_logging, stop_logging
+
+
+class TestConfigureLogging(unittest.TestCase):
+    """Test cases for configure_logging."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        root = logging.getLogger()
+        self.addCleanup(root.setLevel, root.level)
+        self.addCleanup(stop_logging)
+
+    def test_records_reach_file_through_queue(self):
+        """Test that records from any thread are written by the listener, and filtered ones are not."""
+        path = os.path.join(self.directory, "parking.log")
+        configure_logging(log_file=path, console=False)
+        logger = logging.getLogger("parking.test")
+
+        thread = threading.Thread(target=logger.info, args=("Parked vehicle %s in slot %s", "REG1", 7))
+        thread.start()
+        thread.join()
+        logger.debug("Filtered %s", "out")
+        stop_logging()
+
+        with open(path) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].endswith("parking.test - INFO - Parked vehicle REG1 in slot 7"))
+
+    def test_arguments_formatted_at_call(self):
+        """Test that a mutable argument is logged as it was when the call was made."""
+        path = os.path.join(self.directory, "parking.log")
+        configure_logging(log_file=path, console=False)
+        slots = [1]
+        logging.getLogger("parking.test").info("Free slots %s", slots)
+        slots.append(2)
+        stop_logging()
+
+        with open(path) as f:
+            self.assertTrue(f.read().rstrip().endswith("Free slots [1]"))
+
+    def test_lean_records_are_opt_in(self):
+        """Test that only lean_records changes the logging module's record options, and only until stopped."""
+        configure_logging(log_file=None, console=False)
+        self.assertTrue(logging.logThreads)
+        self.assertIsNotNone(logging._srcfile)
+
+        configure_logging(log_file=None, console=False, lean_records=True)
+        self.assertFalse(logging.logThreads)
+        self.assertIsNone(logging._srcfile)
+        stop_logging()
+        self.assertTrue(logging.logThreads)
+        self.assertIsNotNone(logging._srcfile)
+
+    def test_reconfigure_replaces_handler(self):
+        """Test that configuring twice leaves a single queue handler on the root logger."""
+        configure_logging(log_file=None, console=False)
+        configure_logging(log_file=None, console=False)
+        queue_handlers = [handler for handler in logging.getLogger().handlers
+                          if isinstance(handler, QueueHandler)]
+        self.assertEqual(len(queue_handlers), 1)
+        stop_logging()
+        self.assertNotIn(queue_handlers[0], logging.getLogger().handlers)
+
+    def test_import_configures_nothing(self):
+        """Test that importing the manager adds no handlers and creates no log file."""
+        source = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = ("import logging, ParkingManager, persistence, sqlite_manager; "
+                  "print(len(logging.getLogger().handlers))")
+        output = subprocess.run([sys.executable, "-c", script], cwd=self.directory, capture_output=True, text=True,
+                                env=dict(os.environ, PYTHONPATH=source), check=True).stdout
+        self.assertEqual(output.strip(), "0")
+        self.assertEqual(os.listdir(self.directory), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Unit tests for operation metrics.
+
+This module contains unit tests for MetricsRecorder, the manager's
+get_metrics snapshot and the Prometheus text exporter.
+"""
+
+import unittest
+import urllib.request
+
+from interfaces import OperationError, ValidationError
+from metrics import MetricsRecorder, PrometheusExporter, format_prometheus
+from models import ParkingLevelData, ParkingLotData, ParkingSlotData, SearchCriteria, SlotType, VehicleData
+from ParkingManager import ParkingLotManagerImpl
+from Vehicle import VehicleType
+
+
+def make_lot(name: str, slots: int) -> ParkingLotData:
+    """Build a one-level lot with the given number of regular slots."""
+    return ParkingLotData(name=name, levels=[ParkingLevelData(level=1, slots=[
+        ParkingSlotData(slot_number=i + 1, is_occupied=False, slot_type=SlotType.REGULAR) for i in range(slots)
+    ])])
+
+
+def make_vehicle(registration_number: str) -> VehicleData:
+    """Build a car with the given registration number."""
+    return VehicleData(registration_number, "Toyota", "Camry", "Red", False, False, VehicleType.CAR)
+
+
+class TestMetricsRecorder(unittest.TestCase):
+    """Test cases for MetricsRecorder."""
+
+    def test_buckets_and_errors(self):
+        """Test that calls land in power-of-two microsecond buckets and errors are counted by type."""
+        recorder = MetricsRecorder()
+        recorder.record("park_vehicle", 500)  # under 1us
+        recorder.record("park_vehicle", 3_000)  # 3us: under 4us
+        recorder.record("park_vehicle", 4_000)  # 4us: under 8us
+        recorder.record("park_vehicle", 10 ** 12)  # beyond the last bound
+        recorder.record("park_vehicle", 1_000, ValidationError("duplicate"))
+
+        snapshot = recorder.snapshot()
+        metrics = snapshot.operations["park_vehicle"]
+        self.assertEqual(metrics.calls, 5)
+        self.assertEqual(metrics.errors, {"ValidationError": 1})
+        self.assertEqual(len(metrics.bucket_counts), len(snapshot.bucket_bounds) + 1)
+        self.assertEqual(metrics.bucket_counts[0], 1)
+        self.assertEqual(metrics.bucket_counts[1], 1)
+        self.assertEqual(metrics.bucket_counts[2], 1)
+        self.assertEqual(metrics.bucket_counts[3], 1)
+        self.assertEqual(metrics.bucket_counts[-1], 1)
+        self.assertEqual(snapshot.bucket_bounds[:4], [1e-06, 2e-06, 4e-06, 8e-06])
+        self.assertEqual(snapshot.quantile("park_vehicle", 0.5), 4e-06)
+        self.assertEqual(snapshot.quantile("park_vehicle", 1.0), float("inf"))
+        self.assertIsNone(snapshot.quantile("remove_vehicle", 0.5))
+
+        recorder.reset()
+        self.assertEqual(recorder.snapshot().operations, {})
+
+    def test_quantile_skips_empty_buckets(self):
+        """Test that the extreme quantiles come from buckets that hold samples."""
+        recorder = MetricsRecorder()
+        recorder.record("park_vehicle", 3_000)  # under 4us
+        recorder.record("park_vehicle", 5_000)  # under 8us
+
+        snapshot = recorder.snapshot()
+        self.assertEqual(snapshot.quantile("park_vehicle", 0.0), 4e-06)
+        self.assertEqual(snapshot.quantile("park_vehicle", 0.5), 4e-06)
+        self.assertEqual(snapshot.quantile("park_vehicle", 1.0), 8e-06)
+
+
+class TestManagerMetrics(unittest.TestCase):
+    """Test cases for the metrics of ParkingLotManagerImpl."""
+
+    def test_operations_are_counted(self):
+        """Test call and error counts of instrumented manager operations."""
+        manager = ParkingLotManagerImpl(metrics=MetricsRecorder())
+        manager.create_lot(make_lot("Main", 2))
+        manager.park_vehicle("Main", 1, make_vehicle("REG1"))
+        manager.park_vehicle("Main", 1, make_vehicle("REG2"))
+        with self.assertRaises(ValidationError):
+            manager.park_vehicle("Main", 1, make_vehicle("REG1"))
+        with self.assertRaises(OperationError):
+            manager.get_lot_status("Nowhere")
+        manager.remove_vehicle("Main", 1, 1)
+        manager.search_vehicles(None, SearchCriteria(color="Red"))
+
+        operations = manager.get_metrics().operations
+        self.assertEqual({name: metrics.calls for name, metrics in operations.items()}, {
+            "create_lot": 1, "park_vehicle": 3, "remove_vehicle": 1, "search_vehicles": 1, "get_lot_status": 1
+        })
+        self.assertEqual(operations["park_vehicle"].errors, {"ValidationError": 1})
+        self.assertEqual(operations["get_lot_status"].errors, {"OperationError": 1})
+        self.assertEqual(sum(operations["park_vehicle"].bucket_counts), 3)
+        self.assertGreater(operations["park_vehicle"].total_seconds, 0)
+
+    def test_disabled_by_default(self):
+        """Test that a manager without a recorder calls its methods directly and reports nothing."""
+        manager = ParkingLotManagerImpl()
+        manager.create_lot(make_lot("Main", 1))
+        manager.park_vehicle("Main", 1, make_vehicle("REG1"))
+        self.assertNotIn("park_vehicle", vars(manager))
+        snapshot = manager.get_metrics()
+        self.assertEqual(snapshot.operations, {})
+        self.assertTrue(snapshot.bucket_bounds)
+
+
+class TestPrometheusExport(unittest.TestCase):
+    """Test cases for the Prometheus text format and exporter."""
+
+    def setUp(self):
+        self.manager = ParkingLotManagerImpl(metrics=MetricsRecorder())
+        self.manager.create_lot(make_lot("Main", 1))
+        self.manager.park_vehicle("Main", 1, make_vehicle("REG1"))
+        with self.assertRaises(ValidationError):
+            self.manager.park_vehicle("Main", 1, make_vehicle("REG1"))
+
+    def test_format(self):
+        """Test the counters and the cumulative histogram in the exposition text."""
+        lines = format_prometheus(self.manager.get_metrics()).splitlines()
+        self.assertIn('parking_operations_total{operation="park_vehicle"} 2', lines)
+        self.assertIn('parking_operation_errors_total{operation="park_vehicle",exception="ValidationError"} 1', lines)
+        self.assertIn('parking_operation_duration_seconds_bucket{operation="park_vehicle",le="+Inf"} 2', lines)
+        self.assertIn('parking_operation_duration_seconds_count{operation="park_vehicle"} 2', lines)
+        buckets = [int(line.rsplit(" ", 1)[1]) for line in lines
+                   if line.startswith('parking_operation_duration_seconds_bucket{operation="park_vehicle"')]
+        self.assertEqual(buckets, sorted(buckets))
+        self.assertIn("# TYPE parking_operation_duration_seconds histogram", lines)
+
+    def test_exporter(self):
+        """Test that the exporter serves the current metrics over HTTP."""
+        exporter = PrometheusExporter(self.manager.get_metrics, port=0)
+        self.addCleanup(exporter.close)
+        with urllib.request.urlopen(f"http://127.0.0.1:{exporter.port}/metrics", timeout=5) as response:
+            self.assertTrue(response.headers["Content-Type"].startswith("text/plain"))
+            body = response.read().decode("utf-8")
+        self.assertIn('parking_operations_total{operation="create_lot"} 1', body)
+
+
+if __name__ == "__main__":
+    unittest.main()
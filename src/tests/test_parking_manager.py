@@ -0,0 +1,563 @@
+"""
+Unit tests for the parking lot manager.
+
+This module contains unit tests that exercise ParkingLotManagerImpl directly,
+without any GUI components.
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from Vehicle import VehicleType
+from ParkingManager import ParkingLotManagerImpl
+from models import (
+    LevelsAdded, LotCreated, ParkingLotData, ParkingLevelData, ParkingSlotData, SearchCriteria, SlotType,
+    VehicleData, VehicleParked, VehicleRemoved
+)
+from interfaces import OperationError, ParkingEventObserver, ValidationError
+
+
+def make_level(level: int, regular_slots: int, electric_slots: int) -> ParkingLevelData:
+    """Build level data with the given number of regular and electric slots."""
+    slots = [
+        ParkingSlotData(slot_number=i + 1, is_occupied=False, slot_type=SlotType.REGULAR)
+        for i in range(regular_slots)
+    ] + [
+        ParkingSlotData(slot_number=regular_slots + i + 1, is_occupied=False, slot_type=SlotType.ELECTRIC)
+        for i in range(electric_slots)
+    ]
+    return ParkingLevelData(level=level, slots=slots)
+
+
+def make_vehicle(registration_number: str, manufacturer: str = "Toyota", model: str = "Camry",
+                 color: str = "Red", vehicle_type: VehicleType = VehicleType.CAR,
+                 is_electric: bool = False) -> VehicleData:
+    """Build vehicle data with sensible defaults."""
+    return VehicleData(
+        registration_number=registration_number,
+        manufacturer=manufacturer,
+        model=model,
+        color=color,
+        is_electric=is_electric,
+        is_motorcycle=vehicle_type == VehicleType.MOTORCYCLE,
+        vehicle_type=vehicle_type
+    )
+
+
+class TestRegistrationIndex(unittest.TestCase):
+    """Test cases for registration number lookups."""
+
+    def setUp(self):
+        self.manager = ParkingLotManagerImpl()
+        self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 3, 1)]))
+        self.manager.create_lot(ParkingLotData(name="South", levels=[make_level(1, 3, 1), make_level(2, 2, 0)]))
+
+    def test_find_vehicle(self):
+        """Test that a parked vehicle can be found by registration number in any lot."""
+        self.manager.park_vehicle("South", 2, make_vehicle("ABC123"))
+        result = self.manager.find_vehicle("ABC123")
+        self.assertIsNotNone(result)
+        if result is not None:
+            self.assertEqual((result.lot_name, result.level, result.slot), ("South", 2, 1))
+            self.assertEqual(result.vehicle.registration_number, "ABC123")
+        self.assertIsNone(self.manager.find_vehicle("NOPE"))
+
+    def test_find_vehicle_after_remove(self):
+        """Test that removed vehicles are no longer found."""
+        slot = self.manager.park_vehicle("North", 1, make_vehicle("ABC123"))
+        self.assertIsNotNone(slot)
+        if slot is not None:
+            self.manager.remove_vehicle("North", 1, slot)
+        self.assertIsNone(self.manager.find_vehicle("ABC123"))
+
+    def test_duplicate_registration_rejected(self):
+        """Test that the same plate cannot be parked twice, even in another lot."""
+        self.manager.park_vehicle("North", 1, make_vehicle("ABC123"))
+        with self.assertRaises(ValidationError):
+            self.manager.park_vehicle("South", 1, make_vehicle("ABC123"))
+        # The plate can be parked again once it has left
+        self.manager.remove_vehicle("North", 1, 1)
+        self.assertEqual(self.manager.park_vehicle("South", 1, make_vehicle("ABC123")), 1)
+
+    def test_search_by_registration(self):
+        """Test that registration searches only return the lot holding the vehicle."""
+        self.manager.park_vehicle("North", 1, make_vehicle("ABC123", color="Blue"))
+        criteria = SearchCriteria(registration_number="ABC123")
+        self.assertEqual(len(self.manager.search_vehicles("North", criteria)), 1)
+        self.assertEqual(self.manager.search_vehicles("South", criteria), [])
+        # Other criteria still apply
+        self.assertEqual(self.manager.search_vehicles("North", SearchCriteria(registration_number="ABC123", color="Red")), [])
+
+    def test_unknown_lot(self):
+        """Test that operations on a missing lot raise OperationError."""
+        with self.assertRaises(OperationError):
+            self.manager.park_vehicle("Nowhere", 1, make_vehicle("ABC123"))
+
+
+class TestAttributeSearch(unittest.TestCase):
+    """Test cases for index-backed attribute searches."""
+
+    def setUp(self):
+        self.manager = ParkingLotManagerImpl()
+        self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 4, 2)]))
+        self.manager.create_lot(ParkingLotData(name="South", levels=[make_level(1, 4, 2)]))
+        self.manager.park_vehicle("North", 1, make_vehicle("N1", "Tesla", "Model 3", "Red", is_electric=True))
+        self.manager.park_vehicle("North", 1, make_vehicle("N2", "Toyota", "Camry", "Red"))
+        self.manager.park_vehicle("North", 1, make_vehicle("N3", "Honda", "CBR", "Black", VehicleType.MOTORCYCLE))
+        self.manager.park_vehicle("South", 1, make_vehicle("S1", "Tesla", "Model 3", "Red", is_electric=True))
+        self.manager.park_vehicle("South", 1, make_vehicle("S2", "Tesla", "Model 3", "White", is_electric=True))
+
+    def registrations(self, lot_name, criteria):
+        return [result.vehicle.registration_number for result in self.manager.search_vehicles(lot_name, criteria)]
+
+    def test_search_all_lots(self):
+        """Test that a None lot name searches every lot, ordered by lot, level and slot."""
+        criteria = SearchCriteria(color="Red", manufacturer="Tesla", model="Model 3")
+        self.assertEqual(self.registrations(None, criteria), ["N1", "S1"])
+        self.assertEqual(self.registrations("South", criteria), ["S1"])
+
+    def test_boolean_and_type_criteria(self):
+        """Test is_electric, is_motorcycle and vehicle_type criteria."""
+        self.assertEqual(self.registrations(None, SearchCriteria(is_electric=False)), ["N2", "N3"])
+        self.assertEqual(self.registrations(None, SearchCriteria(is_motorcycle=True)), ["N3"])
+        self.assertEqual(self.registrations("North", SearchCriteria(vehicle_type=VehicleType.CAR)), ["N2", "N1"])
+
+    def test_empty_criteria_match_everything(self):
+        """Test that empty strings and unset criteria do not filter."""
+        self.assertEqual(self.registrations(None, SearchCriteria(color="", model="")), ["N2", "N3", "N1", "S1", "S2"])
+        self.assertEqual(self.registrations("South", SearchCriteria()), ["S1", "S2"])
+
+    def test_index_follows_removals(self):
+        """Test that removed vehicles disappear from attribute searches."""
+        self.manager.remove_vehicle("North", 1, 5)
+        self.assertEqual(self.registrations(None, SearchCriteria(manufacturer="Tesla")), ["S1", "S2"])
+        self.assertEqual(self.registrations(None, SearchCriteria(color="Purple")), [])
+
+    def test_index_matches_full_scan(self):
+        """Test that index results agree with checking every vehicle against the criteria."""
+        criteria_list = [
+            SearchCriteria(color="Red"),
+            SearchCriteria(manufacturer="Tesla", is_electric=True),
+            SearchCriteria(model="Camry", is_motorcycle=False),
+            SearchCriteria(color="Red", vehicle_type=VehicleType.MOTORCYCLE),
+        ]
+        everything = self.manager.search_vehicles(None, SearchCriteria())
+        for criteria in criteria_list:
+            expected = [r.vehicle.registration_number for r in everything
+                        if self.manager._matches_criteria(r.vehicle, criteria)]
+            self.assertEqual(self.registrations(None, criteria), expected)
+
+
+class TestVehicleRecords(unittest.TestCase):
+    """Test cases for the stored vehicle record and the views handed out for it."""
+
+    def setUp(self):
+        self.manager = ParkingLotManagerImpl()
+        self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 2, 2)]))
+
+    def test_reads_share_one_record(self):
+        """Test that reads return views of the stored record instead of copies."""
+        data = make_vehicle("EV1", "Tesla", "Model 3", is_electric=True)
+        slot = self.manager.park_vehicle("North", 1, data)
+        self.assertEqual(slot, 3)
+
+        lot = self.manager.lots["North"]
+        record = lot.get_vehicle_data(1, 3)
+        self.assertIsNotNone(record)
+        # The caller's object is not stored or modified
+        self.assertIsNot(record, data)
+        self.assertIsNone(data.current_battery_charge)
+
+        result = self.manager.find_vehicle("EV1")
+        self.assertIsNotNone(result)
+        if result is not None:
+            self.assertIs(result.vehicle, record)
+
+    def test_log_without_battery_charge(self):
+        """Test that parking an electric record with no charge set logs cleanly."""
+        lot = self.manager.lots["North"]
+        with self.assertLogs("ParkingManager", level="INFO") as logs:
+            slot = lot.park_vehicle_data(1, make_vehicle("EV2", is_electric=True))
+        self.assertEqual(slot, 3)
+        self.assertIn("Parked electric vehicle EV2 in slot 3 with charge None%", logs.output[-1])
+
+    def test_battery_charge_is_stable_across_reads(self):
+        """Test that an EV reports the same charge on every read."""
+        self.manager.park_vehicle("North", 1, make_vehicle("EV1", is_electric=True))
+        lot = self.manager.lots["North"]
+        charges = {lot.get_vehicle(1, 3).current_battery_charge for _ in range(5)}  # type: ignore[union-attr]
+        charges.add(self.manager.get_vehicles_in_lot("North", 1)[3].current_battery_charge)
+        self.assertEqual(len(charges), 1)
+        charge = charges.pop()
+        self.assertIsNotNone(charge)
+        if charge is not None:
+            self.assertGreaterEqual(charge, 20.0)
+            self.assertLessEqual(charge, 100.0)
+
+    def test_views_are_read_only(self):
+        """Test that vehicles handed out by reads cannot be modified."""
+        self.manager.park_vehicle("North", 1, make_vehicle("EV1", color="Blue", is_electric=True))
+        vehicle = self.manager.get_vehicles_in_lot("North", 1)[3]
+        self.assertEqual(vehicle.get_color(), "Blue")
+        self.assertEqual(vehicle.get_type(), "electric_car")
+        with self.assertRaises(AttributeError):
+            vehicle.color = "Red"  # type: ignore[misc]
+        with self.assertRaises(AttributeError):
+            vehicle.set_battery_charge(50.0)
+
+    def test_removed_vehicle_keeps_its_data(self):
+        """Test that the vehicle returned by remove_vehicle still describes the removed car."""
+        self.manager.park_vehicle("North", 1, make_vehicle("ABC123", manufacturer="Honda"))
+        removed = self.manager.remove_vehicle("North", 1, 1)
+        self.assertIsNotNone(removed)
+        if removed is not None:
+            self.assertEqual(removed.registration_number, "ABC123")
+            self.assertEqual(removed.manufacturer, "Honda")
+        self.assertEqual(self.manager.get_vehicles_in_lot("North", 1), {})
+
+
+class TestOccupancySummary(unittest.TestCase):
+    """Test cases for the occupancy counters."""
+
+    def setUp(self):
+        self.manager = ParkingLotManagerImpl()
+        self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 3, 2), make_level(2, 4, 0)]))
+        self.manager.create_lot(ParkingLotData(name="South", levels=[make_level(1, 1, 1)]))
+
+    def counters(self):
+        return [
+            (o.lot_name, o.level, o.slot_type, o.capacity, o.available)
+            for o in self.manager.get_occupancy_summary()
+        ]
+
+    def test_empty_lots(self):
+        """Test that fresh lots report full availability."""
+        self.assertEqual(self.counters(), [
+            ("North", 1, SlotType.REGULAR, 3, 3),
+            ("North", 1, SlotType.ELECTRIC, 2, 2),
+            ("North", 2, SlotType.REGULAR, 4, 4),
+            ("North", 2, SlotType.ELECTRIC, 0, 0),
+            ("South", 1, SlotType.REGULAR, 1, 1),
+            ("South", 1, SlotType.ELECTRIC, 1, 1),
+        ])
+
+    def test_counters_follow_park_and_remove(self):
+        """Test that parking and removing update the counters."""
+        self.manager.park_vehicle("North", 1, make_vehicle("R1"))
+        self.manager.park_vehicle("North", 1, make_vehicle("E1", is_electric=True))
+        self.manager.park_vehicle("North", 1, make_vehicle("R2"))
+        self.manager.remove_vehicle("North", 1, 1)
+        # Failed parks change nothing
+        self.manager.park_vehicle("South", 1, make_vehicle("R3"))
+        self.assertIsNone(self.manager.park_vehicle("South", 1, make_vehicle("R4")))
+
+        summary = self.manager.get_occupancy_summary()
+        north_regular = summary[0]
+        self.assertEqual((north_regular.capacity, north_regular.available, north_regular.occupied), (3, 2, 1))
+        self.assertEqual(summary[1].available, 1)
+        self.assertEqual(summary[4].available, 0)
+
+        # Counters agree with the slot-level status
+        for occupancy in summary:
+            status = self.manager.get_lot_status(occupancy.lot_name)
+            slots = [slot for level in status if level.level == occupancy.level
+                     for slot in level.slots if slot.slot_type == occupancy.slot_type]
+            self.assertEqual(len(slots), occupancy.capacity)
+            self.assertEqual(sum(1 for slot in slots if not slot.is_occupied), occupancy.available)
+
+
+class TestSlotQueries(unittest.TestCase):
+    """Test cases for the single-level and single-slot queries."""
+
+    def check_queries(self, manager):
+        manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 3, 2), make_level(2, 2, 0)]))
+        manager.park_vehicle("North", 1, make_vehicle("R1"))
+        manager.park_vehicle("North", 1, make_vehicle("R2"))
+        manager.park_vehicle("North", 1, make_vehicle("E1", is_electric=True))
+        manager.park_vehicle("North", 2, make_vehicle("R3"))
+        manager.remove_vehicle("North", 1, 1)
+
+        self.assertEqual(manager.get_occupied_slots("North", 1), [2, 4])
+        self.assertEqual(manager.get_occupied_slots("North", 2), [1])
+        self.assertEqual(manager.get_occupied_slots("North", 9), [])
+
+        slot = manager.get_slot("North", 1, 4)
+        self.assertEqual((slot.slot_number, slot.is_occupied, slot.slot_type), (4, True, SlotType.ELECTRIC))
+        self.assertEqual(slot.vehicle.registration_number, "E1")
+        empty = manager.get_slot("North", 1, 1)
+        self.assertFalse(empty.is_occupied)
+        self.assertIsNone(empty.vehicle)
+        self.assertIsNone(manager.get_slot("North", 1, 6))
+        self.assertIsNone(manager.get_slot("North", 9, 1))
+
+        self.assertTrue(manager.is_slot_occupied("North", 1, 2))
+        self.assertFalse(manager.is_slot_occupied("North", 1, 1))
+        self.assertFalse(manager.is_slot_occupied("North", 1, 6))
+
+        # The targeted queries agree with the full status
+        for level in manager.get_lot_status("North"):
+            self.assertEqual(manager.get_occupied_slots("North", level.level),
+                             [s.slot_number for s in level.slots if s.is_occupied])
+
+        with self.assertRaises(OperationError):
+            manager.get_occupied_slots("Missing", 1)
+        with self.assertRaises(OperationError):
+            manager.get_slot("Missing", 1, 1)
+        with self.assertRaises(OperationError):
+            manager.is_slot_occupied("Missing", 1, 1)
+
+    def test_slot_list_storage(self):
+        """Test the queries against slot-list level storage."""
+        self.check_queries(ParkingLotManagerImpl())
+
+    def test_columnar_storage(self):
+        """Test the queries against columnar level storage."""
+        self.check_queries(ParkingLotManagerImpl(columnar_levels=True))
+
+    def test_storages_agree_after_churn(self):
+        """Test that both level storages report the same occupied slots after parks and removes."""
+        managers = [ParkingLotManagerImpl(), ParkingLotManagerImpl(columnar_levels=True)]
+        for manager in managers:
+            manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 40, 10), make_level(2, 5, 5)]))
+            for i in range(45):
+                manager.park_vehicle("North", 1 + i % 2, make_vehicle(f"R{i}", is_electric=i % 7 == 0))
+            manager.remove_many([("North", 1, slot) for slot in range(1, 50, 3)] + [("North", 2, 2)])
+            manager.park_many("North", 1, [make_vehicle(f"S{i}") for i in range(5)])
+            manager.remove_vehicle("North", 2, 1)
+
+        for level in (1, 2):
+            slot_list, columnar = (manager.get_occupied_slots("North", level) for manager in managers)
+            self.assertEqual(slot_list, columnar)
+            self.assertEqual(slot_list, [slot.slot_number for status in managers[0].get_lot_status("North")
+                                         if status.level == level for slot in status.slots if slot.is_occupied])
+        self.assertEqual(*(
+            [(o.level, o.slot_type, o.available) for o in manager.get_occupancy_summary()] for manager in managers
+        ))
+
+
+class TestBatchOperations(unittest.TestCase):
+    """Test cases for park_many and remove_many."""
+
+    def setUp(self):
+        self.manager = ParkingLotManagerImpl()
+        self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 3, 1)]))
+        self.manager.create_lot(ParkingLotData(name="South", levels=[make_level(1, 2, 0)]))
+        self.observer = MagicMock()
+        self.manager.register_observer(self.observer)
+
+    def test_park_many_results_per_item(self):
+        """Test that each vehicle gets its own slot or None, in input order."""
+        self.manager.park_vehicle("North", 1, make_vehicle("OLD1"))
+        self.observer.reset_mock()
+        slots = self.manager.park_many("North", 1, [
+            make_vehicle("R1"),
+            make_vehicle("E1", is_electric=True),
+            make_vehicle("OLD1"),                   # already parked
+            make_vehicle("R2"),
+            make_vehicle("E2", is_electric=True),   # electric slot taken
+            make_vehicle("R3"),                     # regular slots exhausted
+            make_vehicle("R1"),                     # repeated within the batch
+        ])
+        self.assertEqual(slots, [2, 4, None, 3, None, None, None])
+        self.observer.update.assert_called_once_with("North")
+
+        result = self.manager.find_vehicle("E1")
+        self.assertIsNotNone(result)
+        if result is not None:
+            self.assertEqual(result.slot, 4)
+        self.assertEqual(len(self.manager.search_vehicles("North", SearchCriteria(color="Red"))), 4)
+
+    def test_park_many_without_space_does_not_notify(self):
+        """Test that a batch that parks nothing sends no notification."""
+        self.manager.park_many("South", 1, [make_vehicle("R1"), make_vehicle("R2")])
+        self.observer.reset_mock()
+        self.assertEqual(self.manager.park_many("South", 1, [make_vehicle("R3")]), [None])
+        self.assertEqual(self.manager.park_many("South", 9, [make_vehicle("R4")]), [None])
+        self.observer.update.assert_not_called()
+        with self.assertRaises(OperationError):
+            self.manager.park_many("Nowhere", 1, [make_vehicle("R5")])
+
+    def test_remove_many(self):
+        """Test that removals report per location and notify once per changed lot."""
+        self.manager.park_many("North", 1, [make_vehicle("N1"), make_vehicle("N2")])
+        self.manager.park_many("South", 1, [make_vehicle("S1")])
+        self.observer.reset_mock()
+
+        removed = self.manager.remove_many([
+            ("North", 1, 1), ("South", 1, 1), ("North", 1, 2),
+            ("North", 1, 3), ("Nowhere", 1, 1), ("North", 1, 1)
+        ])
+        self.assertEqual(
+            [vehicle.registration_number if vehicle is not None else None for vehicle in removed],
+            ["N1", "S1", "N2", None, None, None]
+        )
+        self.assertEqual([call.args for call in self.observer.update.call_args_list], [("North",), ("South",)])
+        self.assertIsNone(self.manager.find_vehicle("N1"))
+        self.assertEqual(self.manager.search_vehicles(None, SearchCriteria()), [])
+
+        # Freed slots are handed out again
+        self.assertEqual(self.manager.park_many("North", 1, [make_vehicle("N3")]), [1])
+
+
+class EventRecorder(ParkingEventObserver):
+    """Event observer that keeps every event it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    def on_event(self, event):
+        self.events.append(event)
+
+
+class TestChangeEvents(unittest.TestCase):
+    """Test cases for typed change events."""
+
+    def setUp(self):
+        self.manager = ParkingLotManagerImpl()
+        self.recorder = EventRecorder()
+        self.manager.register_event_observer(self.recorder)
+
+    def test_lot_events(self):
+        """Test that creating a lot and adding levels publish different events."""
+        self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 2, 0)]))
+        self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(2, 2, 0), make_level(3, 1, 1)]))
+        self.assertEqual(self.recorder.events, [LotCreated("North", [1]), LevelsAdded("North", [2, 3])])
+
+    def test_vehicle_events(self):
+        """Test that parks and removes, single and batched, publish events in order."""
+        self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 3, 1)]))
+        self.recorder.events.clear()
+
+        self.manager.park_vehicle("North", 1, make_vehicle("R1"))
+        self.manager.park_many("North", 1, [make_vehicle("E1", is_electric=True), make_vehicle("R2")])
+        self.manager.remove_vehicle("North", 1, 1)
+        self.manager.remove_many([("North", 1, 4), ("North", 1, 1)])
+
+        summary = [
+            (type(event).__name__, event.lot_name, event.level, event.slot, event.vehicle.registration_number)
+            for event in self.recorder.events
+        ]
+        self.assertEqual(summary, [
+            ("VehicleParked", "North", 1, 1, "R1"),
+            ("VehicleParked", "North", 1, 4, "E1"),
+            ("VehicleParked", "North", 1, 2, "R2"),
+            ("VehicleRemoved", "North", 1, 1, "R1"),
+            ("VehicleRemoved", "North", 1, 4, "E1"),
+        ])
+        parked = self.recorder.events[1]
+        self.assertIsInstance(parked, VehicleParked)
+        self.assertIsNotNone(parked.vehicle.current_battery_charge)
+        with self.assertRaises(AttributeError):
+            parked.vehicle.set_battery_charge(10)
+        self.assertIsInstance(self.recorder.events[3], VehicleRemoved)
+
+    def test_failed_operations_publish_nothing(self):
+        """Test that operations that change nothing publish no events."""
+        self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 1, 0)]))
+        self.manager.park_vehicle("North", 1, make_vehicle("R1"))
+        self.recorder.events.clear()
+        self.manager.park_vehicle("North", 1, make_vehicle("R2"))
+        self.manager.remove_vehicle("North", 1, 5)
+        self.manager.remove_many([("North", 2, 1)])
+        self.assertEqual(self.recorder.events, [])
+
+        self.manager.unregister_event_observer(self.recorder)
+        self.manager.remove_vehicle("North", 1, 1)
+        self.assertEqual(self.recorder.events, [])
+
+
+class TestConcurrency(unittest.TestCase):
+    """Test cases for using one manager from several threads."""
+
+    def setUp(self):
+        self.manager = ParkingLotManagerImpl()
+        self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 50, 10)]))
+
+    def run_threads(self, count, target):
+        barrier = threading.Barrier(count)
+
+        def worker(index):
+            barrier.wait()
+            target(index)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_no_double_allocation(self):
+        """Test that racing threads never get the same slot."""
+        claimed = []
+
+        def park(index):
+            for i in range(20):
+                slot = self.manager.park_vehicle("North", 1, make_vehicle(f"T{index}-{i}", is_electric=i % 5 == 0))
+                if slot is not None:
+                    claimed.append(slot)
+
+        self.run_threads(8, park)
+        self.assertEqual(sorted(claimed), list(range(1, 61)))
+        self.assertEqual(len(self.manager.search_vehicles(None, SearchCriteria())), 60)
+
+    def test_same_vehicle_parked_once(self):
+        """Test that only one of several concurrent parks of one vehicle succeeds."""
+        outcomes = []
+
+        def park(index):
+            try:
+                outcomes.append(self.manager.park_vehicle("North", 1, make_vehicle("SAME")))
+            except ValidationError:
+                outcomes.append("rejected")
+
+        self.run_threads(8, park)
+        self.assertEqual(outcomes.count("rejected"), 7)
+        self.assertEqual(len(self.manager.search_vehicles("North", SearchCriteria())), 1)
+
+    def test_events_follow_state_changes(self):
+        """Test that events for one slot, parked and removed from several threads, arrive in change order."""
+        manager = ParkingLotManagerImpl()
+        manager.create_lot(ParkingLotData(name="Gate", levels=[make_level(1, 1, 0)]))
+        recorder = EventRecorder()
+        manager.register_event_observer(recorder)
+        # A slow lot observer gives other threads time to change the slot between a change and its event
+        slow_observer = MagicMock()
+        slow_observer.update.side_effect = lambda lot_name: time.sleep(0.0002)
+        manager.register_observer(slow_observer)
+
+        def churn(index):
+            for i in range(500):
+                if index % 2:
+                    manager.park_vehicle("Gate", 1, make_vehicle(f"T{index}-{i}"))
+                else:
+                    manager.remove_many([("Gate", 1, 1)])
+
+        self.run_threads(4, churn)
+
+        # Replaying the events must never park into a full slot or remove from an empty one
+        occupant = None
+        for event in recorder.events:
+            if isinstance(event, VehicleParked):
+                self.assertIsNone(occupant)
+                occupant = event.vehicle.registration_number
+            else:
+                self.assertEqual(event.vehicle.registration_number, occupant)
+                occupant = None
+        current = manager.get_slot("Gate", 1, 1).vehicle
+        self.assertEqual(occupant, None if current is None else current.registration_number)
+
+    def test_create_lots_concurrently(self):
+        """Test that lots and levels created from several threads all appear."""
+        def create(index):
+            self.manager.create_lot(ParkingLotData(name=f"Lot{index % 4}", levels=[make_level(index, 2, 0)]))
+
+        self.run_threads(8, create)
+        self.assertEqual(sorted(self.manager.get_lot_names()), ["Lot0", "Lot1", "Lot2", "Lot3", "North"])
+        for index in range(4):
+            self.assertEqual(self.manager.get_levels_for_lot(f"Lot{index}"), [index, index + 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
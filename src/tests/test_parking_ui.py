@@ -9,6 +9,7 @@ to test internal implementation details. This is a common practice in testing, a
 about protected method access can be safely ignored.
 """
 
+import threading
 import unittest
 import tkinter as tk
 from tkinter import ttk
@@ -20,7 +21,9 @@ from unittest.mock import MagicMock, patch
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ParkingLotUI import ParkingLotUI
-from models import VehicleData, SearchCriteria, ParkingLotData, ParkingLevelData, VehicleType, SlotType
+from models import (
+    VehicleData, SearchCriteria, ParkingLotData, ParkingLevelData, VehicleType, SlotType, OccupancyData
+)
 from interfaces import ParkingLotObserver
 
 class TestParkingLotUI(unittest.TestCase):
@@ -178,6 +181,7 @@ class TestParkingLotUI(unittest.TestCase):
         
         # Click search button
         self.ui._handle_search()
+        self.ui.tasks.drain(timeout=5)
         
         # Verify search was performed
         self.ui.parking_manager.get_vehicles_in_lot.assert_called()
@@ -217,25 +221,21 @@ class TestParkingLotUI(unittest.TestCase):
         """Test showing all parking lots through the UI"""
         # Mock the parking manager's methods
         self.ui.parking_manager.get_lot_names = MagicMock(return_value=["Test Lot"])
-        self.ui.parking_manager.get_levels_for_lot = MagicMock(return_value=[1])
-        mock_status = [
-            MagicMock(
-                level=1,
-                slot=1,
-                vehicle=None,
-                is_occupied=False,
-                slot_type=SlotType.REGULAR
-            )
-        ]
-        self.ui.parking_manager.get_lot_status = MagicMock(return_value=mock_status)
+        self.ui.parking_manager.get_occupancy_summary = MagicMock(return_value=[
+            OccupancyData(lot_name="Test Lot", level=1, slot_type=SlotType.REGULAR, capacity=5, available=4),
+            OccupancyData(lot_name="Test Lot", level=1, slot_type=SlotType.ELECTRIC, capacity=2, available=2)
+        ])
+        
+        self.ui.admin_tree = MagicMock()
         
         # Click show lots button
         self.ui._handle_show_lots()
+        self.ui.tasks.drain(timeout=5)
         
-        # Verify methods were called
+        # Verify the lot row comes from the occupancy counters
         self.ui.parking_manager.get_lot_names.assert_called_once()
-        self.ui.parking_manager.get_levels_for_lot.assert_called_once_with("Test Lot")
-        self.ui.parking_manager.get_lot_status.assert_called()
+        self.ui.parking_manager.get_occupancy_summary.assert_called_once()
+        self.ui.admin_tree.insert.assert_called_once_with("", "end", values=("Test Lot", 1, 5, 2, 4, 2))
     
     def test_show_details(self):
         """Test showing lot details through the UI"""
@@ -405,5 +405,29 @@ class TestParkingLotUI(unittest.TestCase):
         self.assertEqual(tuple(self.ui.details_lot_combo['values']), ("Test Lot",))
         self.assertEqual(tuple(self.ui.details_level_combo['values']), ("1",))
 
+    def test_levels_added_elsewhere(self):
+        """Test that levels added from another thread become selectable without resetting selections"""
+        self.ui.parking_manager.get_lot_names = MagicMock(return_value=["Test Lot"])
+        self.ui.parking_manager.get_levels_for_lot = MagicMock(return_value=[1, 2])
+        self.ui.parking_manager.get_occupied_slots = MagicMock(return_value=[])
+        self.ui._shown_lot_names = ["Test Lot"]
+        self.ui._shown_levels = {"Test Lot": [1]}
+        for name in ("park_lot_value", "remove_lot_value", "details_lot_name_value"):
+            setattr(self.ui.state_manager, name, MagicMock(get=MagicMock(return_value="Test Lot")))
+        self.ui.state_manager.remove_level_value = MagicMock(get=MagicMock(return_value="1"))
+        for name in ("park_level_combo", "remove_level_combo", "details_level_combo"):
+            setattr(self.ui, name, MagicMock())
+        
+        # The manager reports the change from a worker thread
+        thread = threading.Thread(target=self.ui.update, args=("Test Lot",))
+        thread.start()
+        thread.join()
+        self.ui.tasks.drain(timeout=5)
+        self.ui.refresher.flush()
+        
+        for combo in (self.ui.park_level_combo, self.ui.remove_level_combo, self.ui.details_level_combo):
+            combo.__setitem__.assert_called_once_with('values', ["1", "2"])
+        self.ui.state_manager.remove_level_value.set.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -127,6 +127,7 @@ class TestParkingSystemPerformance(unittest.TestCase):
             self.ui.state_manager.search_registration_number_value.set(f"ABC{i}")
             self.ui.state_manager.search_type_value.set("registration")
             self.ui._handle_search()
+        self.ui.tasks.drain(timeout=5)
         
         end_time = time.time()
         total_time = end_time - start_time
@@ -186,6 +187,7 @@ class TestParkingSystemPerformance(unittest.TestCase):
             self.ui.state_manager.search_registration_number_value.set(f"ABC{i}")
             self.ui.state_manager.search_type_value.set("registration")
             self.ui._handle_search()
+        self.ui.tasks.drain(timeout=5)
         
         final_memory = process.memory_info().rss
         memory_increase = final_memory - initial_memory
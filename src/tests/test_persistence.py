@@ -0,0 +1,173 @@
+"""
+Unit tests for journal and snapshot persistence.
+
+This module contains unit tests for ParkingStore, checking that parking
+state survives a restart whether it is rebuilt from the journal, from a
+snapshot or from both.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from interfaces import OperationError
+from ParkingManager import ParkingLotManagerImpl
+from persistence import JournalWriter, OP_REMOVE, ParkingStore, SNAPSHOT_FILE
+from models import ParkingLevelData, ParkingLotData, ParkingSlotData, SearchCriteria, SlotType, VehicleData
+from Vehicle import VehicleType
+
+
+def make_level(level: int, regular_slots: int, electric_slots: int = 0) -> ParkingLevelData:
+    """Build level data with the given numbers of regular and electric slots."""
+    slots = [ParkingSlotData(slot_number=i + 1, is_occupied=False, slot_type=SlotType.REGULAR)
+             for i in range(regular_slots)]
+    slots += [ParkingSlotData(slot_number=regular_slots + i + 1, is_occupied=False, slot_type=SlotType.ELECTRIC)
+              for i in range(electric_slots)]
+    return ParkingLevelData(level=level, slots=slots)
+
+
+def make_vehicle(registration_number: str, color: str = "Red", is_electric: bool = False) -> VehicleData:
+    """Build a car with the given registration number."""
+    return VehicleData(registration_number, "Toyota", "Camry", color, is_electric, False, VehicleType.CAR,
+                       current_battery_charge=40.0 if is_electric else None)
+
+
+class TestParkingStore(unittest.TestCase):
+    """Test cases for ParkingStore."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def populate(self, manager):
+        """Create two lots and park a few vehicles, removing one."""
+        manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 3, 1), make_level(2, 2)]))
+        manager.create_lot(ParkingLotData(name="South", levels=[make_level(1, 2)]))
+        manager.park_vehicle("North", 1, make_vehicle("REG1"))
+        manager.park_vehicle("North", 1, make_vehicle("REG2", color="Blue"))
+        manager.park_vehicle("North", 1, make_vehicle("EV1", is_electric=True))
+        manager.park_vehicle("South", 1, make_vehicle("REG3"))
+        manager.remove_vehicle("North", 1, 1)
+
+    def assert_restored(self, manager):
+        """Check the state left by populate."""
+        self.assertEqual(manager.get_lot_names(), ["North", "South"])
+        self.assertEqual(manager.get_levels_for_lot("North"), [1, 2])
+        self.assertIsNone(manager.find_vehicle("REG1"))
+        self.assertEqual(manager.find_vehicle("REG2").slot, 2)
+        electric = manager.find_vehicle("EV1")
+        self.assertEqual(electric.slot, 4)
+        self.assertEqual(electric.vehicle.current_battery_charge, 40.0)
+        self.assertEqual(manager.find_vehicle("REG3").lot_name, "South")
+        red = manager.search_vehicles(None, SearchCriteria(color="Red"))
+        self.assertEqual(sorted(result.vehicle.registration_number for result in red), ["EV1", "REG3"])
+
+    def test_restore_from_journal(self):
+        """Test that state is rebuilt by replaying the journal."""
+        store = ParkingStore(self.directory, snapshot_every=None)
+        self.populate(store.open())
+        store.close()
+
+        store = ParkingStore(self.directory, snapshot_every=None)
+        manager = store.open()
+        self.assert_restored(manager)
+        # The freed slot is handed out again after a restart
+        self.assertEqual(manager.park_vehicle("North", 1, make_vehicle("REG4")), 1)
+        store.close()
+
+    def test_restore_from_snapshot_and_tail(self):
+        """Test that a snapshot plus the journal written after it restore the latest state."""
+        store = ParkingStore(self.directory, snapshot_every=None)
+        manager = store.open()
+        self.populate(manager)
+        store.snapshot()
+        manager.park_vehicle("South", 1, make_vehicle("REG5"))
+        manager.remove_vehicle("South", 1, 1)
+        store.close()
+        self.assertTrue(os.path.exists(os.path.join(self.directory, SNAPSHOT_FILE)))
+
+        store = ParkingStore(self.directory, snapshot_every=None)
+        manager = store.open()
+        self.assertIsNone(manager.find_vehicle("REG3"))
+        self.assertEqual(manager.find_vehicle("REG5").slot, 2)
+        self.assertEqual(manager.find_vehicle("EV1").slot, 4)
+        store.close()
+
+    def test_torn_tail_is_ignored(self):
+        """Test that a partly written last frame does not stop recovery."""
+        store = ParkingStore(self.directory, snapshot_every=None)
+        self.populate(store.open())
+        store.close()
+
+        journals = sorted(name for name in os.listdir(self.directory) if name.endswith(".log"))
+        path = os.path.join(self.directory, journals[-1])
+        size = os.path.getsize(path)
+        # Append a frame whose body never made it to disk
+        writer = JournalWriter(path)
+        writer.log_park("South", 1, 2, make_vehicle("LOST"))
+        writer.close()
+        with open(path, "r+b") as f:
+            f.truncate(size + 10)
+
+        store = ParkingStore(self.directory, snapshot_every=None)
+        manager = store.open()
+        self.assert_restored(manager)
+        self.assertIsNone(manager.find_vehicle("LOST"))
+        store.close()
+
+    def test_automatic_snapshot(self):
+        """Test that snapshots are taken automatically and old journals deleted."""
+        store = ParkingStore(self.directory, snapshot_every=5)
+        self.populate(store.open())
+        store.close()
+
+        self.assertTrue(os.path.exists(os.path.join(self.directory, SNAPSHOT_FILE)))
+        journals = [name for name in os.listdir(self.directory) if name.endswith(".log")]
+        self.assertLessEqual(len(journals), 2)
+
+        store = ParkingStore(self.directory, snapshot_every=5)
+        self.assert_restored(store.open())
+        store.close()
+
+
+    def test_failed_level_update_changes_nothing(self):
+        """Test that adding levels of which one exists neither applies nor journals any of them."""
+        store = ParkingStore(self.directory)
+        manager = store.open()
+        manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 2), make_level(2, 2)]))
+        with self.assertRaises(OperationError):
+            manager.create_lot(ParkingLotData(name="North", levels=[make_level(3, 2), make_level(1, 2)]))
+        self.assertEqual(manager.get_levels_for_lot("North"), [1, 2])
+        store.close()
+
+        store = ParkingStore(self.directory)
+        self.assertEqual(store.open().get_levels_for_lot("North"), [1, 2])
+        store.close()
+
+    def test_lot_journaled_before_it_is_visible(self):
+        """Test that a new lot is journaled before a concurrent park could find it."""
+        manager = ParkingLotManagerImpl()
+        manager.journal = MagicMock()
+        manager.journal.log_create_lot.side_effect = lambda name, layout: self.assertNotIn(name, manager.lots)
+        manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 2)]))
+        manager.journal.log_create_lot.assert_called_once_with("North", [(1, 2, 0)])
+        self.assertIn("North", manager.lots)
+
+    def test_overfull_group_flushes_early(self):
+        """Test that a group that fills past its size is flushed without waiting for the timer."""
+        journal = JournalWriter(os.path.join(self.directory, "journal.log"), group_size=1, flush_interval=60)
+        self.addCleanup(journal.close)
+        # Another thread's record lands first, so this park overshoots the group size
+        journal._fields.extend((OP_REMOVE, "North", 1, 1, None))
+        journal.log_park("North", 1, 2, make_vehicle("REG1"))
+        for _ in range(500):
+            if journal.records_written == 2:
+                break
+            time.sleep(0.01)
+        self.assertEqual(journal.records_written, 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,204 @@
+"""
+Unit tests for the SQLite-backed parking manager.
+
+This module contains unit tests for SQLiteParkingLotManager, covering slot
+allocation, searches, batch operations and reopening a database file.
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from interfaces import OperationError, ValidationError
+from models import (
+    LotCreated, ParkingLevelData, ParkingLotData, ParkingSlotData, SearchCriteria, SlotType, VehicleData,
+    VehicleParked, VehicleRemoved
+)
+from sqlite_manager import SQLiteParkingLotManager
+from Vehicle import VehicleType
+
+
+def make_level(level: int, regular_slots: int, electric_slots: int = 0) -> ParkingLevelData:
+    """Build level data with the given numbers of regular and electric slots."""
+    slots = [ParkingSlotData(slot_number=i + 1, is_occupied=False, slot_type=SlotType.REGULAR)
+             for i in range(regular_slots)]
+    slots += [ParkingSlotData(slot_number=regular_slots + i + 1, is_occupied=False, slot_type=SlotType.ELECTRIC)
+              for i in range(electric_slots)]
+    return ParkingLevelData(level=level, slots=slots)
+
+
+def make_vehicle(registration_number: str, color: str = "Red", is_electric: bool = False,
+                 vehicle_type: VehicleType = VehicleType.CAR) -> VehicleData:
+    """Build a vehicle with the given registration number."""
+    return VehicleData(registration_number, "Toyota", "Camry", color, is_electric,
+                       vehicle_type == VehicleType.MOTORCYCLE, vehicle_type,
+                       current_battery_charge=50.0 if is_electric else None)
+
+
+class EventRecorder:
+    """Event observer that keeps every event it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    def on_event(self, event):
+        self.events.append(event)
+
+
+class TestSQLiteParkingLotManager(unittest.TestCase):
+    """Test cases for SQLiteParkingLotManager."""
+
+    def setUp(self):
+        self.manager = SQLiteParkingLotManager()
+        self.addCleanup(self.manager.close)
+        self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(1, 3, 1), make_level(2, 2)]))
+
+    def test_lowest_free_slot_is_reused(self):
+        """Test that vehicles get the lowest free slot of their type."""
+        self.assertEqual(self.manager.park_vehicle("North", 1, make_vehicle("REG1")), 1)
+        self.assertEqual(self.manager.park_vehicle("North", 1, make_vehicle("REG2")), 2)
+        self.assertEqual(self.manager.park_vehicle("North", 1, make_vehicle("EV1", is_electric=True)), 4)
+        self.assertIsNone(self.manager.park_vehicle("North", 1, make_vehicle("EV2", is_electric=True)))
+
+        removed = self.manager.remove_vehicle("North", 1, 1)
+        self.assertEqual(removed.registration_number, "REG1")
+        self.assertIsNone(self.manager.remove_vehicle("North", 1, 1))
+        self.assertEqual(self.manager.park_vehicle("North", 1, make_vehicle("REG3")), 1)
+
+        summary = {(row.level, row.slot_type): (row.capacity, row.available)
+                   for row in self.manager.get_occupancy_summary()}
+        self.assertEqual(summary[(1, SlotType.REGULAR)], (3, 1))
+        self.assertEqual(summary[(1, SlotType.ELECTRIC)], (1, 0))
+        self.assertEqual(summary[(2, SlotType.REGULAR)], (2, 2))
+
+    def test_errors(self):
+        """Test duplicate vehicles, unknown lots and duplicate levels."""
+        self.manager.park_vehicle("North", 1, make_vehicle("REG1"))
+        with self.assertRaises(ValidationError):
+            self.manager.park_vehicle("North", 2, make_vehicle("REG1"))
+        with self.assertRaises(OperationError):
+            self.manager.park_vehicle("South", 1, make_vehicle("REG2"))
+        with self.assertRaises(OperationError):
+            self.manager.create_lot(ParkingLotData(name="North", levels=[make_level(3, 1), make_level(1, 1)]))
+        # The failed update is rolled back as a whole
+        self.assertEqual(self.manager.get_levels_for_lot("North"), [1, 2])
+
+    def test_search_and_status(self):
+        """Test searching by attributes and reading lot status."""
+        self.manager.park_vehicle("North", 1, make_vehicle("REG1"))
+        self.manager.park_vehicle("North", 2, make_vehicle("REG2", color="Blue"))
+        self.manager.park_vehicle("North", 2, make_vehicle("BIKE1", vehicle_type=VehicleType.MOTORCYCLE))
+
+        red = self.manager.search_vehicles("North", SearchCriteria(color="Red"))
+        self.assertEqual([(r.level, r.slot, r.vehicle.registration_number) for r in red],
+                         [(1, 1, "REG1"), (2, 2, "BIKE1")])
+        bikes = self.manager.search_vehicles(None, SearchCriteria(is_motorcycle=True))
+        self.assertEqual([r.vehicle.registration_number for r in bikes], ["BIKE1"])
+        self.assertEqual(len(self.manager.search_vehicles(None, SearchCriteria(color=""))), 3)
+        self.assertEqual(self.manager.find_vehicle("REG2").slot, 1)
+        self.assertIsNone(self.manager.find_vehicle("MISSING"))
+
+        status = self.manager.get_lot_status("North")
+        self.assertEqual([level.level for level in status], [1, 2])
+        self.assertEqual([slot.is_occupied for slot in status[0].slots], [True, False, False, False])
+        self.assertEqual(status[0].slots[3].slot_type, SlotType.ELECTRIC)
+        self.assertEqual(sorted(self.manager.get_vehicles_in_lot("North", 2)), [1, 2])
+
+    def test_slot_queries(self):
+        """Test reading the occupied slots of a level and single slots."""
+        self.manager.park_vehicle("North", 1, make_vehicle("REG1"))
+        self.manager.park_vehicle("North", 1, make_vehicle("REG2"))
+        self.manager.park_vehicle("North", 1, make_vehicle("EV1", is_electric=True))
+        self.manager.remove_vehicle("North", 1, 1)
+
+        self.assertEqual(self.manager.get_occupied_slots("North", 1), [2, 4])
+        self.assertEqual(self.manager.get_occupied_slots("North", 2), [])
+        slot = self.manager.get_slot("North", 1, 4)
+        self.assertEqual((slot.slot_number, slot.is_occupied, slot.slot_type), (4, True, SlotType.ELECTRIC))
+        self.assertEqual(slot.vehicle.registration_number, "EV1")
+        self.assertFalse(self.manager.get_slot("North", 1, 1).is_occupied)
+        self.assertIsNone(self.manager.get_slot("North", 1, 5))
+        self.assertTrue(self.manager.is_slot_occupied("North", 1, 2))
+        self.assertFalse(self.manager.is_slot_occupied("North", 1, 1))
+        self.assertFalse(self.manager.is_slot_occupied("North", 3, 1))
+        with self.assertRaises(OperationError):
+            self.manager.get_slot("South", 1, 1)
+
+    def test_batch_operations_and_events(self):
+        """Test park_many and remove_many, and the events they publish."""
+        recorder = EventRecorder()
+        self.manager.register_event_observer(recorder)
+        slots = self.manager.park_many("North", 1, [
+            make_vehicle("REG1"), make_vehicle("REG1"), make_vehicle("EV1", is_electric=True),
+            make_vehicle("REG2"), make_vehicle("REG3"), make_vehicle("REG4")
+        ])
+        self.assertEqual(slots, [1, None, 4, 2, 3, None])
+
+        removed = self.manager.remove_many([("North", 1, 2), ("North", 1, 2), ("Nowhere", 1, 1), ("North", 1, 4)])
+        self.assertEqual([vehicle and vehicle.registration_number for vehicle in removed],
+                         ["REG2", None, None, "EV1"])
+        self.assertEqual(self.manager.park_many("North", 1, [make_vehicle("REG5")]), [2])
+
+        kinds = [type(event) for event in recorder.events]
+        self.assertEqual(kinds, [VehicleParked] * 4 + [VehicleRemoved] * 2 + [VehicleParked])
+
+    def test_events_follow_state_changes_across_threads(self):
+        """Test that events for one slot changed from several threads arrive in change order."""
+        self.manager.create_lot(ParkingLotData(name="Gate", levels=[make_level(1, 1)]))
+        recorder = EventRecorder()
+        self.manager.register_event_observer(recorder)
+        # A slow lot observer gives other threads time to change the slot between a change and its event
+        slow_observer = MagicMock()
+        slow_observer.update.side_effect = lambda lot_name: time.sleep(0.0002)
+        self.manager.register_observer(slow_observer)
+
+        def churn(index):
+            for i in range(200):
+                if index % 2:
+                    self.manager.park_vehicle("Gate", 1, make_vehicle(f"T{index}-{i}"))
+                else:
+                    self.manager.remove_vehicle("Gate", 1, 1)
+
+        threads = [threading.Thread(target=churn, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        occupant = None
+        for event in recorder.events:
+            if isinstance(event, VehicleParked):
+                self.assertIsNone(occupant)
+                occupant = event.vehicle.registration_number
+            else:
+                self.assertEqual(event.vehicle.registration_number, occupant)
+                occupant = None
+
+    def test_reopen_file_database(self):
+        """Test that state persists in a database file."""
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "parking.db")
+
+        manager = SQLiteParkingLotManager(path)
+        recorder = EventRecorder()
+        manager.register_event_observer(recorder)
+        manager.create_lot(ParkingLotData(name="South", levels=[make_level(1, 2, 1)]))
+        manager.park_vehicle("South", 1, make_vehicle("EV1", is_electric=True))
+        manager.close()
+        self.assertIsInstance(recorder.events[0], LotCreated)
+
+        manager = SQLiteParkingLotManager(path)
+        self.addCleanup(manager.close)
+        result = manager.find_vehicle("EV1")
+        self.assertEqual((result.lot_name, result.level, result.slot), ("South", 1, 3))
+        self.assertEqual(result.vehicle.current_battery_charge, 50.0)
+        self.assertEqual(manager.park_vehicle("South", 1, make_vehicle("REG1")), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
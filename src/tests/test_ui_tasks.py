@@ -0,0 +1,156 @@
+"""
+Unit tests for UI task scheduling.
+
+This module contains unit tests for UITaskExecutor and RefreshDebouncer,
+with the Tk after() loop replaced by a list of scheduled callbacks, so they
+need no display.
+"""
+
+import threading
+import unittest
+
+from ui_tasks import RefreshDebouncer, UITaskExecutor
+
+
+class FakeScheduler:
+    """Stands in for a widget's after(), running callbacks when told to."""
+
+    def __init__(self):
+        self.pending = []
+        self.threads = set()
+
+    def after(self, delay_ms, callback):
+        self.threads.add(threading.get_ident())
+        self.pending.append(callback)
+
+    def tick(self):
+        """Run the callbacks scheduled so far, as one pass of the event loop would."""
+        pending, self.pending = self.pending, []
+        for callback in pending:
+            callback()
+
+    def run_until_idle(self, executor, timeout=5.0):
+        """Wait for the executor's tasks, then let the event loop run once."""
+        executor.drain(timeout)
+        self.tick()
+
+
+class TestUITaskExecutor(unittest.TestCase):
+    """Test cases for UITaskExecutor."""
+
+    def setUp(self):
+        self.scheduler = FakeScheduler()
+        self.busy = []
+        self.executor = UITaskExecutor(self.scheduler.after, on_busy=self.busy.append)
+        self.addCleanup(self.executor.shutdown)
+
+    def test_result_delivered_on_ui_thread(self):
+        """Test that the call runs on a worker and its result comes back on the creating thread."""
+        threads = {}
+
+        def work(value):
+            threads["work"] = threading.get_ident()
+            return value * 2
+
+        def done(result):
+            threads["done"] = threading.get_ident()
+            threads["result"] = result
+
+        self.executor.submit("search", work, 21, on_success=done)
+        self.assertTrue(self.executor.busy)
+        self.assertEqual(len(self.scheduler.pending), 1)
+        self.scheduler.run_until_idle(self.executor)
+
+        self.assertEqual(threads["result"], 42)
+        self.assertNotEqual(threads["work"], threading.get_ident())
+        self.assertEqual(threads["done"], threading.get_ident())
+        self.assertEqual(self.busy, [True, False])
+        self.assertFalse(self.executor.busy)
+
+    def test_stale_request_is_dropped(self):
+        """Test that a newer task under the same key cancels or drops the older one."""
+        started = threading.Event()
+        release = threading.Event()
+        results = []
+
+        def slow(value):
+            started.set()
+            release.wait(5)
+            return value
+
+        self.executor.submit("search", slow, "running", on_success=results.append)
+        started.wait(5)
+        self.executor.submit("search", slow, "queued", on_success=results.append)
+        self.executor.submit("search", slow, "latest", on_success=results.append)
+        self.executor.submit("show_lots", lambda: "lots", on_success=results.append)
+        release.set()
+        self.scheduler.run_until_idle(self.executor)
+
+        self.assertEqual(sorted(results), ["latest", "lots"])
+        self.assertEqual(self.busy, [True, False])
+
+    def test_errors_and_posts(self):
+        """Test that exceptions reach on_error and callbacks posted from other threads run on the UI thread."""
+        errors = []
+        posted = []
+
+        def fail():
+            raise ValueError("no such lot")
+
+        self.executor.submit("show_lots", fail, on_error=errors.append)
+        thread = threading.Thread(target=self.executor.post,
+                                  args=(lambda name: posted.append((name, self.executor.on_ui_thread())), "Main"))
+        thread.start()
+        thread.join()
+        self.scheduler.run_until_idle(self.executor)
+
+        self.assertEqual([str(error) for error in errors], ["no such lot"])
+        self.assertEqual(posted, [("Main", True)])
+        # Only the Tk thread ever schedules
+        self.assertEqual(self.scheduler.threads, {threading.get_ident()})
+
+    def test_poll_runs_until_shutdown(self):
+        """Test that one poll keeps running callbacks posted from workers until shutdown."""
+        posted = []
+        self.assertEqual(len(self.scheduler.pending), 1)
+        for value in range(3):
+            thread = threading.Thread(target=self.executor.post, args=(posted.append, value))
+            thread.start()
+            thread.join()
+            self.scheduler.tick()
+            self.assertEqual(len(self.scheduler.pending), 1)
+        self.assertEqual(posted, [0, 1, 2])
+
+        self.executor.shutdown()
+        self.scheduler.tick()
+        self.assertEqual(self.scheduler.pending, [])
+
+
+class TestRefreshDebouncer(unittest.TestCase):
+    """Test cases for RefreshDebouncer."""
+
+    def test_burst_is_one_refresh(self):
+        """Test that notifications before the scheduled refresh are merged into it."""
+        scheduler = FakeScheduler()
+        refreshed = []
+        debouncer = RefreshDebouncer(scheduler.after, refreshed.append, interval_ms=16)
+
+        for _ in range(1_000):
+            debouncer.mark("Main")
+        debouncer.mark("Airport")
+        self.assertEqual(len(scheduler.pending), 1)
+        self.assertEqual(debouncer.pending, {"Main", "Airport"})
+
+        scheduler.pending.pop()()
+        self.assertEqual(refreshed, [{"Main", "Airport"}])
+        self.assertEqual(debouncer.pending, set())
+
+        debouncer.mark("Main")
+        debouncer.flush()
+        scheduler.pending.pop()()
+        self.assertEqual(refreshed[1:], [{"Main"}])
+        self.assertEqual(debouncer.refreshes, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Unit tests for the virtual tree view.
+
+This module contains unit tests for VirtualTreeView, run against a fake
+Treeview that records the item operations, so they need no display.
+"""
+
+import unittest
+from collections import Counter
+from types import SimpleNamespace
+
+from virtual_tree import OVERSCAN_ROWS, VirtualTreeView, item_id
+
+
+class FakeTree:
+    """The part of ttk.Treeview the view uses, with a count of item operations."""
+
+    def __init__(self, height: int = 10):
+        self.height = height
+        self.children = []
+        self.values = {}
+        self.bindings = {}
+        self.selected = ()
+        self.calls = Counter()
+
+    def cget(self, option):
+        return str(self.height)
+
+    def bind(self, sequence, callback, add=None):
+        self.bindings[sequence] = callback
+
+    def insert(self, parent, index, iid, values):
+        self.calls["insert"] += 1
+        self.children.insert(index, iid)
+        self.values[iid] = values
+
+    def delete(self, *items):
+        self.calls["delete"] += len(items)
+        for iid in items:
+            self.children.remove(iid)
+            del self.values[iid]
+
+    def move(self, iid, parent, index):
+        self.calls["move"] += 1
+        self.children.remove(iid)
+        self.children.insert(index, iid)
+
+    def item(self, iid, values):
+        self.calls["item"] += 1
+        self.values[iid] = values
+
+    def selection_set(self, *items):
+        self.selected = items
+
+    def rows(self):
+        return [self.values[iid] for iid in self.children]
+
+
+class FakeScrollbar:
+    """Records the fractions the view reports."""
+
+    def configure(self, command):
+        self.command = command
+
+    def set(self, first, last):
+        self.position = (first, last)
+
+
+def slot_rows(count: int, owner: str = ""):
+    """Build (level, slot) rows for one level."""
+    return [((1, slot), (slot, owner)) for slot in range(1, count + 1)]
+
+
+def format_slot(item):
+    slot, owner = item
+    return (str(slot), owner)
+
+
+class TestVirtualTreeView(unittest.TestCase):
+    """Test cases for VirtualTreeView."""
+
+    def setUp(self):
+        self.tree = FakeTree(height=10)
+        self.scrollbar = FakeScrollbar()
+        self.view = VirtualTreeView(self.tree, format_slot, self.scrollbar)
+        self.page = 10 + OVERSCAN_ROWS
+
+    def test_renders_only_the_window(self):
+        """Test that a large list inserts one page of rows keyed by (level, slot)."""
+        self.view.set_rows(slot_rows(10_000))
+        self.assertEqual(len(self.view), 10_000)
+        self.assertEqual(self.tree.calls["insert"], self.page)
+        self.assertEqual(self.tree.children[:2], ["1/1", "1/2"])
+        self.assertEqual(self.scrollbar.position, (0.0, 10 / 10_000))
+        self.assertIs(self.scrollbar.command.__func__, VirtualTreeView.yview)
+
+    def test_refresh_updates_only_changed_rows(self):
+        """Test that setting the same rows again touches nothing and one change updates one item."""
+        rows = slot_rows(10_000)
+        self.view.set_rows(rows)
+        self.tree.calls.clear()
+
+        self.view.set_rows(rows)
+        self.assertEqual(sum(self.tree.calls.values()), 0)
+
+        rows[3] = ((1, 4), (4, "REG4"))
+        self.view.set_rows(rows)
+        self.assertEqual(self.tree.calls, Counter(item=1))
+        self.assertEqual(self.tree.values[item_id((1, 4))], ("4", "REG4"))
+
+        self.view.update_rows([((1, 5), (5, "REG5")), ((1, 5000), (5000, "REG5000")), ((9, 9), (9, "X"))])
+        self.assertEqual(self.tree.calls, Counter(item=2))
+        self.assertEqual(self.view.get_item((1, 5000)), (5000, "REG5000"))
+
+    def test_scrolling_reuses_items(self):
+        """Test that scrolling replaces only the rows leaving the window and keeps their order."""
+        self.view.set_rows(slot_rows(1_000))
+        self.tree.calls.clear()
+
+        self.view.yview("scroll", 1, "units")
+        self.assertEqual(self.tree.calls, Counter(delete=1, insert=1))
+        self.assertEqual(self.tree.rows()[0], ("2", ""))
+
+        self.view.yview("moveto", "0.5")
+        self.assertEqual(self.view.first, 500)
+        self.assertEqual([row[0] for row in self.tree.rows()], [str(slot) for slot in range(501, 501 + self.page)])
+
+        self.view.yview("moveto", "1.0")
+        self.assertEqual(self.view.first, 990)
+        self.assertEqual(self.tree.rows()[-1], ("1000", ""))
+        self.assertEqual(self.scrollbar.position, (0.99, 1.0))
+
+        self.tree.bindings["<MouseWheel>"](SimpleNamespace(delta=120))
+        self.assertEqual(self.view.first, 987)
+
+    def test_rows_removed_and_reordered(self):
+        """Test that the tree follows rows that disappear or change order."""
+        self.view.set_rows(slot_rows(5))
+        self.view.set_rows(list(reversed(slot_rows(5)))[1:])
+        self.assertEqual(self.tree.children, ["1/4", "1/3", "1/2", "1/1"])
+
+        self.view.see((1, 2))
+        self.assertEqual(self.tree.selected, ("1/2",))
+
+        self.view.clear()
+        self.assertEqual(self.tree.children, [])
+        self.assertEqual(self.scrollbar.position, (0.0, 1.0))
+
+    def test_resize_changes_page(self):
+        """Test that the window grows with the tree's height."""
+        self.view.set_rows(slot_rows(100))
+        self.tree.bindings["<Configure>"](SimpleNamespace(height=400))
+        self.assertEqual(len(self.tree.children), 400 // 20 + OVERSCAN_ROWS)
+
+
+if __name__ == "__main__":
+    unittest.main()
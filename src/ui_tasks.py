@@ -0,0 +1,249 @@
+"""
+UI Tasks Module
+
+This module provides UITaskExecutor, which runs slow manager calls for the
+UI on worker threads and hands their results back to the Tk thread.
+
+Finished tasks put their callbacks on a thread-safe queue, and the Tk
+thread drains it from an after() poll. The poll is armed once, on the Tk
+thread, and reschedules itself until shutdown, so worker threads only
+ever touch the queue and never call into Tk. Each task is submitted under a key such as
+"search". Submitting again under the same key makes the earlier task
+stale: it is cancelled if it has not started, and its result is dropped
+if it has. A busy callback is told when the first task starts and when
+the last one finishes, so the UI can show an indicator.
+
+RefreshDebouncer collects change notifications on the Tk thread and runs
+one refresh per frame interval for all the lots that changed in it.
+
+Both are given the widget's after() method rather than the widget, so
+this module does not import tkinter itself.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How often the Tk thread looks for finished tasks and posted callbacks, in milliseconds
+DEFAULT_POLL_INTERVAL_MS = 15
+
+# Shortest time between two refreshes of the widgets showing a lot, in milliseconds
+DEFAULT_REFRESH_INTERVAL_MS = 16
+
+Callback = Callable[..., Any]
+
+class UITask:
+    """A call submitted to a UITaskExecutor"""
+
+    def __init__(self, key: str, future: "Future[Any]", on_success: Optional[Callback],
+                 on_error: Optional[Callback]):
+        self.key = key
+        self.future = future
+        self.on_success = on_success
+        self.on_error = on_error
+        self.stale = False
+
+    def cancel(self) -> None:
+        """Drop the task's result, and skip the call if it has not started"""
+        self.stale = True
+        self.future.cancel()
+
+class UITaskExecutor:
+    """Runs calls on worker threads and their callbacks on the Tk thread
+
+    Must be created on the Tk thread. Callbacks are only ever run by the
+    thread that created the executor.
+    """
+
+    def __init__(self, schedule: Callable[[int, Callable[[], None]], Any], workers: int = 1,
+                 on_busy: Optional[Callable[[bool], None]] = None,
+                 poll_interval_ms: int = DEFAULT_POLL_INTERVAL_MS):
+        """Initialize the executor
+
+        Args:
+            schedule: Runs a callable on the Tk thread after a delay in milliseconds, e.g. a widget's after
+            workers: Number of worker threads
+            on_busy: Called with True when a task starts while none are running, and with False when none are left
+            poll_interval_ms: How often to look for finished tasks and posted callbacks
+        """
+        self._schedule = schedule
+        self._on_busy = on_busy
+        self._poll_interval_ms = poll_interval_ms
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="parking-ui-task")
+        self._ui_thread = threading.get_ident()
+        # Callbacks waiting to run on the Tk thread
+        self._ready: "queue.SimpleQueue[Tuple[Callback, Tuple[Any, ...]]]" = queue.SimpleQueue()
+        self._current: Dict[str, UITask] = {}
+        self._outstanding = 0
+        self._closed = False
+        self._schedule(self._poll_interval_ms, self._poll)
+
+    @property
+    def busy(self) -> bool:
+        """Whether any submitted task has not had its callbacks run yet"""
+        return self._outstanding > 0
+
+    def on_ui_thread(self) -> bool:
+        """Whether the calling thread is the one that runs callbacks"""
+        return threading.get_ident() == self._ui_thread
+
+    def submit(self, key: str, func: Callable[..., Any], *args: Any, on_success: Optional[Callback] = None,
+               on_error: Optional[Callback] = None) -> UITask:
+        """Run a call on a worker thread
+
+        Any earlier task submitted under the same key becomes stale.
+
+        Args:
+            key: What the task is for; a newer task with the same key replaces it
+            func: The call to run on the worker
+            *args: Arguments for func
+            on_success: Called on the Tk thread with func's result
+            on_error: Called on the Tk thread with the exception func raised
+
+        Returns:
+            The submitted task
+        """
+        previous = self._current.get(key)
+        if previous is not None:
+            previous.cancel()
+        future = self._pool.submit(func, *args)
+        task = UITask(key, future, on_success, on_error)
+        self._current[key] = task
+        self._outstanding += 1
+        if self._outstanding == 1 and self._on_busy is not None:
+            self._on_busy(True)
+        future.add_done_callback(lambda _: self._ready.put((self._finish, (task,))))
+        return task
+
+    def post(self, callback: Callback, *args: Any) -> None:
+        """Run a callback on the Tk thread; may be called from any thread"""
+        self._ready.put((callback, args))
+
+    def drain(self, timeout: Optional[float] = None) -> None:
+        """Wait for every outstanding task and run the waiting callbacks now
+
+        Must be called on the Tk thread. Meant for tests and shutdown, which
+        cannot wait for the event loop.
+
+        Args:
+            timeout: Seconds to wait at most, or None to wait as long as it takes
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            self._run_ready()
+            if not self._outstanding:
+                return
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return
+            try:
+                callback, args = self._ready.get(timeout=remaining)
+            except queue.Empty:
+                return
+            self._run_callback(callback, args)
+
+    def shutdown(self) -> None:
+        """Drop every outstanding task, stop polling and stop the worker threads"""
+        self._closed = True
+        for task in self._current.values():
+            task.cancel()
+        self._current.clear()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _poll(self) -> None:
+        if self._closed:
+            return
+        self._run_ready()
+        self._schedule(self._poll_interval_ms, self._poll)
+
+    def _run_ready(self) -> None:
+        while True:
+            try:
+                callback, args = self._ready.get_nowait()
+            except queue.Empty:
+                return
+            self._run_callback(callback, args)
+
+    def _run_callback(self, callback: Callback, args: Tuple[Any, ...]) -> None:
+        try:
+            callback(*args)
+        except Exception:
+            logger.exception("UI task callback %r failed", callback)
+
+    def _finish(self, task: UITask) -> None:
+        """Run a finished task's callback on the Tk thread, unless it is stale"""
+        if self._current.get(task.key) is task:
+            del self._current[task.key]
+        self._outstanding -= 1
+        try:
+            if task.stale or task.future.cancelled():
+                logger.debug("Dropped stale UI task %s", task.key)
+                return
+            error = task.future.exception()
+            if error is None:
+                if task.on_success is not None:
+                    task.on_success(task.future.result())
+            elif task.on_error is not None:
+                task.on_error(error)
+            else:
+                logger.error("UI task %s failed: %s", task.key, error)
+        finally:
+            if not self._outstanding and self._on_busy is not None:
+                self._on_busy(False)
+
+class RefreshDebouncer:
+    """Refreshes changed lots at most once per interval
+
+    The first change after a refresh schedules the next one an interval
+    later. Changes before then are merged into it, so a burst of
+    notifications for the same lots costs a single refresh. Must only be
+    used from the Tk thread.
+    """
+
+    def __init__(self, schedule: Callable[[int, Callable[[], None]], Any], refresh: Callable[[Set[str]], None],
+                 interval_ms: int = DEFAULT_REFRESH_INTERVAL_MS):
+        """Initialize the debouncer
+
+        Args:
+            schedule: Runs a callable on the Tk thread after a delay in milliseconds, e.g. a widget's after
+            refresh: Refreshes the widgets of the given lots
+            interval_ms: Shortest time between two refreshes
+        """
+        self._schedule = schedule
+        self._refresh = refresh
+        self._interval_ms = interval_ms
+        self._changed: Set[str] = set()
+        self._scheduled = False
+        self.refreshes = 0
+
+    @property
+    def pending(self) -> Set[str]:
+        """The lots that changed since the last refresh"""
+        return set(self._changed)
+
+    def mark(self, lot_name: str) -> None:
+        """Note that a lot changed, scheduling a refresh if none is"""
+        self._changed.add(lot_name)
+        if not self._scheduled:
+            self._scheduled = True
+            self._schedule(self._interval_ms, self._run)
+
+    def flush(self) -> None:
+        """Refresh the changed lots now"""
+        if not self._changed:
+            return
+        changed, self._changed = self._changed, set()
+        self.refreshes += 1
+        self._refresh(changed)
+
+    def _run(self) -> None:
+        self._scheduled = False
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Refresh of changed lots failed")
@@ -0,0 +1,193 @@
+"""
+Virtual Tree Module
+
+This module provides VirtualTreeView, which shows a long list of rows in a
+ttk.Treeview while only ever inserting the rows that fit in the widget.
+The full list lives in Python; scrolling moves a window over it. Each row
+has a key, such as (level, slot), from which its Treeview item ID is
+derived, so redrawing after a change reuses the items already shown and
+only touches the rows whose values changed.
+
+The class uses nothing but the Treeview's item methods, so it does not
+import tkinter itself.
+"""
+
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+# Row height in pixels when the Treeview style does not say
+DEFAULT_ROW_HEIGHT = 20
+
+# Rows rendered beyond those that fit, so a partly visible last row is never missing
+OVERSCAN_ROWS = 2
+
+# Rows a single mouse wheel step scrolls
+WHEEL_ROWS = 3
+
+RowValues = Tuple[str, ...]
+
+def item_id(key: Hashable) -> str:
+    """Get the Treeview item ID of the row with the given key"""
+    if isinstance(key, tuple):
+        return "/".join(str(part) for part in key)
+    return str(key)
+
+class VirtualTreeView:
+    """Renders the visible window of a list of rows into a Treeview
+
+    Rows are (key, item) pairs. format_row turns an item into the Treeview
+    values and is only called for rows inside the window, so a view of
+    100,000 rows costs about as much to draw as one of 30.
+    """
+
+    def __init__(self, tree: Any, format_row: Callable[[Any], RowValues], scrollbar: Optional[Any] = None,
+                 row_height: int = DEFAULT_ROW_HEIGHT):
+        """Initialize the view
+
+        Args:
+            tree: The ttk.Treeview to render into; its rows are managed by the view
+            format_row: Turns a row's item into the values shown in the tree
+            scrollbar: A vertical ttk.Scrollbar to drive and follow, if any
+            row_height: Height of a row in pixels, used to size the window
+        """
+        self.tree = tree
+        self.format_row = format_row
+        self.scrollbar = scrollbar
+        self.row_height = row_height
+        # Visible rows as requested by the tree's height option until the widget is laid out
+        self.page_size = int(tree.cget("height")) + OVERSCAN_ROWS
+        self._keys: List[Hashable] = []
+        self._items: Dict[Hashable, Any] = {}
+        self._first = 0
+        # Keys and values of the rows in the tree, in display order
+        self._shown: List[Hashable] = []
+        self._shown_values: Dict[Hashable, RowValues] = {}
+
+        if scrollbar is not None:
+            scrollbar.configure(command=self.yview)
+        tree.bind("<Configure>", self._on_configure, add="+")
+        tree.bind("<MouseWheel>", self._on_mouse_wheel, add="+")
+        tree.bind("<Button-4>", lambda event: self._scroll_rows(-WHEEL_ROWS), add="+")
+        tree.bind("<Button-5>", lambda event: self._scroll_rows(WHEEL_ROWS), add="+")
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def first(self) -> int:
+        """Index of the first row in the window"""
+        return self._first
+
+    def set_rows(self, rows: Sequence[Tuple[Hashable, Any]]) -> None:
+        """Replace the rows and redraw the window
+
+        The window keeps its position where it can, so refreshing a list
+        after a change leaves the user where they were.
+
+        Args:
+            rows: (key, item) pairs in display order; keys must be unique
+        """
+        self._keys = [key for key, _ in rows]
+        self._items = dict(rows)
+        self._render()
+
+    def update_rows(self, rows: Sequence[Tuple[Hashable, Any]]) -> None:
+        """Replace the items of existing rows and redraw them if they are shown
+
+        Keys that are not in the view are ignored; use set_rows to add rows.
+
+        Args:
+            rows: (key, item) pairs
+        """
+        changed = False
+        for key, item in rows:
+            if key in self._items:
+                self._items[key] = item
+                changed = changed or key in self._shown_values
+        if changed:
+            self._render()
+
+    def clear(self) -> None:
+        """Remove every row"""
+        self.set_rows([])
+
+    def get_item(self, key: Hashable) -> Any:
+        """Get the item of the row with the given key
+
+        Raises:
+            KeyError: If there is no such row
+        """
+        return self._items[key]
+
+    def scroll_to(self, first: int) -> None:
+        """Move the window so that it starts at the given row"""
+        self._first = first
+        self._render()
+
+    def see(self, key: Hashable) -> None:
+        """Scroll the row with the given key into the window and select it"""
+        index = self._keys.index(key)
+        visible = max(1, self.page_size - OVERSCAN_ROWS)
+        if not self._first <= index < self._first + visible:
+            self.scroll_to(index - visible // 2)
+        self.tree.selection_set(item_id(key))
+
+    def yview(self, *args: Any) -> None:
+        """Scroll as a Treeview's yview would; the command for the scrollbar"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * len(self._keys)))
+        elif args[0] == "scroll":
+            count = int(args[1])
+            step = max(1, self.page_size - OVERSCAN_ROWS) if args[2] == "pages" else 1
+            self._scroll_rows(count * step)
+
+    def _scroll_rows(self, count: int) -> str:
+        self.scroll_to(self._first + count)
+        return "break"
+
+    def _on_mouse_wheel(self, event: Any) -> str:
+        return self._scroll_rows(-WHEEL_ROWS if event.delta > 0 else WHEEL_ROWS)
+
+    def _on_configure(self, event: Any) -> None:
+        page_size = max(1, event.height // self.row_height) + OVERSCAN_ROWS
+        if page_size != self.page_size:
+            self.page_size = page_size
+            self._render()
+
+    def _render(self) -> None:
+        """Make the tree show exactly the rows of the current window"""
+        total = len(self._keys)
+        visible = max(1, self.page_size - OVERSCAN_ROWS)
+        self._first = max(0, min(self._first, total - visible))
+        window = self._keys[self._first:self._first + self.page_size]
+        window_set = set(window)
+        tree = self.tree
+
+        stale = [key for key in self._shown if key not in window_set]
+        if stale:
+            tree.delete(*[item_id(key) for key in stale])
+            for key in stale:
+                del self._shown_values[key]
+        kept = [key for key in self._shown if key in window_set]
+        # Rows that stay are only moved if the new rows put them in a different order
+        reorder = kept != [key for key in window if key in self._shown_values]
+
+        for index, key in enumerate(window):
+            values = self.format_row(self._items[key])
+            shown = self._shown_values.get(key)
+            if shown is None:
+                tree.insert("", index, iid=item_id(key), values=values)
+            else:
+                if reorder:
+                    tree.move(item_id(key), "", index)
+                if shown != values:
+                    tree.item(item_id(key), values=values)
+            self._shown_values[key] = values
+        self._shown = window
+
+        if self.scrollbar is not None:
+            if total:
+                self.scrollbar.set(self._first / total, min(1.0, (self._first + visible) / total))
+            else:
+                self.scrollbar.set(0.0, 1.0)